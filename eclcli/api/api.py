@@ -14,6 +14,7 @@
 """Base API Library"""
 
 import simplejson as json
+from six.moves.urllib import parse as urlparse
 
 from keystoneauth1 import exceptions as ks_exceptions
 from keystoneauth1 import session as ks_session
@@ -201,6 +202,45 @@ class BaseAPI(KeystoneSession):
         except json.JSONDecodeError:
             return ret
 
+    def list_pages(
+        self,
+        path,
+        session=None,
+        page_size=None,
+        next_field='next',
+        **params
+    ):
+        """Yield each page of a marker-paginated list
+
+        GET ${ENDPOINT}/${PATH}?${PARAMS}, then follow the link found in
+        the ``next_field`` of each response until there is none.  Only the
+        query string of the link is used so the request always goes to the
+        configured endpoint.
+
+        :param string path:
+            The API-specific portion of the URL path
+        :param Session session:
+            HTTP client session
+        :param int page_size:
+            Sent as the ``limit`` of every request if given
+        :param string next_field:
+            Response field holding the link to the next page
+        :returns:
+            Generator of JSON-decoded responses
+        """
+
+        if page_size:
+            params['limit'] = page_size
+        while True:
+            page = self.list(path, session=session, **params)
+            yield page
+            next_link = None
+            if isinstance(page, dict):
+                next_link = page.get(next_field)
+            if not next_link:
+                break
+            params = urlparse.parse_qs(urlparse.urlparse(next_link).query)
+
     # Layered actions built on top of the basic action methods do not
     # explicitly take a Session but one may still be passed in kwargs
 
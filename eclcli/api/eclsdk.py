@@ -1,15 +1,22 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from ecl import connection
 
 
 LOG = logging.getLogger(__name__)
 
 
 class ConnectionManager(object):
+    """Lazily open an eclsdk Connection
 
-    def __init__(self, cli_options=None, verify=True):
+    When a ClientManager is given the connection reuses its auth plugin
+    and the connection pool of its session, so commands authenticate
+    only once whichever client stack they use.
+    """
+
+    def __init__(self, cli_options=None, verify=True, client_manager=None):
+        self._cli_options = cli_options
+        self._client_manager = client_manager
         self._verify = verify
         self._cacert = None
         if isinstance(verify, bool):
@@ -17,7 +24,52 @@ class ConnectionManager(object):
         else:
             self._cacert = verify
             self._insecure = False
-        self.conn = connection.Connection(
+        self._conn = None
+
+        root_logger = logging.getLogger('')
+        LOG.setLevel(root_logger.getEffectiveLevel())
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            if self._client_manager is not None:
+                self._conn = self._make_shared_connection()
+            else:
+                self._conn = self._make_connection()
+        return self._conn
+
+    def _make_shared_connection(self):
+        # Defer eclsdk import until we actually need it
+        from ecl import connection
+        from ecl import profile
+        from ecl import session
+
+        client_manager = self._client_manager
+        # Trigger authentication (or a token cache lookup) once, through
+        # the ClientManager, so both stacks share the same token.
+        client_manager.auth_ref
+        LOG.debug('Opening eclsdk connection with shared session')
+
+        prof = profile.Profile()
+        sess = session.Session(
+            prof,
+            auth=client_manager.auth,
+            session=client_manager.session.session,
+            verify=self._verify,
+            user_agent=client_manager.session.user_agent,
+        )
+        return connection.Connection(
+            session=sess,
+            authenticator=client_manager.auth,
+            profile=prof,
+        )
+
+    def _make_connection(self):
+        from ecl import connection
+
+        cli_options = self._cli_options
+        LOG.debug('Opening eclsdk connection')
+        return connection.Connection(
             verify=self._verify,
             cert=self._cacert,
             auth_url=cli_options.auth.get("auth_url"),
@@ -26,6 +78,3 @@ class ConnectionManager(object):
             password=cli_options.auth.get("password"),
             user_domain_id="default",
             project_domain_id="default")
-
-        root_logger = logging.getLogger('')
-        LOG.setLevel(root_logger.getEffectiveLevel())
@@ -14,6 +14,20 @@
 """Image v2 API Library"""
 
 from eclcli.api import image_v1
+from eclcli.common import pagination
+
+
+# Keys the v2 API can sort by, with sort_key/sort_dir
+SORT_KEYS = (
+    'container_format',
+    'created_at',
+    'disk_format',
+    'id',
+    'name',
+    'size',
+    'status',
+    'updated_at',
+)
 
 
 class APIv2(image_v1.APIv1):
@@ -36,7 +50,8 @@ class APIv2(image_v1.APIv1):
     ):
         """Get available images
 
-        can add limit/marker
+        can add limit/marker; limit is the maximum number of images
+        returned, all pages are read until it is reached
 
         :param detailed:
             For v1 compatibility only, ignored as v2 is always 'detailed'
@@ -56,6 +71,36 @@ class APIv2(image_v1.APIv1):
         http://docs.openstack.org/api/openstack-image-service/2.0/content/list-images.html
         """
 
+        limit = filter.pop('limit', None)
+        return list(pagination.limit_items(
+            self.image_iter(
+                detailed=detailed,
+                public=public,
+                private=private,
+                shared=shared,
+                page_size=limit,
+                **filter
+            ),
+            limit,
+        ))
+
+    def image_iter(
+        self,
+        detailed=False,
+        public=False,
+        private=False,
+        shared=False,
+        page_size=None,
+        **filter
+    ):
+        """Yield available images, one page at a time
+
+        Takes the same arguments as image_list() plus:
+
+        :param page_size:
+            Number of images requested per page, None for the server default
+        """
+
         if not public and not private and not shared:
             # No filtering for all False
             filter.pop('visibility', None)
@@ -71,4 +116,6 @@ class APIv2(image_v1.APIv1):
             # Because we can't all use /details
             url += "/detail"
 
-        return self.list(url, **filter)['images']
+        for page in self.list_pages(url, page_size=page_size, **filter):
+            for image in page['images']:
+                yield image
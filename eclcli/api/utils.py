@@ -53,32 +53,49 @@ def simple_filter(
     if not data or not attr or value is None:
         return data
 
-    # NOTE:(dtroyer): This filter modifies the provided list in-place using
-    # list.remove() so we need to start at the end so the loop pointer does
-    # not skip any items after a deletion.
-    for d in reversed(data):
-        if attr in d:
-            # Searching data fields
-            search_value = d[attr]
-        elif (property_field and property_field in d and
-                isinstance(d[property_field], dict)):
-            # Searching a properties field - do this separately because
-            # we don't want to fail over to checking the fields if a
-            # property name is given.
-            if attr in d[property_field]:
-                search_value = d[property_field][attr]
-            else:
-                search_value = None
+    # NOTE: filter in one pass and update the list in-place, removing
+    #       items one by one is quadratic on large lists
+    data[:] = [d for d in data if _matches(d, attr, value, property_field)]
+    return data
+
+
+def filter_items(
+    data=None,
+    attr=None,
+    value=None,
+    property_field=None,
+):
+    """Filter an iterable of dicts lazily
+
+    Same matching rules as simple_filter() but items are yielded as they
+    are read, so data may be a generator over paginated results.
+    """
+
+    if not attr or value is None:
+        for d in data or []:
+            yield d
+        return
+
+    for d in data or []:
+        if _matches(d, attr, value, property_field):
+            yield d
+
+
+def _matches(d, attr, value, property_field):
+    if attr in d:
+        # Searching data fields
+        search_value = d[attr]
+    elif (property_field and property_field in d and
+            isinstance(d[property_field], dict)):
+        # Searching a properties field - do this separately because
+        # we don't want to fail over to checking the fields if a
+        # property name is given.
+        if attr in d[property_field]:
+            search_value = d[property_field][attr]
         else:
             search_value = None
+    else:
+        search_value = None
 
-        # could do regex here someday...
-        if not search_value or search_value != value:
-            # remove from list
-            try:
-                data.remove(d)
-            except ValueError:
-                # it's already gone!
-                pass
-
-    return data
+    # could do regex here someday...
+    return bool(search_value) and search_value == value
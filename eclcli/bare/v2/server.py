@@ -1,7 +1,7 @@
 import six
 import sys
 
-from eclcli.common import command, exceptions, utils
+from eclcli.common import command, exceptions, parallel, utils
 from eclcli.i18n import _  # noqa
 from eclcli.bare import bare_utils
 
@@ -491,21 +491,32 @@ class CreateServer(command.ShowOne):
 
 
 class DeleteServer(command.ShowOne):
-    """Delete a baremetal server"""
+    """Delete baremetal server(s)"""
 
     def get_parser(self, prog_name):
         parser = super(DeleteServer, self).get_parser(prog_name)
         parser.add_argument(
             "server",
             metavar="<server>",
-            help="Name or ID of server",
+            nargs="+",
+            help="Name(s) or ID(s) of server",
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         bare_client = self.app.client_manager.bare
-        server_obj = utils.find_resource(bare_client.servers, parsed_args.server)
-        bare_client.servers.delete(server_obj.id)
+
+        def _delete(server):
+            server_obj = utils.find_resource(bare_client.servers, server)
+            bare_client.servers.delete(server_obj.id)
+
+        parallel.run_each(
+            _delete,
+            parsed_args.server,
+            parallel=parsed_args.parallel,
+            action='delete server',
+            log=self.log,
+        )
         return {}, {}
 
 
@@ -0,0 +1,157 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Batch action implementation"""
+
+import json
+import shlex
+import sys
+import time
+
+import six
+
+from eclcli.common import command
+from eclcli.common import exceptions
+
+
+def parse_line(line):
+    """Return the argv of one batch input line, or None to skip it
+
+    A line is either a JSON list of arguments, a JSON object with an
+    "argv" list, or a shell-quoted command line. Blank lines and lines
+    starting with '#' are ignored.
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if line[0] in '[{':
+        data = json.loads(line)
+        if isinstance(data, dict):
+            data = data.get('argv')
+        if not isinstance(data, list):
+            raise ValueError('expected a list of arguments')
+        return [six.text_type(a) for a in data]
+    return shlex.split(line)
+
+
+class RunBatch(command.Command):
+    """Run many commands with a single authenticated session
+
+    Commands are read one per line from a file or stdin and one JSON
+    result per line is written with the exit status and timing of each.
+    """
+
+    auth_required = False
+
+    def get_parser(self, prog_name):
+        parser = super(RunBatch, self).get_parser(prog_name)
+        parser.add_argument(
+            'file',
+            metavar='<file>',
+            nargs='?',
+            default='-',
+            help='File of commands, one per line as shell words or a JSON '
+                 'list of arguments (default: stdin)',
+        )
+        parser.add_argument(
+            '--stop-on-error',
+            action='store_true',
+            default=False,
+            help='Stop at the first command that fails',
+        )
+        parser.add_argument(
+            '--no-capture',
+            dest='capture',
+            action='store_false',
+            default=True,
+            help='Write command output directly instead of including it '
+                 'in the results',
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        # Every request of a line is counted from the shared transport,
+        # eclsdk ones included, which the keystoneauth session misses
+        self._count_requests = self.app.client_manager.record_http_timings()
+        if parsed_args.file == '-':
+            return self._run_lines(sys.stdin, parsed_args)
+        try:
+            with open(parsed_args.file) as f:
+                return self._run_lines(f, parsed_args)
+        except IOError as e:
+            msg = "Error reading batch file %s: %s"
+            raise exceptions.CommandError(msg % (parsed_args.file, e))
+
+    def _run_lines(self, lines, parsed_args):
+        failed = 0
+        for lineno, line in enumerate(lines, 1):
+            try:
+                argv = parse_line(line)
+            except ValueError as e:
+                self._write_result({
+                    'line': lineno,
+                    'argv': None,
+                    'exit_status': 2,
+                    'error': 'Invalid command line: %s' % e,
+                })
+                failed += 1
+                if parsed_args.stop_on_error:
+                    break
+                continue
+            if argv is None:
+                continue
+
+            result = self._run_one(argv, parsed_args.capture)
+            result['line'] = lineno
+            self._write_result(result)
+            if result['exit_status']:
+                failed += 1
+                if parsed_args.stop_on_error:
+                    break
+        return 1 if failed else 0
+
+    def _run_one(self, argv, capture):
+        result = {'argv': argv}
+        if argv and argv[0] == 'batch':
+            result['exit_status'] = 2
+            result['error'] = 'Batches cannot be nested'
+            return result
+
+        app = self.app
+        app.timing_data = []
+        stdout = app.stdout
+        if capture:
+            app.stdout = six.StringIO()
+        start = time.time()
+        try:
+            status = app.run_subcommand(argv)
+        except SystemExit as e:
+            # argparse exits on usage errors
+            status = e.code if isinstance(e.code, int) else 2
+        except Exception as e:
+            status = 1
+            result['error'] = six.text_type(e)
+        finally:
+            result['seconds'] = round(time.time() - start, 6)
+            if capture:
+                result['output'] = app.stdout.getvalue()
+                app.stdout = stdout
+
+        if self._count_requests:
+            result['requests'] = len(app.timing_data)
+        result['exit_status'] = status or 0
+        return result
+
+    def _write_result(self, result):
+        self.app.stdout.write(json.dumps(result, sort_keys=True) + '\n')
+        self.app.stdout.flush()
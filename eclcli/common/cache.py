@@ -0,0 +1,113 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Small on-disk caches kept in the user cache directory"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+
+def write_json(path, data, compact=False):
+    """Atomically write data as JSON, readable by the owner only
+
+    mkstemp() creates the file with 0600 and rename() within the same
+    directory never exposes a partially written file to readers.
+    """
+    cache_dir = os.path.dirname(path)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, 0o700)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            if compact:
+                json.dump(data, f, separators=(',', ':'))
+            else:
+                json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class TTLCache(object):
+    """A JSON file of string keys to values that expire after ttl seconds
+
+    The file is read on first access and rewritten on every change; a
+    concurrent writer may win, which only costs a cache miss. Within the
+    process the cache may be shared by the threads of parallel.run_each.
+    """
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self._data = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._data is None:
+            try:
+                with open(self.path) as f:
+                    self._data = json.load(f)
+                if not isinstance(self._data, dict):
+                    self._data = {}
+            except (IOError, OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self):
+        try:
+            write_json(self.path, self._data, compact=True)
+        except (IOError, OSError) as e:
+            LOG.debug('Unable to write cache %s: %s', self.path, e)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry or entry[0] + self.ttl < time.time():
+            return default
+        return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            data = self._load()
+            now = time.time()
+            # Drop expired entries while rewriting the file anyway
+            for k in [k for k, e in data.items() if e[0] + self.ttl < now]:
+                del data[k]
+            data[key] = [now, value]
+            self._save()
+
+    def update(self, values):
+        with self._lock:
+            data = self._load()
+            now = time.time()
+            for key, value in values.items():
+                data[key] = [now, value]
+            self._save()
+
+    def delete(self, key):
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._save()
@@ -15,22 +15,27 @@
 
 """Manage access to the clients, including authenticating when needed."""
 
+import argparse
 import copy
 import logging
-import pkg_resources
 import sys
 
 from oslo_utils import strutils
-import requests
 
 from eclcli.api import auth
 from eclcli.common import session as osc_session
-from eclcli.identity import client as identity_client
+from eclcli.common import utils
 
 
 LOG = logging.getLogger(__name__)
 
-PLUGIN_MODULES = []
+# Entry point groups of the base and external plugins
+PLUGIN_GROUPS = ('ecl.cli.base', 'ecl.cli.extension')
+
+# Plugin descriptions, see get_plugins()
+_PLUGINS = None
+# Plugin modules imported so far, by module name
+_LOADED_PLUGINS = {}
 
 USER_AGENT = 'eclcli'
 
@@ -40,13 +45,35 @@ class ClientCache(object):
 
     def __init__(self, factory):
         self.factory = factory
-        self._handle = None
 
     def __get__(self, instance, owner):
-        # Tell the ClientManager to login to keystone
-        if self._handle is None:
-            self._handle = self.factory(instance)
-        return self._handle
+        if instance is None:
+            return self
+        # The descriptor belongs to the class, keep the handles on each
+        # ClientManager so one never gets the endpoints of another
+        handles = instance.__dict__.setdefault('_client_handles', {})
+        if self not in handles:
+            # Tell the ClientManager to login to keystone
+            handles[self] = self.factory(instance)
+        return handles[self]
+
+
+class PluginClientCache(ClientCache):
+    """ClientCache of a plugin whose module is imported on first use"""
+
+    def __init__(self, module_name):
+        super(PluginClientCache, self).__init__(self._make_client)
+        self.module_name = module_name
+
+    def _make_client(self, instance):
+        module = load_plugin_module(self.module_name)
+        # Let the module validate the version requested by the user; this
+        # throws an exception if invalid
+        check_api_version = getattr(module, 'check_api_version', None)
+        version = (instance._api_version or {}).get(module.API_NAME)
+        if check_api_version and version:
+            check_api_version(version)
+        return module.make_client(instance)
 
 
 class ClientManager(object):
@@ -55,7 +82,7 @@ class ClientManager(object):
     # A simple incrementing version for the plugin to know what is available
     PLUGIN_INTERFACE_VERSION = "2"
 
-    identity = ClientCache(identity_client.make_client)
+    identity = PluginClientCache('eclcli.identity.client')
 
     def __getattr__(self, name):
         # this is for the auth-related parameters.
@@ -71,6 +98,7 @@ class ClientManager(object):
         api_version=None,
         verify=True,
         pw_func=None,
+        token_cache=None,
     ):
         """Set up a ClientManager
 
@@ -86,19 +114,29 @@ class ClientManager(object):
             Callback function for asking the user for a password.  The function
             takes an optional string for the prompt ('Password: ' on None) and
             returns a string containing the password
+        :param token_cache:
+            A token_cache.TokenCache used to reuse tokens and service catalogs
+            across invocations, or None to always authenticate
         """
 
         self._cli_options = cli_options
         self._api_version = api_version
         self._pw_callback = pw_func
+        self._token_cache = token_cache
         self._url = self._cli_options.auth.get('url')
         self._region_name = self._cli_options.region_name
         self._interface = self._cli_options.interface
 
         self.timing = self._cli_options.timing
+        # Every HTTP request of the clients is recorded for --timing and
+        # --timing-file
+        self.http_timings = None
+        if self.timing or self._cli_options.timing_file:
+            self.http_timings = osc_session.HTTPTimings()
 
         self._auth_ref = None
         self.session = None
+        self.http_session = None
 
         # verify is the Requests-compatible form
         self._verify = verify
@@ -189,11 +227,13 @@ class ClientManager(object):
         LOG.debug('Using parameters %s',
                   strutils.mask_password(self._auth_params))
         self.auth = auth_plugin.load_from_options(**self._auth_params)
-        # needed by SAML authentication
-        request_session = requests.session()
+        # needed by SAML authentication, and shared by all the clients
+        # and the eclsdk connection for connection reuse
+        self.http_session = osc_session.make_http_session(
+            timings=self.http_timings)
         self.session = osc_session.TimingSession(
             auth=self.auth,
-            session=request_session,
+            session=self.http_session,
             verify=self._verify,
             user_agent=USER_AGENT,
         )
@@ -207,10 +247,55 @@ class ClientManager(object):
         """Dereference will trigger an auth if it hasn't already"""
         if not self._auth_ref:
             self.setup_auth()
-            LOG.debug("Get auth_ref")
-            self._auth_ref = self.auth.get_auth_ref(self.session)
+            if self._token_cache and hasattr(self.auth, 'auth_ref'):
+                self._auth_ref = self._token_cache.load(self._auth_params)
+            if not self._auth_ref:
+                LOG.debug("Get auth_ref")
+                self._auth_ref = self.auth.get_auth_ref(self.session)
+                if self._token_cache and hasattr(self.auth, 'auth_ref'):
+                    self._token_cache.store(self._auth_params, self._auth_ref)
+            # NOTE: hand the token to the plugin as well so the session
+            #       does not authenticate a second time for the first request
+            if hasattr(self.auth, 'auth_ref'):
+                self.auth.auth_ref = self._auth_ref
         return self._auth_ref
 
+    def record_http_timings(self):
+        """Time every HTTP request from now on, into http_timings
+
+        Only requests of a session set up afterwards are seen.
+        """
+        if self.http_timings is None:
+            self.http_timings = osc_session.HTTPTimings()
+        return self.http_session is None
+
+    def update_token_cache(self):
+        """Save the token if the plugin had to re-authenticate
+
+        A cached token may have been revoked, in which case the session
+        invalidates it on the 401 and the plugin fetches a new one.
+        """
+        if not (self._token_cache and self._auth_ref):
+            return
+        auth_ref = getattr(self.auth, 'auth_ref', None)
+        if auth_ref is None:
+            self._token_cache.invalidate(self._auth_params)
+        elif auth_ref is not self._auth_ref:
+            self._auth_ref = auth_ref
+            self._token_cache.store(self._auth_params, auth_ref)
+
+    @property
+    def cache_scope(self):
+        """Identify the cloud, region and project of the cached data
+
+        Triggers authentication to learn the project ID.
+        """
+        return '%s|%s|%s' % (
+            self._cli_options.auth.get('auth_url'),
+            self._region_name,
+            getattr(self.auth_ref, 'project_id', None),
+        )
+
     def is_network_endpoint_enabled(self):
         """Check if the network endpoint is enabled"""
         # Trigger authentication necessary to determine if the network
@@ -256,44 +341,114 @@ class ClientManager(object):
 
 # Plugin Support
 
-def get_plugin_modules(group):
-    """Find plugin entry points"""
-    mod_list = []
-    for ep in pkg_resources.iter_entry_points(group):
-        LOG.debug('Found plugin %r', ep.name)
-
-        __import__(ep.module_name)
-        module = sys.modules[ep.module_name]
-        mod_list.append(module)
+def load_plugin_module(module_name):
+    """Import and initialize a plugin module, once"""
+    module = _LOADED_PLUGINS.get(module_name)
+    if module is None:
+        __import__(module_name)
+        module = sys.modules[module_name]
         init_func = getattr(module, 'Initialize', None)
         if init_func:
             init_func('x')
+        _LOADED_PLUGINS[module_name] = module
+    return module
+
+
+def describe_plugin(module_name):
+    """Return what the shell needs to know of a plugin before using it
+
+    The descriptions are kept in the command index so that the plugin
+    module is only imported when ClientManager.<API_NAME> is first used.
+    """
+    module = load_plugin_module(module_name)
+    parser = argparse.ArgumentParser(add_help=False)
+    module.build_option_parser(parser)
+    return {
+        'module': module_name,
+        'api_name': module.API_NAME,
+        'version_option': module.API_VERSION_OPTION,
+        'default_version': getattr(module, 'DEFAULT_API_VERSION', None),
+        'versions': sorted(getattr(module, 'API_VERSIONS', None) or ()),
+        'check_version': hasattr(module, 'check_api_version'),
+        # Only plugins adding global options are imported for the parser
+        'options': bool(parser._actions),
+    }
+
+
+def describe_plugins():
+    """Describe the plugins found in the installed metadata"""
+    return [
+        describe_plugin(ep.value.split(':')[0].strip())
+        for group in PLUGIN_GROUPS
+        for ep in utils.get_entry_points(group)
+    ]
+
+
+def get_plugins(index=None):
+    """Return the descriptions of the base and external plugins
+
+    They come from the command index when there is one, and otherwise
+    from the installed metadata, importing every plugin. Each plugin is
+    added to the ClientManager without importing its module.
+    """
+    global _PLUGINS
+
+    if _PLUGINS is None:
+        plugins = index.get_plugins() if index is not None else None
+        if plugins is None:
+            plugins = describe_plugins()
+        for plugin in plugins:
+            LOG.debug('Found plugin %r', plugin['api_name'])
+            setattr(
+                ClientManager,
+                plugin['api_name'],
+                PluginClientCache(plugin['module']),
+            )
+        _PLUGINS = plugins
+    return _PLUGINS
+
+
+def get_plugin_modules(group):
+    """Import the plugin modules of an entry point group"""
+    mod_list = []
+    for ep in utils.get_entry_points(group):
+        module = load_plugin_module(ep.value.split(':')[0].strip())
+        mod_list.append(module)
 
         # Add the plugin to the ClientManager
         setattr(
             ClientManager,
             module.API_NAME,
-            ClientCache(
-                getattr(sys.modules[ep.module_name], 'make_client', None)
-            ),
+            PluginClientCache(module.__name__),
         )
     return mod_list
 
 
-def build_plugin_option_parser(parser):
-    """Add plugin options to the parser"""
+def get_all_plugin_modules():
+    """Import and return the base and external plugin modules
+
+    The shell works from get_plugins() instead, this is kept for external
+    plugins that need the modules themselves.
+    """
+    mod_list = []
+    for group in PLUGIN_GROUPS:
+        mod_list.extend(get_plugin_modules(group))
+    return mod_list
 
-    # Loop through extensions to get parser additions
-    for mod in PLUGIN_MODULES:
-        parser = mod.build_option_parser(parser)
-    return parser
 
+def __getattr__(name):
+    # Keep PLUGIN_MODULES available to external plugins, loading it lazily
+    if name == 'PLUGIN_MODULES':
+        return get_all_plugin_modules()
+    raise AttributeError(name)
 
-# Get list of base plugin modules
-PLUGIN_MODULES = get_plugin_modules(
-    'ecl.cli.base',
-)
-# Append list of external plugin modules
-PLUGIN_MODULES.extend(get_plugin_modules(
-    'ecl.cli.extension',
-))
+
+def build_plugin_option_parser(parser, index=None):
+    """Add plugin options to the parser"""
+
+    # Loop through the plugins adding global options to get parser additions
+    for plugin in get_plugins(index):
+        if plugin['options']:
+            mod = load_plugin_module(plugin['module'])
+            parser = mod.build_option_parser(parser)
+    return parser
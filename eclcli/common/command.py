@@ -20,6 +20,8 @@ from cliff import lister
 from cliff import show
 import six
 
+from eclcli.common import utils
+
 
 class CommandMeta(abc.ABCMeta):
 
@@ -39,7 +41,13 @@ class Command(command.Command):
 
 
 class Lister(Command, lister.Lister):
-    pass
+
+    def produce_output(self, parsed_args, column_names, data):
+        # Rows are built from list responses, do not fetch every resource
+        # again for a column the list leaves out
+        with utils.lazy_loading(False):
+            return super(Lister, self).produce_output(
+                parsed_args, column_names, data)
 
 
 class ShowOne(Command, show.ShowOne):
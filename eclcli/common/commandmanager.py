@@ -15,10 +15,150 @@
 
 """Modify cliff.CommandManager"""
 
-import pkg_resources
+import hashlib
+import json
+import logging
+import os
+import tempfile
 
 import cliff.commandmanager
 
+from eclcli.common import clientmanager
+from eclcli.common import utils
+
+
+LOG = logging.getLogger(__name__)
+
+# Only entry point groups with this prefix are kept in the command index
+INDEX_GROUP_PREFIX = 'ecl.'
+
+
+class CommandIndex(object):
+    """Map entry point groups to {command word: 'module:Class'}
+
+    The index is stored as compact JSON so resolving a command does not
+    require scanning the metadata of every installed distribution. It
+    also keeps the plugin descriptions of clientmanager.describe_plugin(),
+    so plugin modules are not imported to set up the shell. It is stamped
+    with the installed eclcli and the other distributions providing ecl.*
+    entry points, and rebuilt when they change.
+    """
+
+    def __init__(self, path, dist_name='eclcli'):
+        self.path = path
+        self.dist_name = dist_name
+        self.groups = None
+        self.plugins = None
+        # Other distributions providing entry points of the index
+        self.distributions = []
+        # True once the groups reflect the installed metadata of this run
+        self.fresh = False
+
+    def get_stamp(self, distributions=()):
+        """Return the stamp of the installed eclcli and distributions
+
+        The stamp changes with the version and entry points of eclcli,
+        with the version of each of the distributions, when one of them
+        is removed, and when anything is installed or removed next to
+        eclcli, which is where new plugins usually go.
+        """
+        metadata = utils.importlib_metadata
+        try:
+            dist = metadata.distribution(self.dist_name)
+        except metadata.PackageNotFoundError:
+            return None
+        entry_points = dist.read_text('entry_points.txt') or ''
+        stamp = ['%s:%s' % (
+            dist.version,
+            hashlib.md5(entry_points.encode('utf-8')).hexdigest())]
+        try:
+            stamp.append(repr(os.path.getmtime(str(dist.locate_file('')))))
+        except (IOError, OSError):
+            pass
+        for name in distributions:
+            try:
+                stamp.append('%s=%s' % (name, metadata.version(name)))
+            except metadata.PackageNotFoundError:
+                stamp.append('%s=' % name)
+        return ' '.join(stamp)
+
+    def load(self):
+        """Read the index file, rebuilding it when missing or outdated"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        stamp = self.get_stamp(data.get('distributions') or ())
+        if stamp is None:
+            # Not installed, e.g. running from a source tree
+            return None
+        if data.get('stamp') == stamp:
+            try:
+                self.groups = data['groups']
+                self.plugins = data['plugins']
+                self.distributions = data['distributions']
+                return self.groups
+            except KeyError:
+                pass
+        return self.rebuild()
+
+    def rebuild(self):
+        """Build the index from the installed metadata and save it"""
+        self.groups = dict(
+            (group, dict((ep.name, ep.value) for ep in eps))
+            for group, eps in utils.get_all_entry_points().items()
+            if group.startswith(INDEX_GROUP_PREFIX)
+        )
+        # Imports every plugin module, once per index
+        self.plugins = clientmanager.describe_plugins()
+        self.distributions = sorted(
+            name for name in
+            utils.get_entry_point_distributions(INDEX_GROUP_PREFIX)
+            if name != self.dist_name)
+        self.fresh = True
+        stamp = self.get_stamp(self.distributions)
+        if stamp is not None:
+            try:
+                self._save({'stamp': stamp, 'groups': self.groups,
+                            'plugins': self.plugins,
+                            'distributions': self.distributions})
+            except (IOError, OSError) as e:
+                LOG.debug('Unable to write command index %s: %s',
+                          self.path, e)
+        return self.groups
+
+    def _save(self, data):
+        index_dir = os.path.dirname(self.path)
+        if not os.path.isdir(index_dir):
+            os.makedirs(index_dir)
+        fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.rename(tmp_path, self.path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        LOG.debug('Saved command index %s', self.path)
+
+    def get_plugins(self):
+        """Return the plugin descriptions, or None without an index"""
+        if self.groups is None and self.load() is None:
+            return None
+        return self.plugins
+
+    def get_entry_points(self, group):
+        """Return the entry points of group, or None without an index"""
+        if self.groups is None and self.load() is None:
+            return None
+        return [
+            utils.importlib_metadata.EntryPoint(name, value, group)
+            for name, value in sorted(self.groups.get(group, {}).items())
+        ]
+
 
 class CommandManager(cliff.commandmanager.CommandManager):
     """Add additional functionality to cliff.CommandManager
@@ -27,13 +167,56 @@ class CommandManager(cliff.commandmanager.CommandManager):
     Add _command_group() methods
     """
 
-    def __init__(self, namespace, convert_underscores=True):
+    def __init__(self, namespace, convert_underscores=True, index_file=None):
         self.group_list = []
+        self.index = CommandIndex(index_file) if index_file else None
         super(CommandManager, self).__init__(namespace, convert_underscores)
 
+    def _get_entry_points(self, namespace):
+        if self.index is not None:
+            eps = self.index.get_entry_points(namespace)
+            if eps is not None:
+                return eps
+        return utils.get_entry_points(namespace)
+
+    def _register_commands(self, namespace):
+        for ep in self._get_entry_points(namespace):
+            LOG.debug('found command %r', ep.name)
+            cmd_name = (ep.name.replace('_', ' ')
+                        if self.convert_underscores
+                        else ep.name)
+            self.commands[cmd_name] = ep
+
     def load_commands(self, namespace):
+        """Register the commands of an entrypoint group
+
+        Unlike cliff, which loads every plugin through stevedore, only the
+        entry points are registered here; find_command() imports the one
+        module holding the command that is actually run.
+        """
         self.group_list.append(namespace)
-        return super(CommandManager, self).load_commands(namespace)
+        self._register_commands(namespace)
+
+    def find_command(self, argv):
+        """Find a command, rescanning the installed metadata on a miss
+
+        A command index read from disk may not know about commands of a
+        plugin installed since it was written, or may point to a module
+        that has gone away.
+        """
+        try:
+            return super(CommandManager, self).find_command(argv)
+        except (ValueError, ImportError, AttributeError):
+            if self.index is None or self.index.fresh:
+                raise
+        LOG.debug('command index miss for %r, rescanning', argv)
+        self.index.rebuild()
+        for name, ep in list(self.commands.items()):
+            if isinstance(ep, utils.importlib_metadata.EntryPoint):
+                del self.commands[name]
+        for group in self.group_list:
+            self._register_commands(group)
+        return super(CommandManager, self).find_command(argv)
 
     def add_command_group(self, group=None):
         """Adds another group of command entrypoints"""
@@ -48,7 +231,7 @@ class CommandManager(cliff.commandmanager.CommandManager):
         """Returns a list of commands loaded for the specified group"""
         group_list = []
         if group is not None:
-            for ep in pkg_resources.iter_entry_points(group):
+            for ep in self._get_entry_points(group):
                 cmd_name = (
                     ep.name.replace('_', ' ')
                     if self.convert_underscores
@@ -0,0 +1,77 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Stream list results page by page"""
+
+import itertools
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise ValueError(text)
+    return value
+
+
+def add_pagination_options(parser):
+    parser.add_argument(
+        '--page-size',
+        metavar='<count>',
+        type=_positive_int,
+        default=None,
+        help='Number of items to request per page (default: server limit)',
+    )
+    parser.add_argument(
+        '--max-items',
+        metavar='<count>',
+        type=_positive_int,
+        default=None,
+        help='Stop after listing this many items',
+    )
+    return parser
+
+
+def limit_items(items, max_items=None):
+    """Return an iterator over at most max_items of items"""
+    if max_items is None:
+        return iter(items)
+    return itertools.islice(items, max_items)
+
+
+def iter_items(list_func, collection, page_size=None, max_items=None,
+               **params):
+    """Yield the items of a paginated network list call as pages arrive
+
+    ``list_func`` is one of the ``list_*`` methods of the network client,
+    called with ``retrieve_all=False`` so it returns a generator of pages
+    which follows the ``<collection>_links`` until the last page. No page
+    is requested past max_items.
+
+    :param list_func: client method, e.g. ``network_client.list_ports``
+    :param collection: key of the items in each page, e.g. 'ports'
+    :param page_size: number of items per request, None for the default
+    :param max_items: total number of items to return, None for all
+    :param params: filters passed to the API
+    """
+    limit = page_size
+    if max_items is not None:
+        limit = min(limit or max_items, max_items)
+    if limit is not None:
+        params['limit'] = limit
+
+    def _items():
+        for page in list_func(retrieve_all=False, **params):
+            for item in page.get(collection) or []:
+                yield item
+
+    return limit_items(_items(), max_items)
@@ -0,0 +1,195 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Run an action on many resources with a shared thread pool"""
+
+from concurrent import futures
+import logging
+import threading
+import time
+
+from eclcli.common import exceptions
+
+
+LOG = logging.getLogger(__name__)
+
+# Upper bound for --parallel, to stay polite with the APIs
+MAX_PARALLEL = 32
+# Concurrency of the lookups commands make on their own, e.g. to show
+# names next to the IDs of a list
+LOOKUP_PARALLEL = 8
+
+
+def add_parallel_option(parser):
+    parser.add_argument(
+        '--parallel',
+        metavar='<count>',
+        type=int,
+        default=1,
+        help='Number of resources to process concurrently '
+             '(default: 1, max: %d)' % MAX_PARALLEL,
+    )
+    return parser
+
+
+class RateLimiter(object):
+    """Space calls out to at most ``rate`` per second, across threads"""
+
+    def __init__(self, rate=None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Sleep until the next call is allowed"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def add_rate_option(parser):
+    parser.add_argument(
+        '--rate',
+        metavar='<requests>',
+        type=float,
+        default=None,
+        help='Send at most this many requests per second (default: no '
+             'limit)',
+    )
+    return parser
+
+
+def run_each(func, items, parallel=1, action='process', log=None,
+             rate=None):
+    """Call func(item) for every item and return the results in order
+
+    Up to ``parallel`` calls run at the same time. A failing item does not
+    stop the others: every error is logged once all items are done and a
+    CommandError is then raised so the command exits non-zero.
+
+    :param func: callable taking one item
+    :param items: the items, usually names or IDs from the command line
+    :param parallel: maximum number of concurrent calls
+    :param action: verb used in error messages, e.g. 'delete server'
+    :param log: logger for per-item errors, defaults to this module's
+    :param rate: maximum number of calls started per second, None for no
+        limit
+    """
+    items = list(items)
+    outcomes = run_each_outcomes(func, items, parallel=parallel, rate=rate)
+    failed = log_failures(items, outcomes, action, log)
+    if failed:
+        raise exceptions.CommandError(failure_message(failed, len(items),
+                                                      action))
+    return [result for result, _error in outcomes]
+
+
+def run_each_outcomes(func, items, parallel=1, rate=None):
+    """Like run_each(), but return a (result, error) pair for every item
+
+    error is the exception raised for the item, None if it succeeded.
+    Nothing is logged or raised, for commands that go on with the items
+    that succeeded.
+    """
+    items = list(items)
+    if rate:
+        limiter = RateLimiter(rate)
+        unlimited_func = func
+
+        def func(item):
+            limiter.wait()
+            return unlimited_func(item)
+
+    parallel = max(1, min(parallel or 1, MAX_PARALLEL, len(items) or 1))
+
+    outcomes = []
+    if parallel == 1:
+        for item in items:
+            try:
+                outcomes.append((func(item), None))
+            except Exception as e:
+                outcomes.append((None, e))
+    else:
+        with futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+            pending = [executor.submit(func, item) for item in items]
+            for future in pending:
+                try:
+                    outcomes.append((future.result(), None))
+                except Exception as e:
+                    outcomes.append((None, e))
+    return outcomes
+
+
+def log_failures(items, outcomes, action, log=None):
+    """Log the error of every failed item, return how many failed"""
+    log = log or LOG
+    failed = 0
+    for item, (_result, error) in zip(items, outcomes):
+        if error is not None:
+            failed += 1
+            log.error('Failed to %s %s: %s', action, item, error)
+    return failed
+
+
+def failure_message(failed, total, action):
+    return "%d of %d item(s) failed to %s." % (failed, total, action)
+
+
+def lookup_each(func, items, parallel=LOOKUP_PARALLEL, log=None):
+    """Return a dict of item to func(item) for the items that succeed
+
+    Meant for best-effort lookups such as resolving IDs to names: the
+    calls run concurrently and failures are only logged at debug level,
+    the item is then missing from the result. Duplicate items are looked
+    up once.
+    """
+    log = log or LOG
+    items = list(dict.fromkeys(items))
+    if not items:
+        return {}
+    parallel = max(1, min(parallel or 1, MAX_PARALLEL, len(items)))
+
+    def _lookup(item):
+        try:
+            return func(item)
+        except Exception as e:
+            log.debug('Lookup of %s failed: %s', item, e)
+            raise
+
+    results = {}
+    with futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+        pending = dict((executor.submit(_lookup, item), item)
+                       for item in items)
+        for future in futures.as_completed(pending):
+            if future.exception() is None:
+                results[pending[future]] = future.result()
+    return results
+
+
+def prefetch(func, *args, **kwargs):
+    """Start func(*args, **kwargs) in the background
+
+    Returns a Future; its result() waits for the call and raises what it
+    raised. Used to overlap independent API calls of a command.
+    """
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(func, *args, **kwargs)
+    finally:
+        # Let the thread exit once the call is done
+        executor.shutdown(wait=False)
@@ -13,7 +13,226 @@
 
 """Subclass of keystoneauth1.session"""
 
+import socket
+import threading
+import time
+
 from keystoneauth1 import session
+import requests
+from requests import adapters
+from urllib3 import connection
+from urllib3 import connectionpool
+from urllib3.util import retry
+
+from eclcli.common import parallel
+
+
+# Connections kept open per host; enough for the largest --parallel
+POOL_MAXSIZE = parallel.MAX_PARALLEL
+# Retries when a connection cannot be established.  Requests that reached
+# the server are never sent again, they may not be idempotent.
+CONNECT_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+
+# The timing record of the request being sent by the current thread
+_ACTIVE = threading.local()
+
+
+def _active_record():
+    return getattr(_ACTIVE, 'record', None)
+
+
+class _TimedConnectionMixin(object):
+    """Add the DNS and connect times of new connections to the record"""
+
+    def _new_conn(self):
+        record = _active_record()
+        if record is None:
+            return super(_TimedConnectionMixin, self)._new_conn()
+        start = time.time()
+        try:
+            addresses = []
+            for info in socket.getaddrinfo(self._dns_host, self.port, 0,
+                                           socket.SOCK_STREAM):
+                if info[4][0] not in addresses:
+                    addresses.append(info[4][0])
+        except socket.error:
+            # Let urllib3 fail with its own error
+            addresses = [self._dns_host]
+        resolved = time.time()
+        record['dns'] += resolved - start
+
+        # Connect to the resolved addresses in turn, as urllib3 does, so
+        # the name is not resolved a second time
+        host = self._dns_host
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    sock = super(_TimedConnectionMixin, self)._new_conn()
+                    break
+                except Exception:
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+            record['connect'] += time.time() - resolved
+        record['new_connection'] = True
+        return sock
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, connection.HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin,
+                            connection.HTTPSConnection):
+
+    def connect(self):
+        record = _active_record()
+        if record is None:
+            return super(_TimedHTTPSConnection, self).connect()
+        start = time.time()
+        before = record['dns'] + record['connect']
+        try:
+            super(_TimedHTTPSConnection, self).connect()
+        finally:
+            # What is not spent in _new_conn() is the TLS handshake
+            record['tls'] += (time.time() - start -
+                              (record['dns'] + record['connect'] - before))
+
+
+class _TimedHTTPConnectionPool(connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimingHTTPAdapter(adapters.HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        super(_TimingHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class HTTPTimings(object):
+    """Timing of the requests sent through a make_http_session() Session
+
+    Each record is a dict with the method, url, status, response bytes,
+    connect retries, whether a new connection was opened and the seconds
+    spent in each phase: dns, connect, tls, server (from the request
+    being sent to the response headers) and download, and their total.
+    Records are kept from all threads in the order requests complete.
+    """
+
+    def __init__(self):
+        self._records = []
+        self._lock = threading.Lock()
+
+    def start(self, method, url):
+        record = {
+            'time': time.time(),
+            'method': method,
+            'url': url,
+            'status': None,
+            'bytes': 0,
+            'retries': 0,
+            'new_connection': False,
+            'dns': 0.0,
+            'connect': 0.0,
+            'tls': 0.0,
+            'server': 0.0,
+            'download': 0.0,
+            'total': 0.0,
+        }
+        previous = _active_record()
+        _ACTIVE.record = record
+        return record, previous
+
+    def finish(self, record, previous):
+        _ACTIVE.record = previous
+        with self._lock:
+            self._records.append(record)
+
+    def pop(self):
+        """Return the records so far and forget them"""
+        with self._lock:
+            records, self._records = self._records, []
+        return records
+
+
+class _TimingHTTPSession(requests.Session):
+
+    def __init__(self, timings):
+        super(_TimingHTTPSession, self).__init__()
+        self.timings = timings
+
+    def send(self, request, **kwargs):
+        record, previous = self.timings.start(request.method, request.url)
+        start = time.time()
+        try:
+            resp = super(_TimingHTTPSession, self).send(request, **kwargs)
+        except Exception as e:
+            record['error'] = str(e)
+            record['total'] = time.time() - start
+            self.timings.finish(record, previous)
+            raise
+        record['total'] = time.time() - start
+
+        # requests reads the body after the headers unless streaming
+        headers = resp.elapsed.total_seconds()
+        record['server'] = max(0.0, headers - record['dns'] -
+                               record['connect'] - record['tls'])
+        if kwargs.get('stream'):
+            record['bytes'] = int(resp.headers.get('Content-Length') or 0)
+        else:
+            record['download'] = max(0.0, record['total'] - headers)
+            record['bytes'] = len(resp.content or b'')
+        record['status'] = resp.status_code
+        retries = getattr(resp.raw, 'retries', None)
+        record['retries'] = len(getattr(retries, 'history', None) or ())
+        self.timings.finish(record, previous)
+        return resp
+
+
+def make_http_session(timings=None):
+    """Return a requests Session with a keep-alive connection pool
+
+    Every client of a ClientManager sends its requests through this one
+    Session, so a command opens a single TCP/TLS connection per endpoint
+    (per concurrent request at most) however many calls it makes.
+
+    :param timings: an HTTPTimings to record every request into, None to
+        record nothing
+    """
+    adapter_class = adapters.HTTPAdapter
+    if timings is not None:
+        adapter_class = _TimingHTTPAdapter
+    http_adapter = adapter_class(
+        pool_connections=POOL_MAXSIZE,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry.Retry(
+            total=CONNECT_RETRIES,
+            connect=CONNECT_RETRIES,
+            read=0,
+            redirect=0,
+            status=0,
+            backoff_factor=RETRY_BACKOFF,
+        ),
+    )
+    if timings is not None:
+        http_session = _TimingHTTPSession(timings)
+    else:
+        http_session = requests.Session()
+    http_session.mount('https://', http_adapter)
+    http_session.mount('http://', http_adapter)
+    return http_session
 
 
 class TimingSession(session.Session):
@@ -13,28 +13,68 @@
 
 """Timing Implementation"""
 
+import json
+import os
+
 from eclcli.common import command
 
 
+# Phases of a request, in order, as recorded by session.HTTPTimings
+PHASES = ('dns', 'connect', 'tls', 'server', 'download')
+PHASE_HEADERS = ('DNS', 'Connect', 'TLS', 'Server', 'Download')
+
+
+def append_json_lines(path, records, **fields):
+    """Append one JSON object per request record to the file at path
+
+    ``fields`` are added to every line, e.g. the command name, to tell
+    the runs apart once many are aggregated. All lines are written with
+    a single append so concurrent runs do not interleave them.
+    """
+    lines = []
+    for record in records:
+        line = dict(record)
+        line.update(fields)
+        lines.append(json.dumps(line, sort_keys=True) + '\n')
+    if not lines:
+        return
+    fd = os.open(os.path.expanduser(path),
+                 os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, ''.join(lines).encode('utf-8'))
+    finally:
+        os.close(fd)
+
+
 class Timing(command.Lister):
     """Show timing data"""
 
     def take_action(self, parsed_args):
         column_headers = (
-            'URL',
-            'Seconds',
+            ('URL', 'Status') + PHASE_HEADERS +
+            ('Seconds', 'Bytes', 'Retries')
         )
 
         results = []
-        total = 0.0
-        for url, td in self.app.timing_data:
-            # NOTE(dtroyer): Take the long way here because total_seconds()
-            #                was added in py27.
-            sec = (td.microseconds + (td.seconds + td.days *
-                                      86400) * 1e6) / 1e6
-            total += sec
-            results.append((url, sec))
-        results.append(('Total', total))
+        totals = dict((p, 0.0) for p in PHASES + ('total',))
+        size = retries = 0
+        for record in self.app.timing_data:
+            for key in totals:
+                totals[key] += record[key]
+            size += record['bytes']
+            retries += record['retries']
+            results.append(
+                ('%s %s' % (record['method'], record['url']),
+                 record['status'] or record.get('error', '')) +
+                tuple(round(record[p], 3) for p in PHASES) +
+                (round(record['total'], 3), record['bytes'],
+                 record['retries'])
+            )
+        results.append(
+            ('Total', '') +
+            tuple(round(totals[p], 3) for p in PHASES) +
+            (round(totals['total'], 3), size, retries)
+        )
         return (
             column_headers,
             results,
@@ -0,0 +1,156 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""On-disk cache of Keystone tokens and service catalogs"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from keystoneclient import access
+from oslo_utils import timeutils
+
+from eclcli.common import command
+
+
+LOG = logging.getLogger(__name__)
+
+# Cached tokens are not reused when they expire within this many seconds
+STALE_DURATION = 300
+
+# Auth parameters that identify a token; the password is never part of it
+KEY_PARAMS = (
+    'auth_url',
+    'project_id',
+    'project_name',
+    'tenant_id',
+    'tenant_name',
+    'domain_id',
+    'domain_name',
+    'user_id',
+    'username',
+    'user_domain_id',
+    'user_domain_name',
+    'project_domain_id',
+    'project_domain_name',
+)
+
+
+class TokenCache(object):
+    """Store AccessInfo objects as JSON files in a private directory
+
+    One file is kept per set of credentials, named after a digest of the
+    auth_url, project, user and domain parameters.
+    """
+
+    def __init__(self, cache_dir, stale_duration=STALE_DURATION):
+        self.cache_dir = cache_dir
+        self.stale_duration = stale_duration
+
+    @staticmethod
+    def get_key(auth_params):
+        ident = [(p, auth_params.get(p)) for p in KEY_PARAMS
+                 if auth_params.get(p)]
+        return hashlib.sha256(
+            json.dumps(ident, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _path(self, auth_params):
+        return os.path.join(self.cache_dir,
+                            self.get_key(auth_params) + '.json')
+
+    def load(self, auth_params):
+        """Return a cached AccessInfo or None if missing or about to expire"""
+        path = self._path(auth_params)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            expires = timeutils.parse_isotime(data['expires_at'])
+            auth_ref = access.AccessInfo.factory(**data['auth_ref'])
+        except (IOError, OSError):
+            return None
+        except (ValueError, KeyError, TypeError, NotImplementedError) as e:
+            LOG.debug('Ignoring unreadable token cache %s: %s', path, e)
+            self._remove(path)
+            return None
+
+        soon = timeutils.utcnow(with_timezone=True) + datetime.timedelta(
+            seconds=self.stale_duration)
+        if expires <= soon:
+            LOG.debug('Cached token in %s is about to expire', path)
+            self._remove(path)
+            return None
+
+        LOG.debug('Using cached token from %s', path)
+        return auth_ref
+
+    def store(self, auth_params, auth_ref):
+        """Atomically write auth_ref with owner-only permissions"""
+        expires = getattr(auth_ref, 'expires', None)
+        if not expires:
+            return
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, 0o700)
+
+        data = {
+            'expires_at': expires.isoformat(),
+            'auth_ref': dict(auth_ref),
+        }
+        # mkstemp() creates the file with 0600, and rename() within the same
+        # directory never exposes a partially written file to readers.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.rename(tmp_path, self._path(auth_params))
+        except Exception:
+            self._remove(tmp_path)
+            raise
+        LOG.debug('Stored token in cache %s', self.cache_dir)
+
+    def invalidate(self, auth_params):
+        self._remove(self._path(auth_params))
+
+    def purge(self):
+        """Remove every cached token, return the number of files removed"""
+        count = 0
+        if not os.path.isdir(self.cache_dir):
+            return count
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json') or name.endswith('.tmp'):
+                self._remove(os.path.join(self.cache_dir, name))
+                count += 1
+        return count
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class PurgeTokenCache(command.Command):
+    """Remove all cached tokens and service catalogs"""
+
+    auth_required = False
+
+    def take_action(self, parsed_args):
+        cache = TokenCache(self.app.token_cache_dir)
+        count = cache.purge()
+        self.log.info('Removed %d cached token(s) from %s',
+                      count, cache.cache_dir)
@@ -1,10 +1,16 @@
+import contextlib
 import getpass
 import ipaddress
 import logging
 import os
 import re
 import six
-import time
+import threading
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    import importlib_metadata
 
 try:
     from oslo_utils import importutils
@@ -12,9 +18,109 @@ except ImportError:
     from oslo.utils import importutils
 
 from eclcli.common import exceptions
+from eclcli.common import waiter
+
+
+# Matches IDs that are worth a direct GET before any name search
+UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?'
+                     r'[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$')
+
+# Name to ID mappings resolved by find_resource() during the current command,
+# changed from the threads of parallel.run_each under _RESOURCE_LOCK
+_RESOURCE_MEMO = {}
+_RESOURCE_LOCK = threading.Lock()
+# Optional cache.TTLCache of name to ID mappings shared between invocations,
+# and the endpoint/project scope its keys are prefixed with
+_NAME_CACHE = None
+_NAME_CACHE_SCOPE = ''
+
+
+def configure_name_cache(path, ttl, scope):
+    """Keep the names resolved by find_resource() for ttl seconds
+
+    :param path: cache file, or None to disable the cache
+    :param ttl: lifetime of a mapping in seconds, 0 disables the cache
+    :param scope: string identifying the endpoint and project, so names
+        are never resolved across clouds, regions or projects
+    """
+    global _NAME_CACHE, _NAME_CACHE_SCOPE
+    if path and ttl > 0:
+        # Defer import until we actually need it
+        from eclcli.common import cache
+        _NAME_CACHE = cache.TTLCache(path, ttl)
+        _NAME_CACHE_SCOPE = scope
+    else:
+        _NAME_CACHE = None
+        _NAME_CACHE_SCOPE = ''
+
+
+def reset_resource_cache():
+    """Forget the names resolved by the previous command"""
+    with _RESOURCE_LOCK:
+        _RESOURCE_MEMO.clear()
+
+
+def _get_resource_attr(resource, attr):
+    try:
+        return getattr(resource, attr)
+    except AttributeError:
+        try:
+            return resource.get(attr)
+        except Exception:
+            return None
+
+
+def _name_cache_key(manager, name, kwargs):
+    return '%s|%s.%s|%s|%s' % (
+        _NAME_CACHE_SCOPE,
+        type(manager).__module__,
+        type(manager).__name__,
+        sorted((k, six.text_type(v)) for k, v in kwargs.items()),
+        name,
+    )
+
+
+def _get_cached_resource(manager, key, name_attr, name, kwargs):
+    with _RESOURCE_LOCK:
+        res_id = _RESOURCE_MEMO.get(key)
+    if res_id is None and _NAME_CACHE is not None:
+        res_id = _NAME_CACHE.get(key)
+    if res_id is None:
+        return None
+    try:
+        resource = manager.get(res_id, **kwargs)
+    except Exception:
+        resource = None
+    # The resource may have been deleted or renamed since
+    if (resource is None or
+            _get_resource_attr(resource, name_attr) != name):
+        with _RESOURCE_LOCK:
+            _RESOURCE_MEMO.pop(key, None)
+        if _NAME_CACHE is not None:
+            _NAME_CACHE.delete(key)
+        return None
+    return resource
+
+
+def _remember_resource(key, resource):
+    res_id = _get_resource_attr(resource, 'id')
+    if res_id is None:
+        return
+    with _RESOURCE_LOCK:
+        _RESOURCE_MEMO[key] = res_id
+    if _NAME_CACHE is not None:
+        _NAME_CACHE.set(key, res_id)
 
 
 def find_resource(manager, name_or_id, **kwargs):
+    """Return the resource of manager with the given name or ID
+
+    IDs shaped like UUIDs are looked up directly; anything else is first
+    searched by name, using the server-side name filter when the API has
+    one, then looked up as an ID since some resources (flavors, keypairs)
+    have free-form IDs. Resolved names are remembered for the rest of the
+    command and, when configure_name_cache() was called, across commands.
+    """
     try:
         if isinstance(name_or_id, int) or name_or_id.isdigit():
             return manager.get(int(name_or_id), **kwargs)
@@ -24,35 +130,76 @@ def find_resource(manager, name_or_id, **kwargs):
         else:
             raise
 
-    try:
-        return manager.get(name_or_id, **kwargs)
-    except Exception:
-        pass
-
-    if len(kwargs) == 0:
-        kwargs = {}
+    is_uuid = bool(UUID_RE.match(six.text_type(name_or_id)))
+    if is_uuid:
+        try:
+            return manager.get(name_or_id, **kwargs)
+        except Exception:
+            pass
 
+    get_kwargs = kwargs
+    kwargs = dict(kwargs)
+    name_attr = 'name'
     try:
         if 'NAME_ATTR' in manager.resource_class.__dict__:
-            kwargs[manager.resource_class.NAME_ATTR] = name_or_id
-        else:
-            kwargs['name'] = name_or_id
+            name_attr = manager.resource_class.NAME_ATTR
     except Exception:
         pass
 
-    try:
-        return manager.find(**kwargs)
-    except Exception as ex:
-        if type(ex).__name__ == 'NotFound':
-            msg = "No %s with a name or ID of '%s' exists." % \
-                (manager.resource_class.__name__.lower(), name_or_id)
-            raise exceptions.CommandError(msg)
-        if type(ex).__name__ == 'NoUniqueMatch':
-            msg = "More than one %s exists with the name '%s'." % \
-                (manager.resource_class.__name__.lower(), name_or_id)
+    key = _name_cache_key(manager, name_or_id, kwargs)
+    resource = _get_cached_resource(manager, key, name_attr, name_or_id,
+                                    get_kwargs)
+    if resource is not None:
+        return resource
+
+    def _get_by_id():
+        if is_uuid:
+            return None
+        try:
+            return manager.get(name_or_id, **get_kwargs)
+        except Exception:
+            return None
+
+    kwargs[name_attr] = name_or_id
+    if hasattr(manager, 'find'):
+        try:
+            resource = manager.find(**kwargs)
+            _remember_resource(key, resource)
+            return resource
+        except Exception as ex:
+            if type(ex).__name__ == 'NotFound':
+                resource = _get_by_id()
+                if resource is not None:
+                    return resource
+                msg = "No %s with a name or ID of '%s' exists." % \
+                    (manager.resource_class.__name__.lower(), name_or_id)
+                raise exceptions.CommandError(msg)
+            if type(ex).__name__ == 'NoUniqueMatch':
+                resource = _get_by_id()
+                if resource is not None:
+                    return resource
+                msg = "More than one %s exists with the name '%s'." % \
+                    (manager.resource_class.__name__.lower(), name_or_id)
+                raise exceptions.CommandError(msg)
+            else:
+                pass
+    elif type(manager).__module__.startswith('glanceclient.v2'):
+        # The image v2 API filters by name but its controller has no find()
+        try:
+            matches = list(manager.list(filters={'name': name_or_id}))
+        except Exception:
+            matches = []
+        if len(matches) == 1:
+            _remember_resource(key, matches[0])
+            return matches[0]
+        if len(matches) > 1:
+            msg = "More than one image exists with the name '%s'." % \
+                name_or_id
             raise exceptions.CommandError(msg)
-        else:
-            pass
+
+    resource = _get_by_id()
+    if resource is not None:
+        return resource
 
     try:
         for resource in manager.list():
@@ -101,6 +248,42 @@ def get_field(item, field):
         raise exceptions.CommandError(msg)
 
 
+def index_by(items, field='id'):
+    """Return a dict of items keyed by the value of one of their fields
+
+    Build it once to join two lists in linear time; items without the
+    field are skipped.
+    """
+    index = {}
+    for item in items or []:
+        try:
+            index[get_field(item, field)] = item
+        except exceptions.CommandError:
+            pass
+    return index
+
+
+def join_field(items, index, ref_field, target_field, source_field='name'):
+    """Set target_field of each item from the indexed item it refers to
+
+    :param items: iterable of resources, returned as a list
+    :param index: dict from index_by() of the referenced resources
+    :param ref_field: field of the items holding the referenced key
+    :param target_field: attribute set on the items
+    :param source_field: field of the referenced resources to copy
+    Items whose reference is not in the index are left unchanged.
+    """
+    items = list(items)
+    for item in items:
+        try:
+            ref = index.get(get_field(item, ref_field))
+        except exceptions.CommandError:
+            ref = None
+        if ref is not None:
+            setattr(item, target_field, get_field(ref, source_field))
+    return items
+
+
 def get_columns(item):
     columns = list(item.keys())
     if 'tenant_id' in columns:
@@ -110,6 +293,42 @@ def get_columns(item):
     return tuple(sorted(columns))
 
 
+# Whether get_item_properties() may let a resource lazy-load its details
+_LAZY_LOAD = True
+# Lazy loads done and avoided by get_item_properties() during the command
+_LAZY_LOAD_COUNTS = {'loaded': 0, 'skipped': 0}
+
+
+@contextlib.contextmanager
+def lazy_loading(enabled):
+    """Allow or forbid lazy loads while rendering items
+
+    Resources of the vendored client libraries fetch themselves again
+    the first time a missing attribute is read, which turns a column the
+    API leaves out of list responses into one GET per row.
+    """
+    global _LAZY_LOAD
+    saved, _LAZY_LOAD = _LAZY_LOAD, enabled
+    try:
+        yield
+    finally:
+        _LAZY_LOAD = saved
+
+
+def pop_lazy_load_counts():
+    """Return and reset the (loaded, skipped) lazy load counters"""
+    counts = (_LAZY_LOAD_COUNTS['loaded'], _LAZY_LOAD_COUNTS['skipped'])
+    _LAZY_LOAD_COUNTS['loaded'] = _LAZY_LOAD_COUNTS['skipped'] = 0
+    return counts
+
+
+def _is_lazy(item):
+    try:
+        return not item.is_loaded()
+    except Exception:
+        return False
+
+
 def get_item_properties(item, fields, mixed_case_fields=None, formatters=None):
     if mixed_case_fields is None:
         mixed_case_fields = []
@@ -117,19 +336,36 @@ def get_item_properties(item, fields, mixed_case_fields=None, formatters=None):
         formatters = {}
 
     row = []
+    missing = False
+    lazy = _is_lazy(item)
+    if lazy and not _LAZY_LOAD:
+        # Render what we have, missing fields are left empty
+        item.set_loaded(True)
 
-    for field in fields:
-        if field in mixed_case_fields:
-            field_name = field.replace(' ', '_')
-        else:
-            field_name = field.lower().replace(' ', '_')
-        data = getattr(item, field_name, '')
-        if data == '' and field_name == 'project_id':
-            data = getattr(item, 'tenant_id', '')
-        if field in formatters:
-            row.append(formatters[field](data))
-        else:
-            row.append(data)
+    try:
+        for field in fields:
+            if field in mixed_case_fields:
+                field_name = field.replace(' ', '_')
+            else:
+                field_name = field.lower().replace(' ', '_')
+            try:
+                data = getattr(item, field_name)
+            except AttributeError:
+                data = ''
+                missing = True
+            if data == '' and field_name == 'project_id':
+                data = getattr(item, 'tenant_id', '')
+            if field in formatters:
+                row.append(formatters[field](data))
+            else:
+                row.append(data)
+    finally:
+        if lazy and not _LAZY_LOAD:
+            item.set_loaded(False)
+            if missing:
+                _LAZY_LOAD_COUNTS['skipped'] += 1
+        elif lazy and not _is_lazy(item):
+            _LAZY_LOAD_COUNTS['loaded'] += 1
     return tuple(row)
 
 
@@ -154,13 +390,13 @@ def get_dict_properties(item, fields, mixed_case_fields=None, formatters=None):
     return tuple(row)
 
 
-def sort_items(items, sort_str):
+def parse_sort_str(sort_str):
+    """Return a list of (key, direction) from '<key>[:<direction>],...'"""
     if not sort_str:
-        return items
-    items = list(items)
-    sort_keys = sort_str.strip().split(',')
-    for sort_key in reversed(sort_keys):
-        reverse = False
+        return []
+    sort_keys = []
+    for sort_key in sort_str.strip().split(','):
+        direction = 'asc'
         if ':' in sort_key:
             sort_key, direction = sort_key.split(':', 1)
             if not sort_key:
@@ -172,10 +408,17 @@ def sort_items(items, sort_str):
                 msg = ("%s is not a valid sort direction for sort key %s, "
                        "use asc or desc instead" % (direction, sort_key))
                 raise exceptions.CommandError(msg)
-            if direction == 'desc':
-                reverse = True
+        sort_keys.append((sort_key, direction))
+    return sort_keys
+
+
+def sort_items(items, sort_str):
+    if not sort_str:
+        return items
+    items = list(items)
+    for sort_key, direction in reversed(parse_sort_str(sort_str)):
         items.sort(key=lambda item: get_field(item, sort_key),
-                   reverse=reverse)
+                   reverse=direction == 'desc')
     return items
 
 
@@ -187,6 +430,52 @@ def env(*vars, **kwargs):
     return kwargs.get('default', '')
 
 
+# Entry points of the installed distributions by group, and the name and
+# version of the distributions providing each group, read once
+_ENTRY_POINTS = None
+_ENTRY_POINT_DISTRIBUTIONS = None
+
+
+def get_all_entry_points():
+    """Return a dict of every installed entry point keyed by group"""
+    global _ENTRY_POINTS, _ENTRY_POINT_DISTRIBUTIONS
+
+    if _ENTRY_POINTS is None:
+        _ENTRY_POINTS = {}
+        _ENTRY_POINT_DISTRIBUTIONS = {}
+        seen = set()
+        for dist in importlib_metadata.distributions():
+            # A distribution may be found more than once on sys.path,
+            # only the first one is used as import would
+            name = dist.metadata['Name']
+            if name in seen:
+                continue
+            seen.add(name)
+            for ep in dist.entry_points:
+                _ENTRY_POINTS.setdefault(ep.group, []).append(ep)
+                _ENTRY_POINT_DISTRIBUTIONS.setdefault(
+                    ep.group, {})[name] = dist.version
+    return _ENTRY_POINTS
+
+
+def get_entry_point_distributions(prefix=''):
+    """Return {name: version} of the distributions with entry points
+
+    Only groups starting with prefix are considered.
+    """
+    get_all_entry_points()
+    distributions = {}
+    for group, dists in _ENTRY_POINT_DISTRIBUTIONS.items():
+        if group.startswith(prefix):
+            distributions.update(dists)
+    return distributions
+
+
+def get_entry_points(group):
+    """Return the entry points registered for group without loading them"""
+    return list(get_all_entry_points().get(group, ()))
+
+
 def get_client_class(api_name, version, version_map):
     try:
         client_path = version_map[str(version)]
@@ -204,21 +493,21 @@ def wait_for_status(status_f,
                     success_status=['active'],
                     error_status=['error'],
                     sleep_time=5,
-                    callback=None):
-    while True:
-        res = status_f(res_id)
-        status = getattr(res, status_field, '').lower()
-        if status in success_status:
-            retval = True
-            break
-        elif status in error_status:
-            retval = False
-            break
-        if callback:
-            progress = getattr(res, 'progress', None) or 0
-            callback(progress)
-        time.sleep(sleep_time)
-    return retval
+                    callback=None,
+                    timeout=None):
+    """Wait for a resource to reach a success or error status
+
+    Checks back off from one second to sleep_time, see waiter.Waiter.
+    """
+    return waiter.Waiter(
+        status_f,
+        status_field=status_field,
+        success_status=success_status,
+        error_status=error_status,
+        timeout=timeout,
+        max_delay=sleep_time,
+        callback=callback,
+    ).wait_one(res_id)
 
 
 def wait_for_delete(manager,
@@ -229,26 +518,20 @@ def wait_for_delete(manager,
                     sleep_time=5,
                     timeout=300,
                     callback=None):
-    total_time = 0
-    while total_time < timeout:
-        try:
-            res = manager.get(res_id)
-        except Exception as ex:
-            if type(ex).__name__ in exception_name:
-                return True
-            raise
-
-        status = getattr(res, status_field, '').lower()
-        if status in error_status:
-            return False
+    """Wait for a resource to be deleted
 
-        if callback:
-            progress = getattr(res, 'progress', None) or 0
-            callback(progress)
-        time.sleep(sleep_time)
-        total_time += sleep_time
-
-    return False
+    Checks back off from one second to sleep_time, see waiter.Waiter.
+    """
+    return waiter.Waiter(
+        manager.get,
+        status_field=status_field,
+        error_status=error_status,
+        delete=True,
+        exception_name=exception_name,
+        timeout=timeout,
+        max_delay=sleep_time,
+        callback=callback,
+    ).wait_one(res_id)
 
 
 def get_effective_log_level():
@@ -420,14 +703,36 @@ def parse_allowed_address_pairs(text):
 def filter_list_with_property(datalist, attribute, value):
     if value is None:
         return datalist
-    postfilter = []
-    for data in datalist:
-        attr = getattr(data, attribute, None)
-        if attr is None:
-            continue
-        if value in attr:
-            postfilter.append(data)
-    return postfilter
+    return list(filter_by_properties(datalist, {attribute: value}))
+
+
+def make_property_filter(filters):
+    """Return a predicate true for items matching all of filters
+
+    :param filters: dict of attribute to a value that must be contained
+        in that attribute, as with filter_list_with_property(); None
+        values are ignored
+    """
+    checks = [(attribute, value) for attribute, value in filters.items()
+              if value is not None]
+
+    def _match(data):
+        for attribute, value in checks:
+            attr = getattr(data, attribute, None)
+            if attr is None or value not in attr:
+                return False
+        return True
+    return _match
+
+
+def filter_by_properties(datalist, filters):
+    """Lazily yield the items of datalist matching all of filters
+
+    Every item is checked once against all filters, see
+    make_property_filter().
+    """
+    match = make_property_filter(filters)
+    return (data for data in datalist if match(data))
 
 
 def parse_vna_interface(text, valid_keys):
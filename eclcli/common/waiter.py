@@ -0,0 +1,146 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Wait for many resources to reach a final status"""
+
+import logging
+import random
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+# Delay before the first status check, grown by BACKOFF_FACTOR after every
+# check that shows no change, up to the max_delay given to the Waiter
+INITIAL_DELAY = 1
+BACKOFF_FACTOR = 1.5
+DEFAULT_MAX_DELAY = 5
+
+
+def add_timeout_option(parser):
+    parser.add_argument(
+        '--wait-timeout',
+        metavar='<seconds>',
+        type=int,
+        default=None,
+        help='Give up waiting after this many seconds (default: no limit '
+             'for status changes, 300 for deletion)',
+    )
+    return parser
+
+
+class Waiter(object):
+    """Poll the status of a set of resources until each one is final
+
+    Every round checks all pending resources with ``get_func``, one call
+    each. The delay between rounds starts at INITIAL_DELAY and backs off
+    with jitter up to ``max_delay`` while nothing changes; any change
+    resets it.
+
+    :param get_func: callable returning a resource from its ID
+    :param status_field: attribute holding the status
+    :param success_status: statuses meaning the wait succeeded
+    :param error_status: statuses meaning the wait failed
+    :param delete: wait for the resources to disappear instead; a resource
+        is gone when get_func raises one of ``exception_name``
+    :param exception_name: names of the exceptions meaning "not found"
+    :param timeout: overall limit in seconds, None to wait forever
+    :param max_delay: longest delay between two rounds
+    :param callback: called with the progress of the resource when a
+        single resource is waited for
+    """
+
+    def __init__(self, get_func,
+                 status_field='status',
+                 success_status=('active',),
+                 error_status=('error',),
+                 delete=False,
+                 exception_name=('NotFound',),
+                 timeout=None,
+                 max_delay=DEFAULT_MAX_DELAY,
+                 callback=None):
+        self.get_func = get_func
+        self.status_field = status_field
+        self.success_status = [s.lower() for s in success_status]
+        self.error_status = [s.lower() for s in error_status]
+        self.delete = delete
+        self.exception_name = list(exception_name)
+        self.timeout = timeout
+        self.max_delay = max(max_delay, INITIAL_DELAY)
+        self.callback = callback
+
+    def wait_one(self, res_id):
+        return self.wait([res_id])[res_id]
+
+    def wait(self, res_ids):
+        """Return a dict of ID to True (success) or False (error/timeout)"""
+        pending = []
+        for res_id in res_ids:
+            if res_id not in pending:
+                pending.append(res_id)
+        results = {}
+        last_seen = {}
+        deadline = time.time() + self.timeout if self.timeout else None
+        delay = INITIAL_DELAY
+
+        while pending:
+            changed = False
+            for res_id, res in self._poll(pending).items():
+                if res is None:
+                    # Gone: success when deleting, an error otherwise
+                    results[res_id] = self.delete
+                    continue
+                status = (getattr(res, self.status_field, '') or '').lower()
+                if not self.delete and status in self.success_status:
+                    results[res_id] = True
+                    continue
+                if status in self.error_status:
+                    results[res_id] = False
+                    continue
+                progress = getattr(res, 'progress', None) or 0
+                if last_seen.get(res_id) != (status, progress):
+                    last_seen[res_id] = (status, progress)
+                    changed = True
+                if self.callback and len(res_ids) == 1:
+                    self.callback(progress)
+
+            pending = [r for r in pending if r not in results]
+            if not pending:
+                break
+
+            delay = INITIAL_DELAY if changed else min(
+                delay * BACKOFF_FACTOR, self.max_delay)
+            sleep = random.uniform(delay / 2.0, delay)
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    LOG.debug('Timed out waiting for %s', pending)
+                    for res_id in pending:
+                        results[res_id] = False
+                    break
+                sleep = min(sleep, remaining)
+            time.sleep(sleep)
+        return results
+
+    def _poll(self, pending):
+        """Return a dict of ID to resource, or None for a missing one"""
+        found = {}
+        for res_id in pending:
+            try:
+                found[res_id] = self.get_func(res_id)
+            except Exception as ex:
+                if self.delete and type(ex).__name__ in self.exception_name:
+                    found[res_id] = None
+                else:
+                    raise
+        return found
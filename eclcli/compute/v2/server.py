@@ -25,7 +25,8 @@ import sys
 from novaclient.v2 import servers
 from novaclient.v2.servers import ServerManager
 
-from eclcli.common import command, exceptions, parseractions, utils
+from eclcli.common import command, exceptions, parallel, parseractions, utils
+from eclcli.common import waiter
 from eclcli.i18n import _  # noqa
 from eclcli.identity import common as identity_common
 
@@ -399,7 +400,7 @@ class CreateServer(command.ShowOne):
             action='store_true',
             help=_('Wait for build to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
@@ -573,6 +574,7 @@ class CreateServer(command.ShowOne):
                 compute_client.servers.get,
                 server.id,
                 callback=_show_progress,
+                timeout=parsed_args.wait_timeout,
             ):
                 sys.stdout.write('\n')
             else:
@@ -633,7 +635,7 @@ class CreateServerImage(command.ShowOne):
             action='store_true',
             help=_('Wait for image create to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
@@ -657,6 +659,7 @@ class CreateServerImage(command.ShowOne):
                 image_client.images.get,
                 image_id,
                 callback=_show_progress,
+                timeout=parsed_args.wait_timeout,
             ):
                 sys.stdout.write('\n')
             else:
@@ -689,26 +692,52 @@ class DeleteServer(command.Command):
             action='store_true',
             help=_('Wait for delete to complete'),
         )
-        return parser
+        waiter.add_timeout_option(parser)
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        for server in parsed_args.server:
+
+        def _delete(server):
             server_obj = utils.find_resource(
                 compute_client.servers, server)
             compute_client.servers.delete(server_obj.id)
-            if parsed_args.wait:
-                if utils.wait_for_delete(
-                    compute_client.servers,
-                    server_obj.id,
-                    callback=_show_progress,
-                ):
-                    sys.stdout.write('\n')
-                else:
-                    self.log.error(_('Error deleting server: %s'),
-                                   server_obj.id)
-                    sys.stdout.write(_('\nError deleting server'))
-                    raise SystemExit
+            return server_obj.id
+
+        outcomes = parallel.run_each_outcomes(
+            _delete,
+            parsed_args.server,
+            parallel=parsed_args.parallel,
+        )
+        errors = []
+        failed = parallel.log_failures(parsed_args.server, outcomes,
+                                       'delete server', self.log)
+        if failed:
+            errors.append(parallel.failure_message(
+                failed, len(parsed_args.server), 'delete server'))
+        server_ids = [server_id for server_id, error in outcomes
+                      if error is None]
+
+        # The servers that were deleted are waited for even when others
+        # failed to be
+        if parsed_args.wait and server_ids:
+            # All deletions are tracked together. The server list cannot
+            # be filtered by ID, so each pending server is checked with a
+            # get rather than listing every server of the project
+            results = waiter.Waiter(
+                compute_client.servers.get,
+                delete=True,
+                timeout=parsed_args.wait_timeout or 300,
+                callback=_show_progress,
+            ).wait(server_ids)
+            if len(server_ids) == 1:
+                sys.stdout.write('\n')
+            not_deleted = [i for i in server_ids if not results[i]]
+            if not_deleted:
+                errors.append(_("Error deleting server(s): %s") %
+                              ', '.join(not_deleted))
+        if errors:
+            raise exceptions.CommandError(' '.join(errors))
 
 
 class ListServer(command.Lister):
@@ -1004,7 +1033,7 @@ class MigrateServer(command.Command):
             action='store_true',
             help=_('Wait for resize to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
 
@@ -1028,6 +1057,7 @@ class MigrateServer(command.Command):
                 compute_client.servers.get,
                 server.id,
                 callback=_show_progress,
+                timeout=parsed_args.wait_timeout,
             ):
                 sys.stdout.write(_('Complete\n'))
             else:
@@ -1089,7 +1119,7 @@ class RebootServer(command.Command):
             action='store_true',
             help=_('Wait for reboot to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
@@ -1102,6 +1132,7 @@ class RebootServer(command.Command):
                 compute_client.servers.get,
                 server.id,
                 callback=_show_progress,
+                timeout=parsed_args.wait_timeout,
             ):
                 sys.stdout.write(_('\nReboot complete\n'))
             else:
@@ -1135,7 +1166,7 @@ class RebuildServer(command.ShowOne):
             action='store_true',
             help=_('Wait for rebuild to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
@@ -1153,6 +1184,7 @@ class RebuildServer(command.ShowOne):
                 compute_client.servers.get,
                 server.id,
                 callback=_show_progress,
+                timeout=parsed_args.wait_timeout,
             ):
                 sys.stdout.write(_('\nComplete\n'))
             else:
@@ -1284,7 +1316,7 @@ class ResizeServer(command.Command):
             action='store_true',
             help=_('Wait for resize to complete'),
         )
-        return parser
+        return waiter.add_timeout_option(parser)
 
     def take_action(self, parsed_args):
 
@@ -1305,6 +1337,7 @@ class ResizeServer(command.Command):
                     server.id,
                     success_status=['active', 'verify_resize'],
                     callback=_show_progress,
+                    timeout=parsed_args.wait_timeout,
                 ):
                     sys.stdout.write(_('Complete\n'))
                 else:
@@ -1606,15 +1639,20 @@ class StartServer(command.Command):
             nargs="+",
             help=_('Server(s) to start (name or ID)'),
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        for server in parsed_args.server:
-            utils.find_resource(
+        parallel.run_each(
+            lambda server: utils.find_resource(
                 compute_client.servers,
                 server,
-            ).start()
+            ).start(),
+            parsed_args.server,
+            parallel=parsed_args.parallel,
+            action='start server',
+            log=self.log,
+        )
 
 
 class StopServer(command.Command):
@@ -1628,15 +1666,20 @@ class StopServer(command.Command):
             nargs="+",
             help=_('Server(s) to stop (name or ID)'),
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
-        for server in parsed_args.server:
-            utils.find_resource(
+        parallel.run_each(
+            lambda server: utils.find_resource(
                 compute_client.servers,
                 server,
-            ).stop()
+            ).stop(),
+            parsed_args.server,
+            parallel=parsed_args.parallel,
+            action='stop server',
+            log=self.log,
+        )
 
 
 class SuspendServer(command.Command):
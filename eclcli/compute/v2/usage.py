@@ -21,7 +21,10 @@ import sys
 import six
 
 from eclcli.common import command
+from eclcli.common import exceptions
+from eclcli.common import parallel
 from eclcli.common import utils
+from eclcli.identity import common as identity_common
 
 
 class ListUsage(command.Lister):
@@ -42,18 +45,42 @@ class ListUsage(command.Lister):
             default=None,
             help="Usage range end date, ex 2012-01-20 (default: tomorrow)"
         )
+        parser.add_argument(
+            "--interval",
+            metavar="<days>",
+            type=int,
+            default=None,
+            help="Query the range in periods of this many days and print "
+                 "the usage of each period as it arrives, with Start and "
+                 "End columns"
+        )
         return parser
 
-    def take_action(self, parsed_args):
-
-        def _format_project(project):
-            if not project:
-                return ""
-            if project in project_cache.keys():
-                return project_cache[project].name
-            else:
-                return project
+    def _iter_periods(self, compute_client, start, end, days):
+        periods = []
+        period_start = start
+        while period_start < end:
+            period_end = min(period_start + datetime.timedelta(days=days), end)
+            periods.append((period_start, period_end))
+            period_start = period_end
+
+        # Request the next period while the rows of the current one are
+        # formatted and printed
+        pending = None
+        for i, (period_start, period_end) in enumerate(periods):
+            if pending is None:
+                pending = parallel.prefetch(
+                    compute_client.usage.list,
+                    period_start, period_end, detailed=True)
+            usage_list = pending.result()
+            if i + 1 < len(periods):
+                pending = parallel.prefetch(
+                    compute_client.usage.list,
+                    periods[i + 1][0], periods[i + 1][1], detailed=True)
+            for usage in usage_list:
+                yield period_start, period_end, usage
 
+    def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
         columns = (
             "tenant_id",
@@ -83,16 +110,31 @@ class ListUsage(command.Lister):
         else:
             end = now + datetime.timedelta(days=1)
 
-        usage_list = compute_client.usage.list(start, end, detailed=True)
+        # Project names are listed while the usage is computed
+        project_names = identity_common.ProjectNames(self.app)
+        formatters = {
+            'tenant_id': project_names.format,
+            'server_usages': lambda x: len(x),
+            'total_memory_mb_usage': lambda x: float("%.2f" % x),
+            'total_vcpus_usage': lambda x: float("%.2f" % x),
+            'total_local_gb_usage': lambda x: float("%.2f" % x),
+        }
+
+        if parsed_args.interval:
+            if parsed_args.interval < 1:
+                msg = "--interval must be at least 1 day."
+                raise exceptions.CommandError(msg)
+            rows = self._iter_periods(
+                compute_client, start, end, parsed_args.interval)
+            return (("Start", "End") + column_headers,
+                    ((period_start.strftime(dateformat),
+                      period_end.strftime(dateformat)) +
+                     utils.get_item_properties(
+                         s, columns, formatters=formatters)
+                     for period_start, period_end, s in rows))
 
-        # Cache the project list
-        project_cache = {}
-        try:
-            for p in self.app.client_manager.identity.tenants.list():
-                project_cache[p.id] = p
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        usage_list = compute_client.usage.list(start, end, detailed=True)
+        project_names.get_names(u.tenant_id for u in usage_list)
 
         if parsed_args.formatter == 'table' and len(usage_list) > 0:
             sys.stdout.write("Usage from %s to %s: \n" % (
@@ -102,14 +144,7 @@ class ListUsage(command.Lister):
 
         return (column_headers,
                 (utils.get_item_properties(
-                    s, columns,
-                    formatters={
-                        'tenant_id': _format_project,
-                        'server_usages': lambda x: len(x),
-                        'total_memory_mb_usage': lambda x: float("%.2f" % x),
-                        'total_vcpus_usage': lambda x: float("%.2f" % x),
-                        'total_local_gb_usage': lambda x: float("%.2f" % x),
-                    },
+                    s, columns, formatters=formatters,
                 ) for s in usage_list))
 
 
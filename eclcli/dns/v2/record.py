@@ -15,14 +15,32 @@
 
 """Record action implementations"""
 
+import csv
+import json
+import os
 import re
+import sys
+
+import six
 
 from eclcli.common import command
 from eclcli.common import exceptions
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 
 
+# Largest page the API returns
+PAGE_SIZE = 500
+# Recordsets removed per multi-delete request
+DELETE_BATCH = 100
+FILE_FORMATS = ('zone', 'csv', 'json')
+# Records of these types at the zone apex belong to the zone itself
+ZONE_TYPES = ('SOA', 'NS')
+# Types whose data ends with, or is, a domain name
+_NAME_DATA_FIELD = {'CNAME': 0, 'NS': 0, 'PTR': 0, 'MX': 1, 'SRV': 3}
+
+
 class CreateRecordSet(command.Lister):
     """Create new recordset"""
 
@@ -215,12 +233,28 @@ class ListRecordSet(command.Lister):
             help="Specify the ID for the resource."
                  "It is displayed from the next record of the specified ID.",
         )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            default=False,
+            help="List every recordset of the zone, following markers. "
+                 "--limit is then the page size (default=%d)." % PAGE_SIZE,
+        )
         return parser
 
     def take_action(self, parsed_args):
         dns_client = self.app.eclsdk.conn.dns
 
-        recordsets = dns_client.recordsets(parsed_args.zone_id, parsed_args.limit, parsed_args.marker)
+        if parsed_args.all:
+            # Rows are formatted as pages arrive, the next page being
+            # fetched meanwhile
+            recordsets = _iter_recordsets(
+                dns_client, parsed_args.zone_id,
+                page_size=parsed_args.limit or PAGE_SIZE,
+                marker=parsed_args.marker, prefetch=True)
+        else:
+            recordsets = dns_client.recordsets(
+                parsed_args.zone_id, parsed_args.limit, parsed_args.marker)
 
         columns = [
             'id',
@@ -314,6 +348,404 @@ class UpdateRecordSet(command.ShowOne):
         return row, utils.get_item_properties(recordset, row)
 
 
+class ExportRecordSet(command.Command):
+    _description = _("Export the recordsets of a zone to a file")
+
+    def get_parser(self, prog_name):
+        parser = super(ExportRecordSet, self).get_parser(prog_name)
+        parser.add_argument(
+            "zone_id",
+            metavar="<zone_id>",
+            type=_type_uuid,
+            help="ID of the zone to export.",
+        )
+        parser.add_argument(
+            "--file",
+            metavar="<file>",
+            default='-',
+            help="File to write, '-' for stdout (default)",
+        )
+        parser.add_argument(
+            "--file-format",
+            choices=FILE_FORMATS,
+            default=None,
+            help="zone (master file), csv or json (one recordset per "
+                 "line); guessed from the file name, zone by default",
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        dns_client = self.app.eclsdk.conn.dns
+        file_format = _guess_format(parsed_args.file, parsed_args.file_format)
+
+        # Pages are written as they arrive
+        rows = (_recordset_row(r) for r in
+                _iter_recordsets(dns_client, parsed_args.zone_id,
+                                 prefetch=True))
+        if parsed_args.file == '-':
+            _write_recordsets(sys.stdout, rows, file_format)
+        else:
+            with open(parsed_args.file, 'w') as f:
+                _write_recordsets(f, rows, file_format)
+
+
+class ImportRecordSet(command.Lister):
+    _description = _("Import recordsets from a file into a zone")
+
+    def get_parser(self, prog_name):
+        parser = super(ImportRecordSet, self).get_parser(prog_name)
+        parser.add_argument(
+            "zone_id",
+            metavar="<zone_id>",
+            type=_type_uuid,
+            help="ID of the zone to import into.",
+        )
+        parser.add_argument(
+            "file",
+            metavar="<file>",
+            help="File to read, '-' for stdin",
+        )
+        parser.add_argument(
+            "--file-format",
+            choices=FILE_FORMATS,
+            default=None,
+            help="zone (master file), csv or json (one recordset per "
+                 "line); guessed from the file name, zone by default",
+        )
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            default=False,
+            help="Also delete the records of the zone missing from the "
+                 "file, except its SOA and NS records",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Only show the changes the import would make",
+        )
+        parallel.add_parallel_option(parser)
+        return parallel.add_rate_option(parser)
+
+    def take_action(self, parsed_args):
+        dns_client = self.app.eclsdk.conn.dns
+        file_format = _guess_format(parsed_args.file, parsed_args.file_format)
+        zone = dns_client.get_zone(parsed_args.zone_id)
+
+        if parsed_args.file == '-':
+            wanted = _read_recordsets(sys.stdin, file_format, zone.name)
+        else:
+            with open(parsed_args.file) as f:
+                wanted = _read_recordsets(f, file_format, zone.name)
+
+        existing = {}
+        for recordset in _iter_recordsets(dns_client, parsed_args.zone_id):
+            row = _recordset_row(recordset)
+            for record in row['records']:
+                existing[_record_key(row['name'], row['type'], record)] = (
+                    recordset.id, row)
+
+        changes = _diff_records(wanted, existing, zone.name,
+                                parsed_args.delete)
+
+        if not parsed_args.dry_run:
+            zone_id = parsed_args.zone_id
+
+            def _apply(change):
+                if change.action == 'delete':
+                    dns_client.delete_multiple_recordsets(
+                        zone_id, change.recordset_ids)
+                elif change.action == 'update':
+                    dns_client.update_recordset(
+                        zone_id, change.recordset_ids[0], ttl=change.ttl,
+                        description=change.description)
+                else:
+                    dns_client.create_recordset(
+                        zone_id, name=change.name, type=change.type,
+                        ttl=change.ttl, records=change.records,
+                        description=change.description)
+
+            # Deletes go first, a CNAME may replace other records
+            for action in ('delete', 'update', 'create'):
+                parallel.run_each(
+                    _apply,
+                    [c for c in changes if c.action == action],
+                    parallel=parsed_args.parallel,
+                    action='apply change',
+                    log=self.log,
+                    rate=parsed_args.rate,
+                )
+
+        columns = ('Action', 'Name', 'Type', 'TTL', 'Record')
+        return (columns,
+                ((c.action,) + entry
+                 for c in changes for entry in c.entries))
+
+
+def _iter_recordsets(dns_client, zone_id, page_size=PAGE_SIZE, marker=None,
+                     prefetch=False):
+    """Yield all the recordsets of a zone, following markers
+
+    Only one page is held at a time. With prefetch, the next page is
+    requested in the background while the current one is consumed.
+    """
+    page = dns_client.recordsets(zone_id, page_size, marker)
+    while page:
+        # A short page is the last one
+        marker = page[-1].id if len(page) >= page_size else None
+        pending = None
+        if marker and prefetch:
+            pending = parallel.prefetch(
+                dns_client.recordsets, zone_id, page_size, marker)
+        for recordset in page:
+            yield recordset
+        if marker is None:
+            return
+        if pending is not None:
+            page = pending.result()
+        else:
+            page = dns_client.recordsets(zone_id, page_size, marker)
+
+
+def _guess_format(path, file_format):
+    if file_format:
+        return file_format
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.json', '.jsonl'):
+        return 'json'
+    return 'zone'
+
+
+def _recordset_row(recordset):
+    return {
+        'name': recordset.name,
+        'type': recordset.type,
+        'ttl': recordset.ttl,
+        'records': list(recordset.records or []),
+        'description': recordset.description,
+    }
+
+
+def _write_recordsets(f, rows, file_format):
+    if file_format == 'csv':
+        writer = csv.writer(f)
+        writer.writerow(('name', 'type', 'ttl', 'record', 'description'))
+        for row in rows:
+            for record in row['records']:
+                writer.writerow((row['name'], row['type'], row['ttl'],
+                                 record, row['description'] or ''))
+    elif file_format == 'json':
+        for row in rows:
+            f.write(json.dumps(row, sort_keys=True) + '\n')
+    else:
+        for row in rows:
+            for record in row['records']:
+                f.write('%s %s IN %s %s\n' % (
+                    row['name'], row['ttl'], row['type'], record))
+
+
+def _absolute_name(name, origin):
+    if name == '@':
+        return origin
+    if name.endswith('.'):
+        return name
+    return '%s.%s' % (name, origin)
+
+
+def _qualify_record(rtype, record, origin):
+    """Make the domain name in the data of a record absolute"""
+    index = _NAME_DATA_FIELD.get(rtype)
+    if index is None:
+        return record
+    fields = record.split()
+    if len(fields) > index:
+        fields[index] = _absolute_name(fields[index], origin)
+    return ' '.join(fields)
+
+
+def _strip_comment(line):
+    quoted = False
+    for i, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ';' and not quoted:
+            return line[:i]
+    return line
+
+
+def _zone_file_entries(lines):
+    """Yield the logical lines of a zone file, parentheses joined"""
+    pending = None
+    for line in lines:
+        line = _strip_comment(line.rstrip('\n'))
+        if pending is not None:
+            pending += ' ' + line.strip()
+        elif not line.strip():
+            continue
+        else:
+            pending = line
+        if pending.count('(') > pending.count(')'):
+            continue
+        yield pending.replace('(', ' ').replace(')', ' ').rstrip()
+        pending = None
+
+
+def _parse_zone_file(lines, origin):
+    """Yield (name, type, ttl, record) of the records of a zone file"""
+    default_ttl = None
+    name = None
+    for line in _zone_file_entries(lines):
+        fields = line.split()
+        if fields[0].upper() == '$ORIGIN':
+            origin = _absolute_name(fields[1], origin)
+            continue
+        if fields[0].upper() == '$TTL':
+            default_ttl = int(fields[1])
+            continue
+        if fields[0].startswith('$'):
+            raise exceptions.CommandError(
+                "Unsupported zone file directive: %s" % fields[0])
+        # A line starting with a blank is for the previous name
+        if not line[0].isspace():
+            name = _absolute_name(fields.pop(0), origin)
+        elif name is None:
+            raise exceptions.CommandError("No name for: %s" % line.strip())
+        ttl = default_ttl
+        while fields and (fields[0].isdigit() or
+                          fields[0].upper() in ('IN', 'CH', 'HS')):
+            field = fields.pop(0)
+            if field.isdigit():
+                ttl = int(field)
+        if len(fields) < 2:
+            raise exceptions.CommandError("Invalid record: %s" % line)
+        rtype = fields[0].upper()
+        # Keep the data as written, TXT strings may contain blanks
+        before_data = len(line.split()) - len(fields) + 1
+        record = line.strip().split(None, before_data)[-1]
+        yield name, rtype, ttl, _qualify_record(rtype, record, origin)
+
+
+def _read_recordsets(f, file_format, origin):
+    """Return a dict of record key to the wanted record
+
+    Each value is a dict with name, type, ttl, records (the one record)
+    and description.
+    """
+    if file_format == 'csv':
+        entries = ((_absolute_name(r['name'], origin), r['type'].upper(),
+                    int(r['ttl']) if r.get('ttl') else None,
+                    r['record'], r.get('description') or None)
+                   for r in csv.DictReader(f))
+    elif file_format == 'json':
+        entries = ((_absolute_name(d['name'], origin), d['type'].upper(),
+                    d.get('ttl'), record, d.get('description'))
+                   for d in (json.loads(line) for line in f if line.strip())
+                   for record in d['records'])
+    else:
+        entries = ((name, rtype, ttl, record, None)
+                   for name, rtype, ttl, record in _parse_zone_file(f, origin))
+
+    wanted = {}
+    for name, rtype, ttl, record, description in entries:
+        wanted[_record_key(name, rtype, record)] = {
+            'name': name,
+            'type': rtype,
+            'ttl': ttl,
+            'records': [record],
+            'description': description,
+        }
+    return wanted
+
+
+def _record_key(name, rtype, record):
+    return (name.lower(), rtype.upper(), six.text_type(record))
+
+
+class _Change(object):
+    """One request creating, updating or deleting recordsets
+
+    ``entries`` are the (name, type, ttl, record) it changes.
+    """
+
+    def __init__(self, action, name=None, rtype=None, ttl=None,
+                 description=None, recordset_ids=()):
+        self.action = action
+        self.name = name
+        self.type = rtype
+        self.ttl = ttl
+        self.description = description
+        self.records = []
+        self.recordset_ids = list(recordset_ids)
+        self.entries = []
+
+    def add(self, name, rtype, ttl, record):
+        self.records.append(record)
+        self.entries.append((name, rtype, ttl, record))
+
+    def __str__(self):
+        return '%s %s' % (self.action, ', '.join(
+            '%s %s %s' % (e[0], e[1], e[3]) for e in self.entries))
+
+
+def _is_zone_record(row, zone_name):
+    return (row['type'] in ZONE_TYPES and
+            row['name'].lower() == zone_name.lower())
+
+
+def _diff_records(wanted, existing, zone_name, delete=False):
+    """Return the changes making the existing records the wanted ones
+
+    Records are compared one by one, as the API keeps a recordset per
+    record. New records with the same name, type, TTL and description
+    are created by one request, deletes are sent DELETE_BATCH at a time.
+    The SOA and NS records of the zone itself are left alone.
+    """
+    changes = []
+    if delete:
+        batch = None
+        for key, (recordset_id, row) in sorted(existing.items()):
+            if key in wanted or _is_zone_record(row, zone_name):
+                continue
+            if batch is None or len(batch.recordset_ids) == DELETE_BATCH:
+                batch = _Change('delete')
+                changes.append(batch)
+            batch.recordset_ids.append(recordset_id)
+            batch.add(row['name'], row['type'], row['ttl'], key[2])
+
+    creates = {}
+    for key, row in sorted(wanted.items()):
+        if row['type'] == 'SOA' or _is_zone_record(row, zone_name):
+            continue
+        record = key[2]
+        current = existing.get(key)
+        if current is None:
+            group = (row['name'], row['type'], row['ttl'],
+                     row['description'])
+            if group not in creates:
+                creates[group] = _Change('create', *group)
+                changes.append(creates[group])
+            creates[group].add(row['name'], row['type'], row['ttl'], record)
+            continue
+
+        recordset_id, current_row = current
+        ttl = description = None
+        if row['ttl'] is not None and row['ttl'] != current_row['ttl']:
+            ttl = row['ttl']
+        if row['description'] is not None and \
+                row['description'] != current_row['description']:
+            description = row['description']
+        if ttl is not None or description is not None:
+            change = _Change('update', row['name'], row['type'], ttl,
+                             description, [recordset_id])
+            change.add(row['name'], row['type'],
+                       row['ttl'] or current_row['ttl'], record)
+            changes.append(change)
+    return changes
+
+
 def call_limit_validate_int_range(text):
     return utils.validate_int_range(text, 1, 500)
 
@@ -16,7 +16,6 @@
 import logging
 
 from keystoneclient.v2_0 import client as identity_client_v2
-from eclcli.api import auth
 from eclcli.common import utils
 
 LOG = logging.getLogger(__name__)
@@ -67,7 +66,9 @@ def build_option_parser(parser):
     #     help='Identity API version, default=' +
     #          DEFAULT_API_VERSION +
     #          ' (Env: OS_IDENTITY_API_VERSION)')
-    return auth.build_auth_plugins_option_parser(parser)
+    # The authentication options are added by the shell, so that this
+    # module is only imported for commands using the identity client
+    return parser
 
 
 class IdentityClientv2(identity_client_v2.Client):
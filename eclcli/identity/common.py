@@ -15,16 +15,28 @@
 
 """Common identity code"""
 
+import logging
+import os
+
 from keystoneclient import exceptions as identity_exc
 from keystoneclient.v3 import domains
 from keystoneclient.v3 import groups
 from keystoneclient.v3 import projects
 from keystoneclient.v3 import users
 
+from eclcli.common import cache
 from eclcli.common import exceptions
+from eclcli.common import parallel
 from eclcli.common import utils
 
 
+LOG = logging.getLogger(__name__)
+
+# Project names shown next to IDs, shared by the commands needing them
+PROJECT_CACHE_FILE = 'project_names.json'
+PROJECT_CACHE_TTL = 3600
+
+
 def find_service(identity_client, name_type_or_id):
     """Find a service by id, name or type."""
 
@@ -48,6 +60,80 @@ def find_service(identity_client, name_type_or_id):
             raise exceptions.CommandError(msg)
 
 
+def _list_project_names(identity_client):
+    # Identity v2 calls projects tenants
+    manager = getattr(identity_client, 'tenants', None)
+    if manager is None:
+        manager = identity_client.projects
+    return dict((p.id, p.name) for p in manager.list())
+
+
+class ProjectNames(object):
+    """Map project IDs to names for display
+
+    The map is kept in the user cache directory for PROJECT_CACHE_TTL
+    seconds per cloud and project. On a miss the project list is fetched
+    in the background from the moment the object is created, overlapping
+    the command's own requests. Failures are ignored, IDs are then shown
+    as they are.
+    """
+
+    def __init__(self, app):
+        self._cache = cache.TTLCache(
+            os.path.join(app.cache_dir, PROJECT_CACHE_FILE),
+            PROJECT_CACHE_TTL)
+        self._scope = app.client_manager.cache_scope
+        self._client_manager = app.client_manager
+        self._pending = None
+        self._fetched = False
+        self._names = self._cache.get(self._scope)
+        if self._names is None:
+            self._names = {}
+            try:
+                self._pending = parallel.prefetch(
+                    _list_project_names, app.client_manager.identity)
+            except Exception as e:
+                LOG.debug('Unable to list projects: %s', e)
+                self._fetched = True
+
+    def _fetch(self, result, project_ids):
+        self._fetched = True
+        try:
+            names = result()
+        except Exception as e:
+            LOG.debug('Unable to list projects: %s', e)
+            return
+        # Remember unknown IDs too, e.g. of deleted projects, so they do
+        # not trigger a new project list every time
+        for project_id in project_ids:
+            names.setdefault(project_id, None)
+        self._names = names
+        self._cache.set(self._scope, names)
+
+    def get_names(self, project_ids=()):
+        """Return a dict of project ID to name, or None if unknown
+
+        Pass all the IDs about to be shown, a single project list is then
+        enough for all of them.
+        """
+        project_ids = set(p for p in project_ids if p)
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            self._fetch(pending.result, project_ids)
+        elif not (self._fetched or project_ids.issubset(self._names)):
+            # A project was added since the names were cached, list them
+            # again once
+            self._fetch(lambda: _list_project_names(
+                self._client_manager.identity), project_ids)
+        return self._names
+
+    def format(self, project_id):
+        """Return the name of project_id, or the ID if it is unknown"""
+        if not project_id:
+            return ""
+        return self.get_names([project_id]).get(project_id) or project_id
+
+
 def _get_domain_id_if_requested(identity_client, domain_name_or_id):
     if not domain_name_or_id:
         return None
@@ -22,6 +22,7 @@ from keystoneauth1 import exceptions as ks_exc
 from eclcli.common import command
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
+from eclcli.identity import common as identity_common
 
 
 class CreateUser(command.ShowOne):
@@ -166,14 +167,6 @@ class ListUser(command.Lister):
     def take_action(self, parsed_args):
         identity_client = self.app.client_manager.identity
 
-        def _format_project(project):
-            if not project:
-                return ""
-            if project in project_cache.keys():
-                return project_cache[project].name
-            else:
-                return project
-
         project = None
         if parsed_args.project:
             project = utils.find_resource(
@@ -197,16 +190,12 @@ class ListUser(command.Lister):
                 'Email',
                 'Enabled',
             )
-            # Cache the project list
-            project_cache = {}
-            try:
-                for p in identity_client.tenants.list():
-                    project_cache[p.id] = p
-            except Exception:
-                # Just forget it if there's any trouble
-                pass
+            # Project names are listed along with the users
+            project_names = identity_common.ProjectNames(self.app)
+            formatters = {'tenantId': project_names.format}
         else:
             columns = column_headers = ('ID', 'Name')
+            formatters = {}
         data = identity_client.users.list(tenant_id=project)
 
         if parsed_args.project:
@@ -224,12 +213,13 @@ class ListUser(command.Lister):
                 if 'tenant_id' in d._info:
                     d._info['tenantId'] = d._info.pop('tenant_id')
                     d._add_details(d._info)
+            project_names.get_names(d._info.get('tenantId') for d in data)
 
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
                     mixed_case_fields=('tenantId',),
-                    formatters={'tenantId': _format_project},
+                    formatters=formatters,
                 ) for s in data))
 
 
@@ -17,8 +17,6 @@ import logging
 
 from eclcli.common import utils
 
-from . import extensions
-
 
 LOG = logging.getLogger(__name__)
 
@@ -39,6 +37,10 @@ IMAGE_API_VERSIONS = {
 
 def make_client(instance):
     """Returns an image service client"""
+
+    # Defer client import until we actually need them
+    from eclcli.image import extensions
+
     image_client = utils.get_client_class(
         API_NAME,
         instance._api_version[API_NAME],
@@ -16,13 +16,28 @@
 """Image V2 Action Implementations"""
 
 import argparse
+import errno
+import hashlib
+import json
+import mmap
+import os
+import stat
+import sys
+import threading
+import time
+
+import requests
 import six
 
-from glanceclient.common import utils as gc_utils
+from glanceclient import exc as gc_exc
 
+from eclcli.api import image_v2
 from eclcli.api import utils as api_utils
+from eclcli.common import cache
 from eclcli.common import command
 from eclcli.common import exceptions
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import parseractions
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
@@ -32,6 +47,24 @@ from eclcli.identity import common
 DEFAULT_CONTAINER_FORMAT = 'bare'
 DEFAULT_DISK_FORMAT = 'raw'
 
+# Bytes read and hashed at a time during a transfer
+TRANSFER_BLOCK_SIZE = 8 * 1024 * 1024
+UPLOAD_RETRIES = 3
+# Upload failures after which the image may still take the data again
+_TRANSIENT_ERRORS = (gc_exc.CommunicationError, gc_exc.HTTPBadGateway,
+                     gc_exc.HTTPServiceUnavailable)
+_MiB = 1024.0 * 1024.0
+DOWNLOAD_PARALLEL = 4
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BUFFER_SIZE = 8
+# Smallest part of an image worth a range request of its own
+MIN_RANGE_SIZE = 64 * 1024 * 1024
+# Seconds between two saves of the state of a download
+_STATE_INTERVAL = 2.0
+_DOWNLOAD_ERRORS = _TRANSIENT_ERRORS + (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError)
+
 
 def _format_image(image):
     """Format an image to make it more consistent with OSC operations. """
@@ -63,6 +96,477 @@ def _format_image(image):
     return info
 
 
+def _format_size(size):
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024:
+            return '%.1f %s' % (size, unit)
+        size /= 1024.0
+    return '%.1f TiB' % size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+
+
+class _Progress(object):
+    """Count the bytes of a transfer, report them and hold them to a rate
+
+    :param total: size of the transfer in bytes, None if unknown
+    :param show: write the progress to stderr
+    :param limit_rate: MiB per second not to exceed, None for no limit
+    """
+
+    interval = 0.5
+
+    def __init__(self, total=None, show=False, limit_rate=None):
+        self.total = total
+        self.show = show
+        self.limit_rate = limit_rate * _MiB if limit_rate else None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.done = 0
+        self.start = time.time()
+        self._shown = 0.0
+
+    @property
+    def elapsed(self):
+        return max(time.time() - self.start, 1e-6)
+
+    @property
+    def rate(self):
+        return self.done / self.elapsed
+
+    def update(self, count):
+        with self._lock:
+            self.done += count
+            show = self.show and time.time() - self._shown >= self.interval
+            if show:
+                self._shown = time.time()
+                self._write('\r')
+        if self.limit_rate:
+            ahead = self.done / self.limit_rate - self.elapsed
+            if ahead > 0:
+                time.sleep(ahead)
+
+    def finish(self):
+        if self.show:
+            self._write('\r')
+            sys.stderr.write('\n')
+
+    def _write(self, prefix):
+        if self.total:
+            done = '%3d%% %s of %s' % (100 * self.done // self.total,
+                                       _format_size(self.done),
+                                       _format_size(self.total))
+        else:
+            done = _format_size(self.done)
+        sys.stderr.write('%s%s, %.1f MiB/s ' % (prefix, done,
+                                                self.rate / _MiB))
+        sys.stderr.flush()
+
+
+class _ImageReader(object):
+    """File object feeding an image upload
+
+    The file is read TRANSFER_BLOCK_SIZE bytes at a time, straight from a
+    memory map for regular files, and every block is hashed with md5 and
+    sha256 as it goes out. rewind() starts over for another attempt.
+    """
+
+    def __init__(self, path, show_progress=False, limit_rate=None):
+        self._file = open(path, 'rb')
+        self._map = None
+        info = os.fstat(self._file.fileno())
+        self.size = None
+        if stat.S_ISREG(info.st_mode):
+            self.size = info.st_size
+            if self.size:
+                self._map = mmap.mmap(self._file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+        self.progress = _Progress(self.size, show_progress, limit_rate)
+        self.rewind()
+
+    @property
+    def seekable(self):
+        return self.size is not None
+
+    def rewind(self):
+        if self._map is None and self.seekable:
+            self._file.seek(0)
+        self._offset = 0
+        self._block = memoryview(b'')
+        self._pos = 0
+        self.eof = False
+        self.md5 = hashlib.md5()
+        self.sha256 = hashlib.sha256()
+        self.progress.reset()
+
+    def _next_block(self):
+        if self._map is not None:
+            block = memoryview(self._map)[
+                self._offset:self._offset + TRANSFER_BLOCK_SIZE]
+        else:
+            block = memoryview(self._file.read(TRANSFER_BLOCK_SIZE))
+        self._offset += len(block)
+        self.md5.update(block)
+        self.sha256.update(block)
+        self._block, self._pos = block, 0
+        if not len(block):
+            self.eof = True
+
+    def read(self, size=-1):
+        if self._pos >= len(self._block):
+            if self.eof:
+                return b''
+            self._next_block()
+        if size is None or size < 0:
+            size = len(self._block)
+        data = self._block[self._pos:self._pos + size].tobytes()
+        self._pos += len(data)
+        self.progress.update(len(data))
+        return data
+
+    def hexdigests(self):
+        """Return the md5 and sha256 of the whole file
+
+        What the upload did not read yet is hashed too, for when the data
+        reached the image although the request failed.
+        """
+        while not self.eof:
+            self._pos = len(self._block)
+            self._next_block()
+        return self.md5.hexdigest(), self.sha256.hexdigest()
+
+    def close(self):
+        self._block = None
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _ShortRead(Exception):
+    pass
+
+
+class _Segment(object):
+    """Bytes start to end of an image, done of which are downloaded"""
+
+    def __init__(self, start, end, done=0):
+        self.start = start
+        self.end = end
+        self.done = done
+        self.finished = end is not None and done >= end - start
+
+    @property
+    def size(self):
+        return None if self.end is None else self.end - self.start
+
+    def __str__(self):
+        return 'bytes %d-%s' % (self.start, '' if self.end is None
+                                else self.end - 1)
+
+
+class _ImageDownload(object):
+    """Download of the data of an image, checked against its checksum
+
+    save() writes the image to <file>.part, preallocated, in ranges
+    fetched concurrently when the endpoint answers range requests. The
+    state of the ranges is kept in <file>.part.json so that a later run
+    picks up where an interrupted one stopped, and each range resumes on
+    its own after a connection failure. The md5 is computed while the
+    data arrives, following it in file order. An endpoint that ignores
+    ranges gets no state file, and a failed attempt starts over from the
+    first byte.
+    """
+
+    def __init__(self, image_client, image, log, buffer_size=None,
+                 retries=0, progress=None):
+        self.client = image_client
+        self.image = image
+        self.log = log
+        self.url = '/v2/images/%s/file' % image['id']
+        self.size = image.get('size')
+        self.buffer_size = buffer_size or \
+            DOWNLOAD_BUFFER_SIZE * 1024 * 1024
+        self.retries = retries
+        self.progress = progress or _Progress(self.size)
+        self.md5 = hashlib.md5()
+        self._changed = threading.Condition()
+        self._failed = False
+        self._ranges_ignored = False
+
+    def _get(self, start=None, end=None):
+        headers = {}
+        if start is not None:
+            headers['Range'] = 'bytes=%d-%s' % (
+                start, '' if end is None else end - 1)
+        resp, _body = self.client.http_client.get(self.url, headers=headers)
+        if resp.status_code == 204:
+            raise exceptions.CommandError(
+                "Image %s has no data" % self.image['id'])
+        return resp
+
+    def _fetch(self, segment, write, resp=None, restart=None):
+        """Call write(offset, data) for the bytes of segment not done yet
+
+        resp is an answer already received for the segment, if any.
+        Without restart() the data left is requested as a range, with it
+        the endpoint takes no ranges and restart() is called before the
+        whole image is fetched again.
+        """
+        attempt = 0
+        while not segment.finished:
+            try:
+                if resp is None and restart is not None:
+                    restart()
+                    with self._changed:
+                        segment.done = 0
+                    resp = self._get()
+                elif resp is None:
+                    resp = self._get(segment.start + segment.done,
+                                     segment.end)
+                    if resp.status_code != 206:
+                        resp.close()
+                        self._ranges_ignored = True
+                        raise exceptions.CommandError(
+                            "The image endpoint ignored the request for "
+                            "%s" % segment)
+                try:
+                    for data in resp.iter_content(self.buffer_size):
+                        if segment.size is not None:
+                            data = data[:segment.size - segment.done]
+                        write(segment.start + segment.done, data)
+                        with self._changed:
+                            segment.done += len(data)
+                            self._changed.notify_all()
+                        self.progress.update(len(data))
+                finally:
+                    resp.close()
+                    resp = None
+                if segment.size is not None and segment.done < segment.size:
+                    raise _ShortRead('connection closed after %d of %d '
+                                     'bytes' % (segment.done, segment.size))
+                with self._changed:
+                    segment.finished = True
+                    self._changed.notify_all()
+            except _DOWNLOAD_ERRORS + (_ShortRead,) as e:
+                if attempt >= self.retries or \
+                        segment.size is None and restart is None:
+                    raise
+                attempt += 1
+                self.log.warning('Download of %s failed, resuming (%d of '
+                                 '%d): %s', segment, attempt, self.retries, e)
+                time.sleep(min(2 ** attempt, 30))
+
+    def _verify(self):
+        md5 = self.md5.hexdigest()
+        checksum = self.image.get('checksum')
+        if checksum and checksum != md5:
+            raise exceptions.CommandError(
+                "Checksum of image %s is %s, the downloaded data's is %s" %
+                (self.image['id'], checksum, md5))
+        return md5
+
+    def stream(self, out):
+        """Write the image to the file object out, return its md5"""
+        def _write(_offset, data):
+            out.write(data)
+            self.md5.update(data)
+
+        # Resuming would need the endpoint to take ranges, which is only
+        # known once the first answer is in
+        segment = _Segment(0, self.size)
+        self._fetch(segment, _write, self._get())
+        out.flush()
+        return self._verify()
+
+    def save(self, path, ranges=DOWNLOAD_PARALLEL):
+        """Download the image to path, return its md5"""
+        part_path = path + '.part'
+        state_path = os.path.abspath(part_path + '.json')
+        segments = self._load_state(part_path, state_path)
+        ranged = True
+        resp = None
+        if segments is None:
+            # The answer to the first range tells whether there can be
+            # more
+            count = 1
+            if self.size:
+                count = max(1, min(ranges, self.size // MIN_RANGE_SIZE))
+            if count > 1:
+                resp = self._get(0, self.size // count)
+            else:
+                resp = self._get()
+            ranged = resp.status_code == 206
+            if ranged:
+                bounds = [self.size * i // count for i in range(count)]
+                segments = [_Segment(start, end) for start, end in
+                            zip(bounds, bounds[1:] + [self.size])]
+            else:
+                segments = [_Segment(0, self.size)]
+                # Nothing of it could be resumed
+                _remove(state_path)
+
+        fd = os.open(part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if resp is not None:
+                self._preallocate(fd)
+
+            def _write(offset, data):
+                os.pwrite(fd, data, offset)
+                if not ranged:
+                    self.md5.update(data)
+
+            def _restart():
+                self.log.warning('The image endpoint takes no ranges, '
+                                 'downloading image %s from the start',
+                                 self.image['id'])
+                self._preallocate(fd)
+                self.md5 = hashlib.md5()
+                self.progress.reset()
+
+            def _fetch(segment):
+                first = resp if segment is segments[0] else None
+                try:
+                    self._fetch(segment, _write, first,
+                                None if ranged else _restart)
+                finally:
+                    if first is not None:
+                        first.close()
+
+            if ranged:
+                self._fetch_ranges(fd, state_path, segments, _fetch, ranges)
+            else:
+                _fetch(segments[0])
+        except exceptions.CommandError:
+            if self._ranges_ignored:
+                # The endpoint stopped taking ranges, what was saved can
+                # only be thrown away for the next run to start over
+                for stale in (part_path, state_path):
+                    _remove(stale)
+            raise
+        finally:
+            os.close(fd)
+
+        try:
+            md5 = self._verify()
+        except exceptions.CommandError:
+            # The next run must not resume corrupted data
+            for stale in (part_path, state_path):
+                _remove(stale)
+            raise
+        os.rename(part_path, path)
+        _remove(state_path)
+        return md5
+
+    def _fetch_ranges(self, fd, state_path, segments, fetch, ranges):
+        """Run fetch on each segment, hashing and saving state meanwhile"""
+        hasher = threading.Thread(target=self._hash, args=(fd, segments))
+        hasher.daemon = True
+        hasher.start()
+        stop = threading.Event()
+        saver = threading.Thread(target=self._save_state,
+                                 args=(state_path, segments, stop))
+        saver.daemon = True
+        saver.start()
+        try:
+            parallel.run_each(fetch, segments,
+                              parallel=min(len(segments), ranges),
+                              action='download', log=self.log)
+        except BaseException:
+            with self._changed:
+                self._failed = True
+                self._changed.notify_all()
+            raise
+        finally:
+            hasher.join()
+            stop.set()
+            saver.join()
+            self._write_state(state_path, segments)
+
+    def _preallocate(self, fd):
+        os.ftruncate(fd, 0)
+        if not self.size:
+            return
+        try:
+            os.posix_fallocate(fd, 0, self.size)
+        except (AttributeError, OSError):
+            # Not every platform and file system can, a sparse file will do
+            os.ftruncate(fd, self.size)
+
+    def _load_state(self, part_path, state_path):
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+            if not state.get('ranged') or \
+                    state.get('image_id') != self.image['id'] or \
+                    state.get('checksum') != self.image.get('checksum') or \
+                    not self.size or state.get('size') != self.size or \
+                    os.path.getsize(part_path) != self.size:
+                return None
+            segments = [_Segment(*s) for s in state['segments']]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return None
+        self.log.info('Resuming the download of image %s, %s already done',
+                      self.image['id'],
+                      _format_size(sum(s.done for s in segments)))
+        return segments
+
+    def _write_state(self, state_path, segments):
+        with self._changed:
+            state = {
+                'image_id': self.image['id'],
+                'size': self.size,
+                'checksum': self.image.get('checksum'),
+                # Only downloads in ranges are resumed
+                'ranged': True,
+                'segments': [[s.start, s.end, s.done] for s in segments],
+            }
+        try:
+            cache.write_json(state_path, state)
+        except (IOError, OSError) as e:
+            self.log.debug('Unable to save %s: %s', state_path, e)
+
+    def _save_state(self, state_path, segments, stop):
+        while not stop.wait(_STATE_INTERVAL):
+            self._write_state(state_path, segments)
+
+    def _hash(self, fd, segments):
+        """Hash the file in order as the segments fill up"""
+        for segment in segments:
+            position = segment.start
+            while True:
+                with self._changed:
+                    while not (self._failed or segment.finished or
+                               segment.start + segment.done > position):
+                        self._changed.wait()
+                    if self._failed:
+                        return
+                    available = segment.start + segment.done
+                    finished = segment.finished
+                while position < available:
+                    data = os.pread(fd, min(self.buffer_size,
+                                            available - position), position)
+                    if not data:
+                        return
+                    self.md5.update(data)
+                    position += len(data)
+                if finished and position >= available:
+                    break
+
+
 class CopyImage(command.ShowOne):
     _description = _("Copy of image")
     def get_parser(self, prog_name):
@@ -301,6 +805,28 @@ class CreateImage(command.ShowOne):
             metavar="<file>",
             help="Upload image from local file",
         )
+        parser.add_argument(
+            "--progress",
+            action="store_true",
+            default=False,
+            help="Show the progress and throughput of the upload",
+        )
+        parser.add_argument(
+            "--limit-rate",
+            metavar="<MiB/s>",
+            type=float,
+            default=None,
+            help="Upload at most this many MiB per second",
+        )
+        parser.add_argument(
+            "--retries",
+            metavar="<count>",
+            type=int,
+            default=UPLOAD_RETRIES,
+            help="Times the upload starts over after a connection error, "
+                 "a 502 or a 503 while the image can still take the data "
+                 "(default: %d)" % UPLOAD_RETRIES,
+        )
         parser.add_argument(
             "--volume",
             metavar="<volume>",
@@ -446,7 +972,9 @@ class CreateImage(command.ShowOne):
         # image is created
         fp = None
         if parsed_args.file:
-            fp = open(parsed_args.file, 'rb')
+            fp = _ImageReader(parsed_args.file,
+                              show_progress=parsed_args.progress,
+                              limit_rate=parsed_args.limit_rate)
         info = {}
         if fp is not None and parsed_args.volume:
             raise exceptions.CommandError("Uploading data and using container "
@@ -485,7 +1013,7 @@ class CreateImage(command.ShowOne):
         if fp is not None:
             with fp:
                 try:
-                    image_client.images.upload(image.id, fp)
+                    self._upload(image_client, image, fp, parsed_args.retries)
                 except Exception as e:
                     # If the upload fails for some reason attempt to remove the
                     # dangling queued image made by the create() call above but
@@ -506,6 +1034,52 @@ class CreateImage(command.ShowOne):
 
         return zip(*sorted(six.iteritems(info)))
 
+    def _upload(self, image_client, image, fp, retries):
+        """Upload the data of fp and check it arrived intact
+
+        Glance takes the data of an image in one request, a failed upload
+        starts over from the beginning of the file as long as the image
+        is still queued.
+        """
+        attempt = 0
+        while True:
+            try:
+                image_client.images.upload(image.id, fp)
+                break
+            except _TRANSIENT_ERRORS as e:
+                if attempt >= retries or not fp.seekable:
+                    raise
+                status = image_client.images.get(image.id).status
+                # The data may have arrived although the answer did not,
+                # the checksums below tell
+                if status == 'active':
+                    break
+                if status != 'queued':
+                    raise
+                attempt += 1
+                self.log.warning('Upload of image %s failed, starting over '
+                                 '(%d of %d): %s', image.id, attempt,
+                                 retries, e)
+                time.sleep(min(2 ** attempt, 30))
+                fp.rewind()
+        fp.progress.finish()
+        self.log.info('Uploaded %s in %.1f s, %.1f MiB/s',
+                      _format_size(fp.progress.done), fp.progress.elapsed,
+                      fp.progress.rate / _MiB)
+
+        md5, sha256 = fp.hexdigests()
+        uploaded = image_client.images.get(image.id)
+        if uploaded.get('checksum') and uploaded['checksum'] != md5:
+            raise exceptions.CommandError(
+                "Checksum of image %s is %s, the file's is %s" %
+                (image.id, uploaded['checksum'], md5))
+        if uploaded.get('os_hash_algo') == 'sha256' and \
+                uploaded.get('os_hash_value') != sha256:
+            raise exceptions.CommandError(
+                "sha256 of image %s is %s, the file's is %s" %
+                (image.id, uploaded.get('os_hash_value'), sha256))
+        self.log.info('Image %s md5 %s sha256 %s', image.id, md5, sha256)
+
 
 class DeleteImage(command.Command):
     """Delete image(s)"""
@@ -518,17 +1092,26 @@ class DeleteImage(command.Command):
             nargs="+",
             help="Image(s) to delete (name or ID)",
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         image_client = self.app.client_manager.image
-        for image in parsed_args.images:
+
+        def _delete(image):
             image_obj = utils.find_resource(
                 image_client.images,
                 image,
             )
             image_client.images.delete(image_obj.id)
 
+        parallel.run_each(
+            _delete,
+            parsed_args.images,
+            parallel=parsed_args.parallel,
+            action='delete image',
+            log=self.log,
+        )
+
 
 class ListImage(command.Lister):
     """List available images"""
@@ -570,12 +1153,13 @@ class ListImage(command.Lister):
             help='List additional fields in output',
         )
 
-        # --page-size has never worked, leave here for silent compatibility
-        # We'll implement limit/marker differently later
         parser.add_argument(
             "--page-size",
             metavar="<size>",
-            help=argparse.SUPPRESS,
+            type=int,
+            default=None,
+            help="Number of images to request per page "
+                 "(default: server limit)",
         )
         parser.add_argument(
             '--sort',
@@ -588,8 +1172,8 @@ class ListImage(command.Lister):
             "--limit",
             metavar="<limit>",
             type=int,
-            default=1000,
-            help="Maximum number of images to display.",
+            default=None,
+            help="Maximum number of images to display (default: all).",
         )
         parser.add_argument(
             '--marker',
@@ -611,8 +1195,6 @@ class ListImage(command.Lister):
             kwargs['private'] = True
         if parsed_args.shared:
             kwargs['shared'] = True
-        if parsed_args.limit:
-            kwargs['limit'] = parsed_args.limit
         if parsed_args.marker:
             kwargs['marker'] = utils.find_resource(image_client.images,
                                                    parsed_args.marker).id
@@ -646,20 +1228,33 @@ class ListImage(command.Lister):
             columns = ("ID", "Name", "Status")
             column_headers = columns
 
-        # List of image data received
-        data = image_client.api.image_list(**kwargs)
+        # Let the server sort when it can, so pages stream in order
+        sort_keys = utils.parse_sort_str(parsed_args.sort)
+        server_sort = all(k in image_v2.SORT_KEYS for k, _d in sort_keys)
+        if sort_keys and server_sort:
+            kwargs['sort_key'] = [k for k, _d in sort_keys]
+            kwargs['sort_dir'] = [d for _k, d in sort_keys]
+
+        page_size = parsed_args.page_size
+        if not page_size and not parsed_args.property:
+            page_size = parsed_args.limit
+
+        # Image data is received one page at a time
+        data = image_client.api.image_iter(page_size=page_size, **kwargs)
 
         if parsed_args.property:
             # NOTE(dtroyer): coerce to a list to subscript it in py3
             attr, value = list(parsed_args.property.items())[0]
-            api_utils.simple_filter(
+            data = api_utils.filter_items(
                 data,
                 attr=attr,
                 value=value,
                 property_field='properties',
             )
 
-        data = utils.sort_items(data, parsed_args.sort)
+        if not server_sort:
+            data = utils.sort_items(data, parsed_args.sort)
+        data = pagination.limit_items(data, parsed_args.limit)
 
         return (
             column_headers,
@@ -723,6 +1318,37 @@ class SaveImage(command.Command):
             metavar="<image>",
             help="Image to save (name or ID)",
         )
+        parser.add_argument(
+            "--parallel",
+            metavar="<count>",
+            type=int,
+            default=DOWNLOAD_PARALLEL,
+            help="Number of ranges of the image downloaded concurrently "
+                 "into --file (default: %d, max: %d)" %
+                 (DOWNLOAD_PARALLEL, parallel.MAX_PARALLEL),
+        )
+        parser.add_argument(
+            "--buffer-size",
+            metavar="<MiB>",
+            type=int,
+            default=DOWNLOAD_BUFFER_SIZE,
+            help="Size of the reads and writes, in MiB "
+                 "(default: %d)" % DOWNLOAD_BUFFER_SIZE,
+        )
+        parser.add_argument(
+            "--retries",
+            metavar="<count>",
+            type=int,
+            default=DOWNLOAD_RETRIES,
+            help="Times each range resumes after a connection error, a 502 "
+                 "or a 503 (default: %d)" % DOWNLOAD_RETRIES,
+        )
+        parser.add_argument(
+            "--progress",
+            action="store_true",
+            default=False,
+            help="Show the progress and throughput of the download",
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -731,9 +1357,26 @@ class SaveImage(command.Command):
             image_client.images,
             parsed_args.image,
         )
-        data = image_client.images.data(image.id)
-
-        gc_utils.save_image(data, parsed_args.file)
+        if parsed_args.buffer_size < 1:
+            raise exceptions.CommandError("--buffer-size must be positive")
+
+        download = _ImageDownload(
+            image_client, image, self.log,
+            buffer_size=parsed_args.buffer_size * 1024 * 1024,
+            retries=parsed_args.retries,
+            progress=_Progress(image.get('size'), parsed_args.progress))
+        if parsed_args.file is None:
+            # NOTE(kragniz): for py3 compatibility: sys.stdout.buffer is
+            # only present on py3, otherwise fall back to sys.stdout
+            md5 = download.stream(getattr(sys.stdout, 'buffer', sys.stdout))
+        else:
+            md5 = download.save(parsed_args.file, max(
+                1, min(parsed_args.parallel, parallel.MAX_PARALLEL)))
+        download.progress.finish()
+        self.log.info('Downloaded %s in %.1f s, %.1f MiB/s, md5 %s',
+                      _format_size(download.progress.done),
+                      download.progress.elapsed,
+                      download.progress.rate / _MiB, md5)
 
 
 class SetImage(command.Command):
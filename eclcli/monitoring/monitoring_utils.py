@@ -1,6 +1,13 @@
 # Functions used to do the format work
+from concurrent import futures
+import threading
+
+from six.moves import queue
 from six.moves import urllib
 
+# Pages a background fetch may hold before they are consumed
+PAGES_AHEAD = 2
+
 
 def _format_subdict(dict_x, list_it=True):
     if dict_x is None:
@@ -357,3 +364,71 @@ def _print_resp_error(body):
         return error_msg
     except Exception:
         return body
+
+
+def _iter_pages(list_page, per_page, page=1):
+    """
+    Yield the pages of a paginated list call, from page onwards
+    :param list_page: callable taking a page number, returning its items
+    :param per_page: page size, a shorter page is the last one
+    """
+    per_page = int(per_page)
+    while True:
+        items = list_page(page)
+        if items:
+            yield items
+        if len(items) < per_page:
+            return
+        page += 1
+
+
+def _put(pages, item, stop):
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _stream_pages(page_iters, parallel=1):
+    """
+    Yield the items of each iterable of pages, one iterable after another
+    Pages are fetched in background threads, up to parallel iterables at
+    a time, each at most PAGES_AHEAD pages ahead of the caller, so the
+    next page is usually there when the current one is consumed.
+    """
+    page_iters = list(page_iters)
+    if not page_iters:
+        return
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=PAGES_AHEAD) for _ in page_iters]
+
+    def _fetch(pages, out):
+        try:
+            for page in pages:
+                if not _put(out, (page, None), stop):
+                    return
+            _put(out, (None, None), stop)
+        except Exception as e:
+            _put(out, (None, e), stop)
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max(1, min(parallel or 1, len(page_iters))))
+    try:
+        for pages, out in zip(page_iters, queues):
+            executor.submit(_fetch, pages, out)
+        for out in queues:
+            while True:
+                page, error = out.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    break
+                for item in page:
+                    yield item
+    finally:
+        # Let the threads still fetching give up when the caller stops
+        stop.set()
+        executor.shutdown(wait=False)
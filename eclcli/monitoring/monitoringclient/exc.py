@@ -120,4 +120,7 @@ for obj_name in dir(sys.modules[__name__]):
 def from_response(response, details=None):
     """Return an instance of an HTTPException based on httplib response."""
     cls = _code_map.get(response.status_code, HTTPException)
-    return cls(details)
+    error = cls(details)
+    # Codes without a class of their own are only known from this
+    error.status_code = response.status_code
+    return error
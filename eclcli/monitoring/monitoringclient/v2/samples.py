@@ -23,7 +23,9 @@ CREATION_ATTRIBUTES = ('source',
                        'project_id',
                        'resource_id',
                        'timestamp',
-                       'resource_metadata')
+                       'resource_metadata',
+                       'namespace',
+                       'recorded_at')
 
 
 class OldSample(base.Resource):
@@ -13,13 +13,37 @@
 #   under the License.
 #
 
+from concurrent import futures
+import csv
+import json
+import os
+import sys
+import threading
+import time
+
+from keystoneauth1 import exceptions as ka_exc
+from six.moves import queue
+
 from eclcli.common import command
+from eclcli.common import exceptions
+from eclcli.common import parallel
 from eclcli.common import utils
 from .. import monitoring_utils
+from ..monitoringclient import exc
 import six
 import datetime
 
 
+# Samples sent in one request, the API takes a list per meter
+PUSH_BATCH_SIZE = 100
+# Seconds a sample may wait for its batch to fill up
+PUSH_BATCH_INTERVAL = 1.0
+PUSH_RETRIES = 3
+# Status codes worth sending a batch again for
+_RETRY_STATUS = (429, 502, 503, 504)
+SAMPLE_FORMATS = ('json', 'csv')
+
+
 class ListMeter(command.Lister):
     """List all metadata for server"""
 
@@ -140,6 +164,13 @@ class ListMeterStatistics(command.Lister):
             default=100,
             type=int,
         )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            default=False,
+            help="List the statistics of every page from --page on, "
+                 "fetching the pages in the background",
+        )
 
         return parser
 
@@ -150,13 +181,22 @@ class ListMeterStatistics(command.Lister):
             return {}, {}
 
         monitoring_client = self.app.client_manager.monitoring
-        data = monitoring_client.statistics.list(
-            meter_name=parsed_args.meter_name,
-            q=q,
-            period=parsed_args.period,
-            page=parsed_args.page,
-            per_page=parsed_args.per_page,
-        )
+
+        def _list(page):
+            return monitoring_client.statistics.list(
+                meter_name=parsed_args.meter_name,
+                q=q,
+                period=parsed_args.period,
+                page=page,
+                per_page=parsed_args.per_page,
+            )
+
+        if parsed_args.all:
+            data = monitoring_utils._stream_pages([
+                monitoring_utils._iter_pages(
+                    _list, parsed_args.per_page, page=parsed_args.page)])
+        else:
+            data = _list(parsed_args.page)
 
         columns = (
             'period',
@@ -273,3 +313,253 @@ class CreateMeter(command.ShowOne):
         )
         info = monitoring_utils._tidy_data_info(data._info)
         return zip(*sorted(six.iteritems(info)))
+
+
+class PushMeter(command.ShowOne):
+    """Push many custom meter samples read from a file or stdin
+
+    Samples are read one per line, as JSON objects or CSV rows with a
+    header, with the fields of "monitor meter create": counter_name (or
+    custom_meter_name), resource_id and counter_volume are required.
+    They are sent in batches of one meter, each batch as soon as it is
+    full or its first sample has waited --batch-interval seconds, so a
+    never ending stream can be piped in.
+    """
+
+    def get_parser(self, prog_name):
+        parser = super(PushMeter, self).get_parser(prog_name)
+        parser.add_argument(
+            "file",
+            metavar="<file>",
+            nargs="?",
+            default="-",
+            help="File of samples (default: stdin)",
+        )
+        parser.add_argument(
+            "--file-format",
+            metavar="<format>",
+            choices=SAMPLE_FORMATS,
+            default=None,
+            help="json (one object per line) or csv; guessed from the file "
+                 "name, json by default",
+        )
+        parser.add_argument(
+            "--batch-size",
+            metavar="<count>",
+            type=int,
+            default=PUSH_BATCH_SIZE,
+            help="Samples of one meter sent per request "
+                 "(default: %d)" % PUSH_BATCH_SIZE,
+        )
+        parser.add_argument(
+            "--batch-interval",
+            metavar="<seconds>",
+            type=float,
+            default=PUSH_BATCH_INTERVAL,
+            help="Longest time a sample waits before its batch is sent "
+                 "(default: %s)" % PUSH_BATCH_INTERVAL,
+        )
+        parser.add_argument(
+            "--retries",
+            metavar="<count>",
+            type=int,
+            default=PUSH_RETRIES,
+            help="Times a batch is sent again after a connection error or "
+                 "a 429, 502, 503 or 504 response (default: %d)"
+                 % PUSH_RETRIES,
+        )
+        parallel.add_parallel_option(parser)
+        parallel.add_rate_option(parser)
+        return parser
+
+    def run(self, parsed_args):
+        result = super(PushMeter, self).run(parsed_args)
+        return 1 if self._failed else result
+
+    def take_action(self, parsed_args):
+        if parsed_args.batch_size < 1:
+            raise exceptions.CommandError("--batch-size must be positive")
+        file_format = parsed_args.file_format
+        if not file_format:
+            ext = os.path.splitext(parsed_args.file)[1].lower()
+            file_format = 'csv' if ext == '.csv' else 'json'
+
+        if parsed_args.file == '-':
+            stats = self._push(sys.stdin, file_format, parsed_args)
+        else:
+            try:
+                with open(parsed_args.file) as f:
+                    stats = self._push(f, file_format, parsed_args)
+            except IOError as e:
+                msg = "Error reading sample file %s: %s"
+                raise exceptions.CommandError(msg % (parsed_args.file, e))
+
+        self._failed = stats['failed'] or stats['invalid']
+        seconds = stats['seconds']
+        info = {
+            'Samples': stats['pushed'],
+            'Requests': stats['requests'],
+            'Retries': stats['retries'],
+            'Failed Samples': stats['failed'],
+            'Invalid Lines': stats['invalid'],
+            'Seconds': '%.3f' % seconds,
+            'Samples/s': '%.1f' % (stats['pushed'] / seconds
+                                   if seconds else 0.0),
+        }
+        return zip(*sorted(six.iteritems(info)))
+
+    def _push(self, lines, file_format, parsed_args):
+        monitoring_client = self.app.client_manager.monitoring
+        stats = {'pushed': 0, 'requests': 0, 'retries': 0, 'failed': 0,
+                 'invalid': 0}
+        lock = threading.Lock()
+        limiter = parallel.RateLimiter(parsed_args.rate)
+        workers = max(1, min(parsed_args.parallel or 1,
+                             parallel.MAX_PARALLEL))
+        # Keep reading only while a few batches wait for a worker
+        slots = threading.Semaphore(workers * 2)
+
+        def _post(samples):
+            for attempt in range(parsed_args.retries + 1):
+                limiter.wait()
+                with lock:
+                    stats['requests'] += 1
+                try:
+                    return monitoring_client.old_samples.create_list(samples)
+                except Exception as e:
+                    if attempt == parsed_args.retries or \
+                            not _is_transient(e):
+                        raise
+                    self.log.debug('Retrying %d sample(s) of %s: %s',
+                                   len(samples), samples[0]['counter_name'],
+                                   e)
+                with lock:
+                    stats['retries'] += 1
+                time.sleep(min(0.5 * 2 ** attempt, 10))
+
+        def _done(samples, future):
+            slots.release()
+            error = future.exception()
+            with lock:
+                if error is None:
+                    stats['pushed'] += len(samples)
+                else:
+                    stats['failed'] += len(samples)
+            if error is not None:
+                self.log.error('Failed to push %d sample(s) of %s: %s',
+                               len(samples), samples[0]['counter_name'],
+                               error)
+
+        def _send(samples):
+            slots.acquire()
+            future = executor.submit(_post, samples)
+            future.add_done_callback(lambda f: _done(samples, f))
+
+        # Lines are read in another thread so a batch can be sent when
+        # its time is up even though no more input comes
+        inbox = queue.Queue(maxsize=parsed_args.batch_size * workers)
+        reader = threading.Thread(
+            target=_read_samples, args=(lines, file_format, inbox))
+        reader.daemon = True
+
+        start = time.time()
+        pending = {}
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            reader.start()
+            while True:
+                timeout = None
+                if pending:
+                    timeout = max(0.0, min(
+                        deadline for deadline, _s in pending.values()) -
+                        time.time())
+                try:
+                    item = inbox.get(timeout=timeout)
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    break
+                if item:
+                    lineno, sample, error = item
+                    if error is not None:
+                        stats['invalid'] += 1
+                        self.log.error('Invalid sample on line %d: %s',
+                                       lineno, error)
+                        continue
+                    name = sample['counter_name']
+                    batch = pending.setdefault(
+                        name, (time.time() + parsed_args.batch_interval,
+                               []))[1]
+                    batch.append(sample)
+                    if len(batch) >= parsed_args.batch_size:
+                        _send(pending.pop(name)[1])
+                now = time.time()
+                for name in [n for n, (deadline, _s) in pending.items()
+                             if deadline <= now]:
+                    _send(pending.pop(name)[1])
+            for _deadline, batch in pending.values():
+                _send(batch)
+        stats['seconds'] = time.time() - start
+        return stats
+
+
+def _is_transient(error):
+    if isinstance(error, ka_exc.ConnectionError):
+        return True
+    return isinstance(error, exc.HTTPException) and \
+        getattr(error, 'status_code', None) in _RETRY_STATUS
+
+
+def _make_sample(row):
+    """Return the API body of a sample given as a dict of strings"""
+    row = dict((k, v) for k, v in row.items() if v not in (None, ''))
+    name = row.pop('custom_meter_name', None)
+    counter_name = row.get('counter_name') or name
+    if name and counter_name != name:
+        raise ValueError('counter_name and custom_meter_name differ')
+    for field, value in (('counter_name', counter_name),
+                         ('resource_id', row.get('resource_id')),
+                         ('counter_volume', row.get('counter_volume'))):
+        if value is None:
+            raise ValueError('%s is required' % field)
+    now = datetime.datetime.now().isoformat()
+    sample = {
+        'counter_name': counter_name,
+        'resource_id': row['resource_id'],
+        'counter_volume': row['counter_volume'],
+        'counter_type': row.get('counter_type', 'delta'),
+        'counter_unit': row.get('counter_unit', ''),
+        'timestamp': row.get('timestamp', now),
+        'recorded_at': row.get('recorded_at', now),
+        'resource_metadata': {
+            'display_name': row.get('display_name', counter_name)},
+    }
+    for field in ('project_id', 'namespace'):
+        if field in row:
+            sample[field] = row[field]
+    return sample
+
+
+def _read_samples(lines, file_format, inbox):
+    """Put (line number, sample, error) on inbox for each line, then None"""
+    lineno = 0
+    try:
+        if file_format == 'csv':
+            reader = csv.DictReader(lines)
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = ((lineno, line) for lineno, line in enumerate(lines, 1)
+                    if line.strip() and not line.startswith('#'))
+        for lineno, row in rows:
+            try:
+                if not isinstance(row, dict):
+                    row = json.loads(row)
+                    if not isinstance(row, dict):
+                        raise ValueError('expected a JSON object')
+                inbox.put((lineno, _make_sample(row), None))
+            except ValueError as e:
+                inbox.put((lineno, None, e))
+    except (csv.Error, IOError, ValueError) as e:
+        # The input cannot be read any further
+        inbox.put((lineno + 1, None, e))
+    finally:
+        inbox.put(None)
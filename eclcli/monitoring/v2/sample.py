@@ -13,37 +13,41 @@
 #   under the License.
 #
 
+import csv
+import json
+import os
+import sys
+
+from oslo_utils import timeutils
+
 from eclcli.common import command
+from eclcli.common import exceptions
+from eclcli.common import parallel
 from eclcli.common import utils
 from .. import monitoring_utils
 
 
+SAMPLE_COLUMNS = (
+    'meter',
+    'display_name',
+    'project_id',
+    'recorded_at',
+    'resource_id',
+    'namespace',
+    'timestamp',
+    'type',
+    'unit',
+    'volume',
+)
+EXPORT_FORMATS = ('json', 'csv')
+
+
 class ListSample(command.Lister):
     """Lists samples in a specified time range."""
     def get_parser(self, prog_name):
         parser = super(ListSample, self).get_parser(prog_name)
 
-        parser.add_argument(
-            "--field",
-            metavar="<field>",
-            help="A meter column of retrieving target",
-        )
-        parser.add_argument(
-            "--value",
-            metavar="<value>",
-            help="A field value for retrieving meters",
-        )
-        parser.add_argument(
-            "--op",
-            metavar="<operator>",
-            help="A comparison operator",
-            default="eq"
-        )
-        parser.add_argument(
-            "--type",
-            metavar="<type>",
-            help="Format used to convert the value for comparison",
-        )
+        _add_query_arguments(parser)
         parser.add_argument(
             "--page",
             metavar="<page>",
@@ -56,27 +60,198 @@ class ListSample(command.Lister):
             help="Number of resources contained in a page",
             default=100
         )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            default=False,
+            help="List every sample from --page on, fetching the pages in "
+                 "the background (required by --parallel)",
+        )
+        _add_parallel_argument(parser)
 
         return parser
 
     def take_action(self, parsed_args):
-        q = monitoring_utils._make_query(parsed_args)
-        monitoring_client = self.app.client_manager.monitoring
-        data = monitoring_client.samples.list(
-            q=q, page=parsed_args.page, per_page=parsed_args.per_page)
-
-        columns = (
-            'meter',
-            'display_name',
-            'project_id',
-            'recorded_at',
-            'resource_id',
-            'namespace',
-            'timestamp',
-            'type',
-            'unit',
-            'volume',
-        )
-        return (columns,
+        if parsed_args.parallel > 1 and not parsed_args.all:
+            raise exceptions.CommandError("--parallel requires --all")
+        if parsed_args.all:
+            data = _iter_samples(self.app.client_manager.monitoring,
+                                 parsed_args)
+        else:
+            q = _time_query(monitoring_utils._make_query(parsed_args),
+                            parsed_args.start, parsed_args.end)
+            monitoring_client = self.app.client_manager.monitoring
+            data = monitoring_client.samples.list(
+                q=q, page=parsed_args.page, per_page=parsed_args.per_page)
+
+        return (SAMPLE_COLUMNS,
                 (utils.get_item_properties(
-                    s, columns) for s in data))
+                    s, SAMPLE_COLUMNS) for s in data))
+
+
+class ExportSample(command.Command):
+    """Write every sample matching a query to a file as they arrive
+
+    The samples are written as JSON lines, the records of the API, or as
+    CSV with the columns of "monitor sample list".
+    """
+
+    def get_parser(self, prog_name):
+        parser = super(ExportSample, self).get_parser(prog_name)
+
+        _add_query_arguments(parser)
+        _add_parallel_argument(parser)
+        parser.add_argument(
+            "--per_page",
+            metavar="<per_page>",
+            help="Number of samples requested per page",
+            default=100
+        )
+        parser.add_argument(
+            "--file",
+            metavar="<file>",
+            default="-",
+            help="File to write to (default: stdout)",
+        )
+        parser.add_argument(
+            "--file-format",
+            metavar="<format>",
+            choices=EXPORT_FORMATS,
+            default=None,
+            help="json (one sample per line) or csv; guessed from the file "
+                 "name, json by default",
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        parsed_args.page = 1
+        file_format = parsed_args.file_format
+        if not file_format:
+            ext = os.path.splitext(parsed_args.file)[1].lower()
+            file_format = 'csv' if ext == '.csv' else 'json'
+
+        samples = _iter_samples(self.app.client_manager.monitoring,
+                                parsed_args)
+        if parsed_args.file == '-':
+            _write_samples(sys.stdout, samples, file_format)
+            return
+        try:
+            with open(parsed_args.file, 'w') as f:
+                _write_samples(f, samples, file_format)
+        except IOError as e:
+            msg = "Error writing sample file %s: %s"
+            raise exceptions.CommandError(msg % (parsed_args.file, e))
+
+
+def _add_query_arguments(parser):
+    parser.add_argument(
+        "--field",
+        metavar="<field>",
+        help="A meter column of retrieving target",
+    )
+    parser.add_argument(
+        "--value",
+        metavar="<value>",
+        help="A field value for retrieving meters",
+    )
+    parser.add_argument(
+        "--op",
+        metavar="<operator>",
+        help="A comparison operator",
+        default="eq"
+    )
+    parser.add_argument(
+        "--type",
+        metavar="<type>",
+        help="Format used to convert the value for comparison",
+    )
+    parser.add_argument(
+        "--start",
+        metavar="<time>",
+        type=_parse_time,
+        help="Only samples with a timestamp from this time on "
+             "(ISO 8601, UTC unless an offset is given)",
+    )
+    parser.add_argument(
+        "--end",
+        metavar="<time>",
+        type=_parse_time,
+        help="Only samples with a timestamp before this time",
+    )
+
+
+def _add_parallel_argument(parser):
+    parser.add_argument(
+        "--parallel",
+        metavar="<count>",
+        type=int,
+        default=1,
+        help="Split --start to --end into this many ranges fetched "
+             "concurrently (default: 1, max: %d)" % parallel.MAX_PARALLEL,
+    )
+
+
+def _parse_time(text):
+    # Naive UTC, the query string is not URL encoded
+    return timeutils.normalize_time(timeutils.parse_isotime(text))
+
+
+def _time_ranges(start, end, count):
+    """Split [start, end) into count ranges of the same length"""
+    if count <= 1:
+        return [(start, end)]
+    if start is None or end is None:
+        raise exceptions.CommandError(
+            "--parallel requires both --start and --end")
+    if end <= start:
+        raise exceptions.CommandError("--end must be after --start")
+    step = (end - start) / count
+    bounds = [start + step * i for i in range(count)] + [end]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _time_query(q, start, end):
+    """Return query q restricted to timestamps in [start, end)"""
+    q = list(q or [])
+    if start is not None:
+        q.append({"field": "timestamp", "op": "ge", "type": "",
+                  "value": start.isoformat()})
+    if end is not None:
+        q.append({"field": "timestamp", "op": "lt", "type": "",
+                  "value": end.isoformat()})
+    return q or None
+
+
+def _iter_samples(monitoring_client, parsed_args):
+    """Yield the samples of every page, and every time range, in order"""
+    q = monitoring_utils._make_query(parsed_args)
+    count = max(1, min(parsed_args.parallel or 1, parallel.MAX_PARALLEL))
+
+    def _pages(start, end):
+        window = _time_query(q, start, end)
+        return monitoring_utils._iter_pages(
+            lambda page: monitoring_client.samples.list(
+                q=window, page=page, per_page=parsed_args.per_page),
+            parsed_args.per_page, page=int(parsed_args.page))
+
+    ranges = _time_ranges(parsed_args.start, parsed_args.end, count)
+    return monitoring_utils._stream_pages(
+        [_pages(start, end) for start, end in ranges], parallel=count)
+
+
+def _write_samples(f, samples, file_format):
+    if file_format == 'csv':
+        writer = csv.writer(f)
+        writer.writerow(SAMPLE_COLUMNS)
+    for sample in samples:
+        if file_format == 'csv':
+            writer.writerow([_csv_value(sample._info.get(c))
+                             for c in SAMPLE_COLUMNS])
+        else:
+            f.write(json.dumps(sample._info, sort_keys=True) + '\n')
+
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return '' if value is None else value
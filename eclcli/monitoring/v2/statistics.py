@@ -0,0 +1,333 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Statistics computed locally from exported samples"""
+
+from array import array
+import collections
+import csv
+import datetime
+import json
+import os
+import sys
+
+from oslo_utils import importutils
+from oslo_utils import timeutils
+
+from eclcli.common import command
+from eclcli.common import exceptions
+from .sample import EXPORT_FORMATS
+from .sample import _parse_time
+
+
+numpy = importutils.try_import('numpy')
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+# Timestamps remembered while reading, samples of a collection share them
+_TIME_CACHE_SIZE = 65536
+_EPOCH = datetime.datetime(1970, 1, 1)
+GROUP_BY_FIELDS = ('resource_id', 'project_id', 'namespace', 'display_name')
+
+
+class ComputeStatistics(command.Lister):
+    """Compute meter statistics from samples saved by "monitor sample export"
+
+    Samples are read once into columns and aggregated per meter, per
+    --group-by fields and per --period without calling the API, so the
+    same export can be summarised in different ways. The aggregation uses
+    NumPy when it is installed.
+    """
+
+    auth_required = False
+
+    def get_parser(self, prog_name):
+        parser = super(ComputeStatistics, self).get_parser(prog_name)
+        parser.add_argument(
+            "files",
+            metavar="<file>",
+            nargs="*",
+            help="Sample files, JSON lines or CSV (default: stdin)",
+        )
+        parser.add_argument(
+            "--file-format",
+            metavar="<format>",
+            choices=EXPORT_FORMATS,
+            default=None,
+            help="json or csv; guessed from the file names, json by default",
+        )
+        parser.add_argument(
+            "--meter",
+            metavar="<meter>",
+            action="append",
+            help="Only samples of this meter (repeat for more meters)",
+        )
+        parser.add_argument(
+            "--group-by",
+            metavar="<field>",
+            action="append",
+            choices=GROUP_BY_FIELDS,
+            default=[],
+            help="Compute statistics per value of this field: %s "
+                 "(repeat for more fields)" % ", ".join(GROUP_BY_FIELDS),
+        )
+        parser.add_argument(
+            "--period",
+            metavar="<period>",
+            type=int,
+            default=0,
+            help="The sampling period to compute statistic, in seconds "
+                 "(default: 0, the whole time range)",
+        )
+        parser.add_argument(
+            "--start",
+            metavar="<time>",
+            type=_parse_time,
+            help="Only samples with a timestamp from this time on, also "
+                 "the start of the first period",
+        )
+        parser.add_argument(
+            "--end",
+            metavar="<time>",
+            type=_parse_time,
+            help="Only samples with a timestamp before this time",
+        )
+        parser.add_argument(
+            "--percentile",
+            metavar="<percent>",
+            type=float,
+            action="append",
+            help="Percentile of the sample values to compute, between 0 "
+                 "and 100 (repeat for more; default: %s)" %
+                 ", ".join("%g" % p for p in DEFAULT_PERCENTILES),
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        if parsed_args.period < 0:
+            raise exceptions.CommandError("--period must not be negative")
+        percentiles = parsed_args.percentile or DEFAULT_PERCENTILES
+        if any(p < 0 or p > 100 for p in percentiles):
+            raise exceptions.CommandError(
+                "--percentile must be between 0 and 100")
+
+        columns = _Columns(parsed_args.group_by, parsed_args.meter,
+                           _epoch(parsed_args.start),
+                           _epoch(parsed_args.end))
+        for path in parsed_args.files or ['-']:
+            file_format = parsed_args.file_format
+            if not file_format:
+                ext = os.path.splitext(path)[1].lower()
+                file_format = 'csv' if ext == '.csv' else 'json'
+            if path == '-':
+                columns.read(sys.stdin, file_format, '<stdin>')
+                continue
+            try:
+                with open(path) as f:
+                    columns.read(f, file_format, path)
+            except IOError as e:
+                msg = "Error reading sample file %s: %s"
+                raise exceptions.CommandError(msg % (path, e))
+
+        headers = (('meter',) + tuple(parsed_args.group_by) +
+                   ('period_start', 'period_end', 'count', 'min', 'max',
+                    'avg', 'sum') +
+                   tuple('p%g' % p for p in percentiles))
+        return headers, _aggregate(columns, parsed_args.period,
+                                   percentiles)
+
+
+class _Columns(object):
+    """Samples held as one array per field
+
+    Groups, a meter and its --group-by values, are stored once and
+    referred to by index.
+    """
+
+    def __init__(self, group_by, meters=None, start=None, end=None):
+        self.group_by = group_by
+        self.meters = set(meters) if meters else None
+        self.start = start
+        self.end = end
+        self.groups = []
+        self._group_ids = {}
+        self._fields = ('meter',) + tuple(group_by)
+        self._times = {}
+        self.group = array('l')
+        self.timestamp = array('d')
+        self.volume = array('d')
+
+    def read(self, lines, file_format, name):
+        """Append the samples of lines, name is the file in errors"""
+        if file_format == 'csv':
+            reader = csv.DictReader(lines)
+            rows = ((reader.line_num, row) for row in reader)
+        else:
+            rows = ((number, line) for number, line in enumerate(lines, 1)
+                    if line.strip() and not line.startswith('#'))
+        for number, row in rows:
+            try:
+                if file_format != 'csv':
+                    row = json.loads(row)
+                self._append(row)
+            except (AttributeError, TypeError, ValueError) as e:
+                msg = "Invalid sample in %s, line %d: %s"
+                raise exceptions.CommandError(msg % (name, number, e))
+
+    def _append(self, row):
+        meter = row.get('meter')
+        if self.meters is not None and meter not in self.meters:
+            return
+        text = row.get('timestamp')
+        timestamp = self._times.get(text)
+        if timestamp is None:
+            if len(self._times) >= _TIME_CACHE_SIZE:
+                self._times.clear()
+            timestamp = _epoch(text)
+            if timestamp is None:
+                raise ValueError("no timestamp")
+            self._times[text] = timestamp
+        if self.start is not None and timestamp < self.start or \
+                self.end is not None and timestamp >= self.end:
+            return
+        volume = float(row.get('volume') or 0)
+        key = tuple(row.get(f) or None for f in self._fields)
+        group = self._group_ids.get(key)
+        if group is None:
+            group = self._group_ids[key] = len(self.groups)
+            self.groups.append(key)
+        self.group.append(group)
+        self.timestamp.append(timestamp)
+        self.volume.append(volume)
+
+
+def _epoch(value):
+    """Return seconds since the epoch of a datetime or ISO 8601 string"""
+    if value is None or value == '':
+        return None
+    if not isinstance(value, datetime.datetime):
+        try:
+            value = datetime.datetime.fromisoformat(
+                value.replace('Z', '+00:00'))
+        except ValueError:
+            value = timeutils.parse_isotime(value)
+    # Timestamps of the API are naive UTC
+    if value.tzinfo is not None:
+        value = timeutils.normalize_time(value)
+    return (value - _EPOCH).total_seconds()
+
+
+def _percentile(values, lo, hi, percent):
+    """Percentile of the sorted values[lo:hi], interpolated linearly"""
+    position = (hi - lo - 1) * percent / 100.0
+    below = int(position)
+    value = values[lo + below]
+    if below + 1 < hi - lo:
+        value += (values[lo + below + 1] - value) * (position - below)
+    return value
+
+
+def _aggregate(columns, period, percentiles):
+    """Yield a statistics row per group and period, in that order"""
+    if not len(columns.volume):
+        return
+    origin = None
+    if period:
+        origin = columns.start
+        if origin is None:
+            origin = min(columns.timestamp)
+    if numpy is not None:
+        runs = _numpy_runs(columns, period, origin, percentiles)
+    else:
+        runs = _bucket_runs(columns, period, origin, percentiles)
+    for group, start, end, stats in runs:
+        yield (columns.groups[group] +
+               (_format_time(start), _format_time(end)) + stats)
+
+
+def _numpy_runs(columns, period, origin, percentiles):
+    """Statistics per group and period from one NumPy sort of the samples"""
+    groups = numpy.frombuffer(columns.group, dtype=columns.group.typecode)
+    timestamps = numpy.frombuffer(columns.timestamp, dtype='d')
+    volumes = numpy.frombuffer(columns.volume, dtype='d')
+    if period:
+        slots = numpy.floor_divide(timestamps - origin, period).astype('q')
+    else:
+        slots = numpy.zeros(len(volumes), dtype='q')
+
+    # Every group and period becomes a run of ascending volumes
+    order = numpy.lexsort((volumes, slots, groups))
+    groups, slots = groups[order], slots[order]
+    volumes, timestamps = volumes[order], timestamps[order]
+    bounds = numpy.flatnonzero((groups[1:] != groups[:-1]) |
+                               (slots[1:] != slots[:-1])) + 1
+    starts = numpy.concatenate(([0], bounds))
+    ends = numpy.concatenate((bounds, [len(volumes)]))
+    counts = ends - starts
+    sums = numpy.add.reduceat(volumes, starts)
+    stats = [counts, volumes[starts], volumes[ends - 1], sums / counts,
+             sums]
+    for percent in percentiles:
+        position = (counts - 1) * percent / 100.0
+        below = position.astype('q')
+        low = starts + below
+        high = numpy.minimum(low + 1, ends - 1)
+        stats.append(volumes[low] +
+                     (volumes[high] - volumes[low]) * (position - below))
+    if period:
+        period_starts = origin + slots[starts] * float(period)
+        period_ends = period_starts + period
+    else:
+        period_starts = numpy.minimum.reduceat(timestamps, starts)
+        period_ends = numpy.maximum.reduceat(timestamps, starts)
+
+    return zip(groups[starts].tolist(), period_starts.tolist(),
+               period_ends.tolist(), zip(*[c.tolist() for c in stats]))
+
+
+def _bucket_runs(columns, period, origin, percentiles):
+    """Statistics per group and period from a sorted bucket of each"""
+    buckets = collections.defaultdict(list)
+    spans = {}
+    if period:
+        for group, timestamp, volume in zip(columns.group, columns.timestamp,
+                                            columns.volume):
+            buckets[group, int((timestamp - origin) // period)].append(volume)
+    else:
+        for group, timestamp, volume in zip(columns.group, columns.timestamp,
+                                            columns.volume):
+            buckets[group, 0].append(volume)
+            span = spans.get(group)
+            if span is None:
+                spans[group] = [timestamp, timestamp]
+            elif timestamp < span[0]:
+                span[0] = timestamp
+            elif timestamp > span[1]:
+                span[1] = timestamp
+
+    for group, slot in sorted(buckets):
+        values = buckets[group, slot]
+        values.sort()
+        count = len(values)
+        total = sum(values)
+        if period:
+            start = origin + slot * period
+            end = start + period
+        else:
+            start, end = spans[group]
+        yield (group, start, end,
+               (count, values[0], values[-1], total / count, total) +
+               tuple(_percentile(values, 0, count, p) for p in percentiles))
+
+
+def _format_time(seconds):
+    return (_EPOCH + datetime.timedelta(seconds=seconds)).isoformat()
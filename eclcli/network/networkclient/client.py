@@ -65,6 +65,9 @@ class HTTPClient(object):
             self.verify_cert = False
         else:
             self.verify_cert = ca_cert if ca_cert else True
+        # Reuse connections across requests; a ClientManager passes the
+        # session shared by all its clients
+        self.http_session = kwargs.get('http_session') or requests.Session()
 
     def _cs_request(self, *args, **kwargs):
         kargs = {}
@@ -117,7 +120,7 @@ class HTTPClient(object):
 
         headers['User-Agent'] = self.USER_AGENT
 
-        resp = requests.request(
+        resp = self.http_session.request(
             method,
             url,
             data=body,
@@ -324,6 +327,7 @@ def construct_http_client(username=None,
                           ca_cert=None,
                           service_type=SERVICE_TYPE,
                           session=None,
+                          http_session=None,
                           **kwargs):
 
     if session:
@@ -349,4 +353,5 @@ def construct_http_client(username=None,
                           service_type=service_type,
                           ca_cert=ca_cert,
                           log_credentials=log_credentials,
-                          auth_strategy=auth_strategy)
+                          auth_strategy=auth_strategy,
+                          http_session=http_session)
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -46,6 +48,7 @@ class ListColoLogicalLink(command.Lister):
             metavar="vlan_id",
             help="filter by vlan_id")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -80,9 +83,12 @@ class ListColoLogicalLink(command.Lister):
         if parsed_args.vlan_id:
             search_opts.update({"vlan_id": parsed_args.vlan_id})
 
-        data = [to_obj.ColoLogicalLink(colocation_logical_link)
-                for colocation_logical_link in network_client.list_colo_logical_links(
-                    **search_opts).get('colocation_logical_links')]
+        data = (to_obj.ColoLogicalLink(colocation_logical_link)
+                for colocation_logical_link in pagination.iter_items(
+                    network_client.list_colo_logical_links,
+                    'colocation_logical_links',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -225,10 +231,15 @@ class DeleteColoLogicalLink(command.Command):
             nargs="+",
             help="ID(s) of Colocation Logical Link to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for cid in parsed_args.colocation_logical_link_id:
-            network_client.delete_colo_logical_link(cid)
+        parallel.run_each(
+            network_client.delete_colo_logical_link,
+            parsed_args.colocation_logical_link_id,
+            parallel=parsed_args.parallel,
+            action='delete colocation-logical-link',
+            log=self.log,
+        )
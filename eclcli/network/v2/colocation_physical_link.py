@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -54,6 +55,7 @@ class ListColoPhysicalLink(command.Lister):
             metavar="type_b_rack_id",
             help="filter by type_b_rack_id")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -92,9 +94,12 @@ class ListColoPhysicalLink(command.Lister):
         if parsed_args.type_b_rack_id:
             search_opts.update({"type_b_rack_id": parsed_args.type_b_rack_id})
 
-        data = [to_obj.ColoPhysicalLink(cfp)
-                for cfp in network_client.list_colo_physical_links(
-                    **search_opts).get('colocation_physical_links')]
+        data = (to_obj.ColoPhysicalLink(cfp)
+                for cfp in pagination.iter_items(
+                    network_client.list_colo_physical_links,
+                    'colocation_physical_links',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -24,6 +25,7 @@ class ListColoSpace(command.Lister):
             '--plane',
             metavar="plane",
             help="filter by plane")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -49,9 +51,9 @@ class ListColoSpace(command.Lister):
         if parsed_args.plane:
             search_opts.update({"plane": parsed_args.plane})
 
-        data = [to_obj.ColoSpace(cfp)
-                for cfp in network_client.list_colo_spaces(
-                    **search_opts).get('colocation_spaces')]
+        data = (to_obj.ColoSpace(cfp) for cfp in pagination.iter_items(
+            network_client.list_colo_spaces, 'colocation_spaces',
+            parsed_args.page_size, parsed_args.max_items, **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
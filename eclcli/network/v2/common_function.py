@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -20,6 +21,7 @@ class ListCommonFunction(command.Lister):
             '--name',
             metavar="name",
             help="filter by name")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -44,9 +46,9 @@ class ListCommonFunction(command.Lister):
         if parsed_args.name:
             search_opts.update({"name": parsed_args.name})
 
-        data = [to_obj.CommonFunction(cfp)
-                for cfp in network_client.list_common_functions(
-                    **search_opts).get('common_functions')]
+        data = (to_obj.CommonFunction(cfp) for cfp in pagination.iter_items(
+            network_client.list_common_functions, 'common_functions',
+            parsed_args.page_size, parsed_args.max_items, **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -36,6 +38,7 @@ class ListCommonFunctionGateway(command.Lister):
             '--subnet_id',
             metavar="subnet_id",
             help="filter by subnet id")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -72,9 +75,11 @@ class ListCommonFunctionGateway(command.Lister):
             search_opts.update({"subnet_id":
                                 parsed_args.subnet_id})
 
-        data = [to_obj.CommonFunctionGateway(common_function_gateway)
-                for common_function_gateway in network_client.list_cfgws(
-                    **search_opts).get('common_function_gateways')]
+        data = (to_obj.CommonFunctionGateway(common_function_gateway)
+                for common_function_gateway in pagination.iter_items(
+                    network_client.list_cfgws, 'common_function_gateways',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -190,10 +195,15 @@ class DeleteCommonFunctionGateway(command.Command):
             nargs="+",
             help="ID(s) Common Function Gateway to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for cid in parsed_args.common_function_gateway_id:
-            network_client.delete_cfgw(cid)
+        parallel.run_each(
+            network_client.delete_cfgw,
+            parsed_args.common_function_gateway_id,
+            parallel=parsed_args.parallel,
+            action='delete common-function-gw',
+            log=self.log,
+        )
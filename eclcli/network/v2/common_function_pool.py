@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -20,6 +21,7 @@ class ListCommonFunctionPool(command.Lister):
             '--name',
             metavar="name",
             help="filter by name")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -43,9 +45,12 @@ class ListCommonFunctionPool(command.Lister):
         if parsed_args.name:
             search_opts.update({"name": parsed_args.name})
 
-        data = [to_obj.CommonFunctionPool(cfp)
-                for cfp in network_client.list_common_function_pools(
-                    **search_opts).get('common_function_pools')]
+        data = (to_obj.CommonFunctionPool(cfp)
+                for cfp in pagination.iter_items(
+                    network_client.list_common_function_pools,
+                    'common_function_pools',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -8,6 +9,7 @@ class ListFICInterface(command.Lister):
     _description = _("List fic-interfaces")
     def get_parser(self, prog_name):
         parser = super(ListFICInterface, self).get_parser(prog_name)
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -24,8 +26,9 @@ class ListFICInterface(command.Lister):
             'Status',
         )
 
-        data = [to_obj.FICInterface(ficsv) for ficsv in
-                network_client.list_fic_interfaces().get('fic_interfaces')]
+        data = (to_obj.FICInterface(ficsv) for ficsv in pagination.iter_items(
+            network_client.list_fic_interfaces, 'fic_interfaces',
+            parsed_args.page_size, parsed_args.max_items))
 
         return (column_headers,
                 (utils.get_item_properties(
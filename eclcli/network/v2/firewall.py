@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -36,6 +38,7 @@ class ListFirewall(command.Lister):
             '--status',
             metavar="status",
             help="filter by status")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -68,8 +71,11 @@ class ListFirewall(command.Lister):
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
 
-        data = [to_obj.Firewall(firewall)
-                for firewall in network_client.list_firewalls(**search_opts).get('firewalls')]
+        data = (to_obj.Firewall(firewall)
+                for firewall in pagination.iter_items(
+                    network_client.list_firewalls, 'firewalls',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -201,13 +207,18 @@ class DeleteFirewall(command.Command):
             nargs="+",
             help="ID(s) of Firewall to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for fid in parsed_args.firewall_id:
-            network_client.delete_firewall(fid)
+        parallel.run_each(
+            network_client.delete_firewall,
+            parsed_args.firewall_id,
+            parallel=parsed_args.parallel,
+            action='delete firewall',
+            log=self.log,
+        )
 
 
 class RebootFirewall(command.ShowOne):
@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -42,6 +43,7 @@ class ListFirewallInterface(command.Lister):
             metavar="virtual_ip_address",
             help="filter by virtual ip address")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -79,10 +81,12 @@ class ListFirewallInterface(command.Lister):
         if parsed_args.virtual_ip_address:
             search_opts.update({"virtual_ip_address": parsed_args.virtual_ip_address})
 
-        data = [to_obj.FirewallInterface(firewall_interface)
-                for firewall_interface in
-                network_client.list_firewall_interfaces(
-                        **search_opts).get('firewall_interfaces')]
+        data = (to_obj.FirewallInterface(firewall_interface)
+                for firewall_interface in pagination.iter_items(
+                    network_client.list_firewall_interfaces,
+                    'firewall_interfaces',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -28,6 +29,7 @@ class ListFirewallPlan(command.Lister):
         #     '--version',
         #     metavar="version",
         #     help="filter by version")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -58,10 +60,11 @@ class ListFirewallPlan(command.Lister):
         # if parsed_args.version:
         #     search_opts.update({"version": parsed_args.version})
 
-        data = [
-            to_obj.FirewallPlan(fwplan) for fwplan
-            in network_client.list_firewall_plans(**search_opts).get('firewall_plans')
-        ]
+        data = (to_obj.FirewallPlan(fwplan)
+                for fwplan in pagination.iter_items(
+                    network_client.list_firewall_plans, 'firewall_plans',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -81,6 +83,7 @@ class ListGwInterface(command.Lister):
             '--vrid',
             metavar="vrid",
             help="filter by vrid")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -139,9 +142,11 @@ class ListGwInterface(command.Lister):
         if parsed_args.vrid:
             search_opts.update({"vrid": parsed_args.vrid})
 
-        data = [to_obj.GwInterface(gw_interface)
-                for gw_interface in network_client.list_gw_interfaces(
-                **search_opts).get('gw_interfaces')]
+        data = (to_obj.GwInterface(gw_interface)
+                for gw_interface in pagination.iter_items(
+                    network_client.list_gw_interfaces, 'gw_interfaces',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -321,10 +326,15 @@ class DeleteGwInterface(command.Command):
             nargs="+",
             help="ID(s) of Gateway Interface to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for giid in parsed_args.gw_interface_id:
-            network_client.delete_gw_interface(giid)
+        parallel.run_each(
+            network_client.delete_gw_interface,
+            parsed_args.gw_interface_id,
+            parallel=parsed_args.parallel,
+            action='delete gw-interface',
+            log=self.log,
+        )
@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -28,6 +29,7 @@ class ListInterDCGateway(command.Lister):
             '--status',
             metavar="status",
             help="filter by status")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -57,9 +59,11 @@ class ListInterDCGateway(command.Lister):
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
 
-        data = [to_obj.InterDCGateway(idcgw)
-                for idcgw in network_client.list_interdc_gateways(
-                    **search_opts).get('interdc_gateways')]
+        data = (to_obj.InterDCGateway(idcgw)
+                for idcgw in pagination.iter_items(
+                    network_client.list_interdc_gateways, 'interdc_gateways',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -61,6 +63,7 @@ class ListInterDCInterface(command.Lister):
             '--vrid',
             metavar="vrid",
             help="filter by vrid")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -104,11 +107,12 @@ class ListInterDCInterface(command.Lister):
             search_opts.update({"status": parsed_args.status})
         if parsed_args.vrid:
             search_opts.update({"vrid": parsed_args.vrid})
-        data = [
-            to_obj.InterDCInterface(idcif)
-            for idcif in network_client.list_interdc_interfaces(
-                **search_opts).get('interdc_interfaces')
-        ]
+        data = (to_obj.InterDCInterface(idcif)
+                for idcif in pagination.iter_items(
+                    network_client.list_interdc_interfaces,
+                    'interdc_interfaces',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -265,10 +269,15 @@ class DeleteInterDCInterface(command.Command):
             nargs="+",
             help="ID(s) of InterDC Interface to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for idcif_id in parsed_args.interdc_interface_id:
-            network_client.delete_interdc_interface(idcif_id)
+        parallel.run_each(
+            network_client.delete_interdc_interface,
+            parsed_args.interdc_interface_id,
+            parallel=parsed_args.parallel,
+            action='delete interdc-interface',
+            log=self.log,
+        )
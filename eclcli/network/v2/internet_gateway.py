@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -33,6 +35,7 @@ class ListInternetGateway(command.Lister):
             '--status',
             metavar="status",
             help="filter by status")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -63,11 +66,11 @@ class ListInternetGateway(command.Lister):
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
 
-        data = [
-            to_obj.InternetGateway(inetgw)
-            for inetgw in network_client.list_internet_gateways(
-                **search_opts).get('internet_gateways')
-        ]
+        data = (to_obj.InternetGateway(inetgw)
+                for inetgw in pagination.iter_items(
+                    network_client.list_internet_gateways, 'internet_gateways',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -193,10 +196,15 @@ class DeleteInternetGateway(command.Command):
             nargs="+",
             help="ID(s) of Internet Gateway to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for inetgw_id in parsed_args.internet_gateway_id:
-            network_client.delete_internet_gateway(inetgw_id)
+        parallel.run_each(
+            network_client.delete_internet_gateway,
+            parsed_args.internet_gateway_id,
+            parallel=parsed_args.parallel,
+            action='delete inet-gw',
+            log=self.log,
+        )
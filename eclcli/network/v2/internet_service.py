@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -24,6 +25,7 @@ class ListInternetService(command.Lister):
             '--zone',
             metavar="zone",
             help="filter by zone")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -52,11 +54,11 @@ class ListInternetService(command.Lister):
         if parsed_args.zone:
             search_opts.update({"zone": parsed_args.zone})
 
-        data = [
-            to_obj.InternetService(inetsv)
-            for inetsv in network_client.list_internet_services(
-                **search_opts).get('internet_services')
-        ]
+        data = (to_obj.InternetService(inetsv)
+                for inetsv in pagination.iter_items(
+                    network_client.list_internet_services, 'internet_services',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
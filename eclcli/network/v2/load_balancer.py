@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -40,6 +42,7 @@ class ListLoadBalancer(command.Lister):
             '--status',
             metavar="status",
             help="filter by status")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -78,11 +81,10 @@ class ListLoadBalancer(command.Lister):
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
 
-        data = [
-            to_obj.LoadBalancer(loadbalancer)
-            for loadbalancer in network_client.list_loadbalancers().get(
-                'load_balancers')
-        ]
+        data = (to_obj.LoadBalancer(loadbalancer)
+                for loadbalancer in pagination.iter_items(
+                    network_client.list_loadbalancers, 'load_balancers',
+                    parsed_args.page_size, parsed_args.max_items))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -210,13 +212,18 @@ class DeleteLoadBalancer(command.Command):
             nargs="+",
             help="ID(s) of Load Balancers to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for fid in parsed_args.loadbalancer_id:
-            network_client.delete_loadbalancer(fid)
+        parallel.run_each(
+            network_client.delete_loadbalancer,
+            parsed_args.loadbalancer_id,
+            parallel=parsed_args.parallel,
+            action='delete load-balancer',
+            log=self.log,
+        )
 
 
 class RebootLoadBalancer(command.ShowOne):
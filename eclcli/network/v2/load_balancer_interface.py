@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -40,6 +41,7 @@ class ListLoadBalancerInterface(command.Lister):
             '--virtual_ip_address',
             metavar="virtual_ip_address",
             help="filter by virtual ip address")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -78,11 +80,12 @@ class ListLoadBalancerInterface(command.Lister):
         if parsed_args.virtual_ip_address:
             search_opts.update({"virtual_ip_address": parsed_args.virtual_ip_address})
 
-        data = [to_obj.LoadBalancerInterface(loadbalancer_interface)
-                for loadbalancer_interface in
-                network_client.list_loadbalancer_interfaces(
-                   **search_opts
-                ).get('load_balancer_interfaces')]
+        data = (to_obj.LoadBalancerInterface(loadbalancer_interface)
+                for loadbalancer_interface in pagination.iter_items(
+                    network_client.list_loadbalancer_interfaces,
+                    'load_balancer_interfaces',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
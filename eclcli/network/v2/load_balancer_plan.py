@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -32,6 +33,7 @@ class ListLoadBalancerPlan(command.Lister):
         #     '--version',
         #     metavar="version",
         #     help="filter by version")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -64,9 +66,12 @@ class ListLoadBalancerPlan(command.Lister):
         # if parsed_args.version:
             # search_opts.update({"version": parsed_args.version})
 
-        data = [to_obj.LoadBalancerPlan(lbplan)
-                for lbplan in network_client.list_loadbalancer_plans(
-                    **search_opts).get('load_balancer_plans')]
+        data = (to_obj.LoadBalancerPlan(lbplan)
+                for lbplan in pagination.iter_items(
+                    network_client.list_loadbalancer_plans,
+                    'load_balancer_plans',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -44,6 +46,7 @@ class ListLoadBalancerSyslogServer(command.Lister):
             '--transport_type',
             metavar="transport_type",
             help="filter by transport type")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -81,11 +84,12 @@ class ListLoadBalancerSyslogServer(command.Lister):
         if parsed_args.transport_type:
             search_opts.update({"transport_type": parsed_args.transport_type})
 
-        data = [to_obj.LoadBalancerSyslogServer(loadbalancer_syslog_server)
-                for loadbalancer_syslog_server in
-                network_client.list_loadbalancer_syslog_servers(
-                   **search_opts
-                ).get('load_balancer_syslog_servers')]
+        data = (to_obj.LoadBalancerSyslogServer(loadbalancer_syslog_server)
+                for loadbalancer_syslog_server in pagination.iter_items(
+                    network_client.list_loadbalancer_syslog_servers,
+                    'load_balancer_syslog_servers',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -222,13 +226,18 @@ class DeleteLoadBalancerSyslogServer(command.Command):
             nargs="+",
             help="ID(s) of Load Balancer Syslog Servers to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for lb_sid in parsed_args.load_balancer_syslog_server_id:
-            network_client.delete_loadbalancer_syslog_server(lb_sid)
+        parallel.run_each(
+            network_client.delete_loadbalancer_syslog_server,
+            parsed_args.load_balancer_syslog_server_id,
+            parallel=parsed_args.parallel,
+            action='delete load-balancer-syslog-server',
+            log=self.log,
+        )
 
 
 class SetLoadBalancerSyslogServer(command.ShowOne):
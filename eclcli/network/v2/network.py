@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -30,6 +32,7 @@ class ListNetwork(command.Lister):
             metavar="status",
             help="filter by status")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -58,9 +61,9 @@ class ListNetwork(command.Lister):
             search_opts.update({"plane": parsed_args.plane})
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
-        data = [to_obj.Network(network)
-                for network in network_client.list_networks(
-                    **search_opts).get('networks')]
+        data = (to_obj.Network(network) for network in pagination.iter_items(
+            network_client.list_networks, 'networks',
+            parsed_args.page_size, parsed_args.max_items, **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -228,10 +231,15 @@ class DeleteNetwork(command.Command):
             nargs="+",
             help=("Network(s) ID to delete.")
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for nid in parsed_args.network_id:
-            network_client.delete_network(nid)
+        parallel.run_each(
+            network_client.delete_network,
+            parsed_args.network_id,
+            parallel=parsed_args.parallel,
+            action='delete logical-network',
+            log=self.log,
+        )
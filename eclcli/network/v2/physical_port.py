@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -8,6 +9,7 @@ class ListPhysicalPort(command.Lister):
     _description = _("List physical-ports")
     def get_parser(self, prog_name):
         parser = super(ListPhysicalPort, self).get_parser(prog_name)
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -24,8 +26,9 @@ class ListPhysicalPort(command.Lister):
             'Status',
         )
 
-        data = [to_obj.PhysicalPort(pport) for pport
-                in network_client.list_physical_ports().get('physical_ports')]
+        data = (to_obj.PhysicalPort(pport) for pport in pagination.iter_items(
+            network_client.list_physical_ports, 'physical_ports',
+            parsed_args.page_size, parsed_args.max_items))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -8,6 +10,7 @@ class ListPort(command.Lister):
     _description = _("List ports")
     def get_parser(self, prog_name):
         parser = super(ListPort, self).get_parser(prog_name)
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -24,8 +27,9 @@ class ListPort(command.Lister):
             'Status',
         )
 
-        data = [to_obj.Port(port)
-                for port in network_client.list_ports().get('ports')]
+        data = (to_obj.Port(port) for port in pagination.iter_items(
+            network_client.list_ports, 'ports',
+            parsed_args.page_size, parsed_args.max_items))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -281,10 +285,15 @@ class DeletePort(command.Command):
             nargs="+",
             help="Port(s) ID to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for pid in parsed_args.port_id:
-            network_client.delete_port(pid)
+        parallel.run_each(
+            network_client.delete_port,
+            parsed_args.port_id,
+            parallel=parsed_args.parallel,
+            action='delete port',
+            log=self.log,
+        )
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -34,6 +36,7 @@ class ListPubicIP(command.Lister):
             metavar="cidr",
             help="filter by cidr")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -68,8 +71,11 @@ class ListPubicIP(command.Lister):
         if parsed_args.cidr:
             search_opts.update({"cidr": parsed_args.cidr})
 
-        data = [to_obj.PubicIP(public_ip)
-                for public_ip in network_client.list_public_ips(**search_opts).get('public_ips')]
+        data = (to_obj.PubicIP(public_ip)
+                for public_ip in pagination.iter_items(
+                    network_client.list_public_ips, 'public_ips',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -187,10 +193,15 @@ class DeletePubicIP(command.Command):
             nargs="+",
             help="ID(s) of Public IP to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for giid in parsed_args.public_ip_id:
-            network_client.delete_public_ip(giid)
+        parallel.run_each(
+            network_client.delete_public_ip,
+            parsed_args.public_ip_id,
+            parallel=parsed_args.parallel,
+            action='delete public-ip',
+            log=self.log,
+        )
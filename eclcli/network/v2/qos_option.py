@@ -1,4 +1,5 @@
 from eclcli.common import command
+from eclcli.common import pagination
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -52,6 +53,7 @@ class ListQosOption(command.Lister):
             '--bandwidth',
             metavar="bandwidth",
             help="filter by bandwidth")
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -94,9 +96,9 @@ class ListQosOption(command.Lister):
         if parsed_args.bandwidth:
             params.update({"bandwidth": parsed_args.bandwidth})
 
-        data = [to_obj.QosOption(inetsv)
-                for inetsv in network_client.list_qos_options(
-                    **params).get('qos_options')]
+        data = (to_obj.QosOption(inetsv) for inetsv in pagination.iter_items(
+            network_client.list_qos_options, 'qos_options',
+            parsed_args.page_size, parsed_args.max_items, **params))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -54,6 +56,7 @@ class ListStaticRoute(command.Lister):
             metavar="fic_gw_id",
             help="filter by fic gateway id")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -100,9 +103,11 @@ class ListStaticRoute(command.Lister):
         if parsed_args.fic_gw_id:
             search_opts.update({"fic_gw_id": parsed_args.fic_gw_id})
 
-        data = [to_obj.StaticRoute(static_route)
-                for static_route in network_client.list_static_routes(
-                            **search_opts).get('static_routes')]
+        data = (to_obj.StaticRoute(static_route)
+                for static_route in pagination.iter_items(
+                    network_client.list_static_routes, 'static_routes',
+                    parsed_args.page_size, parsed_args.max_items,
+                    **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -247,10 +252,15 @@ class DeleteStaticRoute(command.Command):
             nargs="+",
             help="ID(s) of Static Route to delete."
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for giid in parsed_args.static_route_id:
-            network_client.delete_static_route(giid)
+        parallel.run_each(
+            network_client.delete_static_route,
+            parsed_args.static_route_id,
+            parallel=parsed_args.parallel,
+            action='delete static-route',
+            log=self.log,
+        )
@@ -1,4 +1,6 @@
 from eclcli.common import command
+from eclcli.common import pagination
+from eclcli.common import parallel
 from eclcli.common import utils
 from eclcli.i18n import _  # noqa
 from ..networkclient.common import utils as to_obj
@@ -50,6 +52,7 @@ class ListSubnet(command.Lister):
             metavar="status",
             help="filter by status")
 
+        pagination.add_pagination_options(parser)
         return parser
 
     def take_action(self, parsed_args):
@@ -90,9 +93,9 @@ class ListSubnet(command.Lister):
         if parsed_args.status:
             search_opts.update({"status": parsed_args.status})
 
-        data = [to_obj.Subnet(subnet)
-                for subnet in network_client.list_subnets(
-                    **search_opts).get('subnets')]
+        data = (to_obj.Subnet(subnet) for subnet in pagination.iter_items(
+            network_client.list_subnets, 'subnets',
+            parsed_args.page_size, parsed_args.max_items, **search_opts))
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -365,10 +368,15 @@ class DeleteSubnet(command.Command):
             nargs="+",
             help=("Subnet(s) ID to delete.")
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         network_client = self.app.client_manager.network
 
-        for sid in parsed_args.subnet_id:
-            network_client.delete_subnet(sid)
+        parallel.run_each(
+            network_client.delete_subnet,
+            parsed_args.subnet_id,
+            parallel=parsed_args.parallel,
+            action='delete subnet',
+            log=self.log,
+        )
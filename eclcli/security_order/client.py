@@ -15,8 +15,6 @@
 
 """Security order client"""
 
-from eclcli.api import eclsdk
-
 DEFAULT_API_VERSION = '3'
 API_VERSION_OPTION = ''
 API_NAME = 'security_order'
@@ -27,7 +25,15 @@ API_VERSIONS = {
 
 def make_client(instance):
     """Returns a security order client."""
-    client = eclsdk.ConnectionManager()
+
+    # Defer client import until we actually need them
+    from eclcli.api import eclsdk
+
+    client = eclsdk.ConnectionManager(
+        cli_options=instance._cli_options,
+        verify=instance._verify,
+        client_manager=instance,
+    )
     return client
 
 
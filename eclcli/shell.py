@@ -5,6 +5,7 @@ import logging
 import sys
 import traceback
 import os
+import uuid
 import appdirs
 
 from cliff import app
@@ -15,16 +16,17 @@ from oslo_utils import importutils
 from oslo_utils import strutils
 
 import eclcli
+from eclcli.api import auth
 from eclcli.api import eclsdk
+from eclcli.common import batch
 from eclcli.common import clientmanager
 from eclcli.common import commandmanager
 from eclcli.common import exceptions as exc
 from eclcli.common import logs
 from eclcli.common import timing
+from eclcli.common import token_cache
 from eclcli.common import utils
 
-from os_client_config import config as cloud_config
-
 osprofiler_profiler = importutils.try_import("osprofiler.profiler")
 
 
@@ -39,6 +41,11 @@ UNIX_SITE_CONFIG_HOME = '/etc/ecl'
 
 SITE_CONFIG_HOME = APPDIRS.site_config_dir
 
+TOKEN_CACHE_HOME = os.path.join(APPDIRS.user_cache_dir, 'tokens')
+NAME_CACHE_FILE = os.path.join(APPDIRS.user_cache_dir, 'names.json')
+COMMAND_INDEX_FILE = os.path.join(APPDIRS.user_cache_dir,
+                                  'command_index.json')
+
 CONFIG_SEARCH_PATH = [
     os.getcwd(),
     CONFIG_HOME, UNIX_CONFIG_HOME,
@@ -82,7 +89,6 @@ class ECLClient(app.App):
     CONSOLE_MESSAGE_FORMAT = '%(levelname)s: %(name)s %(message)s'
 
     log = logging.getLogger(__name__)
-    timing_data = []
 
     def __init__(self):
         # Patch command.Command to add a default auth_required = True
@@ -99,7 +105,8 @@ class ECLClient(app.App):
         super(ECLClient, self).__init__(
             description=__doc__.strip(),
             version=eclcli.__version__,
-            command_manager=commandmanager.CommandManager('ecl.cli'),
+            command_manager=commandmanager.CommandManager(
+                'ecl.cli', index_file=COMMAND_INDEX_FILE),
             deferred_help=True)
 
         del self.command_manager.commands['complete']
@@ -116,8 +123,17 @@ class ECLClient(app.App):
         self.client_manager = None
         self.command_options = None
 
+        self.token_cache_dir = TOKEN_CACHE_HOME
+        # Commands keep slowly changing catalogs here, see common.cache
+        self.cache_dir = APPDIRS.user_cache_dir
+
         self.do_profile = False
 
+        # Requests of the last command, for --timing and batch results,
+        # and what tells the runs apart in --timing-file
+        self.timing_data = []
+        self.run_id = uuid.uuid4().hex
+
     def configure_logging(self):
         """Configure logging for the app."""
         self.log_configurator = logs.LogConfigurator(self.options)
@@ -233,12 +249,46 @@ class ECLClient(app.App):
         #     help='Select an interface type.'
         #          ' Valid interface types: [admin, public, internal].'
         #          ' (Env: OS_INTERFACE)')
-        # parser.add_argument(
-        #     '--timing',
-        #     default=False,
-        #     action='store_true',
-        #     help="Print API call timing info",
-        # )
+        parser.add_argument(
+            '--timing',
+            default=False,
+            action='store_true',
+            help="Print API call timing info",
+        )
+        parser.add_argument(
+            '--timing-file',
+            metavar='<path>',
+            default=utils.env('OS_TIMING_FILE'),
+            help='Append the timing of every API call to <path>, one JSON '
+                 'object per line (Env: OS_TIMING_FILE)',
+        )
+
+        token_cache_group = parser.add_mutually_exclusive_group()
+        token_cache_group.add_argument(
+            '--os-token-cache',
+            dest='token_cache',
+            action='store_true',
+            default=strutils.bool_from_string(utils.env('OS_TOKEN_CACHE')),
+            help='Reuse tokens and service catalogs cached in ' +
+                 TOKEN_CACHE_HOME + ' until shortly before they expire'
+                 ' (Env: OS_TOKEN_CACHE)',
+        )
+        token_cache_group.add_argument(
+            '--no-token-cache',
+            dest='token_cache',
+            action='store_false',
+            help='Always authenticate, ignoring --os-token-cache and '
+                 'OS_TOKEN_CACHE',
+        )
+        parser.add_argument(
+            '--os-name-cache-ttl',
+            metavar='<seconds>',
+            type=int,
+            default=int(utils.env('OS_NAME_CACHE_TTL', default=0)),
+            help='Remember the IDs of resources given by name for this many '
+                 'seconds in ' + NAME_CACHE_FILE + ' (default: 0, disabled)'
+                 ' (Env: OS_NAME_CACHE_TTL)',
+        )
 
         # osprofiler HMAC key argument
         if osprofiler_profiler:
@@ -255,7 +305,11 @@ class ECLClient(app.App):
                                 'configuration files of the required '
                                 'projects.')
 
-        return clientmanager.build_plugin_option_parser(parser)
+        # The authentication options belong to the identity plugin but are
+        # added here, plugins are only imported when their client is used
+        parser = auth.build_auth_plugins_option_parser(parser)
+        return clientmanager.build_plugin_option_parser(
+            parser, self.command_manager.index)
 
     def initialize_app(self, argv):
         """Global app init bits:
@@ -297,6 +351,10 @@ class ECLClient(app.App):
         if tenant_name and not project_name:
             self.options.project_name = tenant_name
 
+        # Defer os-client-config import until options are parsed, it is
+        # not needed for --help or --version
+        from os_client_config import config as cloud_config
+
         # Do configuration file handling
         # Ignore the default value of interface. Only if it is set later
         # will it be used.
@@ -349,30 +407,23 @@ class ECLClient(app.App):
         # self.default_domain = self.options.default_domain
         self.default_domain = DEFAULT_DOMAIN
 
-        # Loop through extensions to get API versions
-        for mod in clientmanager.PLUGIN_MODULES:
-            default_version = getattr(mod, 'DEFAULT_API_VERSION', None)
-            option = mod.API_VERSION_OPTION.replace('os_', '')
+        # Loop through plugins to get API versions, without importing them
+        for plugin in clientmanager.get_plugins(self.command_manager.index):
+            default_version = plugin['default_version']
+            option = plugin['version_option'].replace('os_', '')
             version_opt = str(self.cloud.config.get(option, default_version))
             if version_opt:
-                api = mod.API_NAME
+                api = plugin['api_name']
                 self.api_version[api] = version_opt
 
-                # Add a plugin interface to let the module validate the version
-                # requested by the user
-                skip_old_check = False
-                mod_check_api_version = getattr(mod, 'check_api_version', None)
-                if mod_check_api_version:
-                    # this throws an exception if invalid
-                    skip_old_check = mod_check_api_version(version_opt)
-
-                mod_versions = getattr(mod, 'API_VERSIONS', None)
-                if not skip_old_check and mod_versions:
+                # Modules with a check_api_version() validate the version
+                # requested by the user when their client is first used
+                mod_versions = plugin['versions']
+                if not plugin['check_version'] and mod_versions:
                     if version_opt not in mod_versions:
                         self.log.warning(
                             "%s version %s is not in supported versions %s"
-                            % (api, version_opt,
-                               ', '.join(mod.API_VERSIONS.keys())))
+                            % (api, version_opt, ', '.join(mod_versions)))
 
                 # Command groups deal only with major versions
                 version = '.v' + version_opt.replace('.', '_').split('_')[0]
@@ -395,16 +446,25 @@ class ECLClient(app.App):
         # Handle deferred help and exit
         self.print_help_if_requested()
 
+        if self.options.token_cache:
+            cache = token_cache.TokenCache(self.token_cache_dir)
+        else:
+            cache = None
+
         self.client_manager = clientmanager.ClientManager(
             cli_options=self.cloud,
             verify=self.verify,
             api_version=self.api_version,
             pw_func=prompt_for_password,
+            token_cache=cache,
         )
 
+        # The eclsdk connection is opened on first use and shares the
+        # authentication and connection pool of the client manager
         self.eclsdk = eclsdk.ConnectionManager(
             cli_options=self.cloud,
             verify=self.verify,
+            client_manager=self.client_manager,
         )
 
     def prepare_to_run_command(self, cmd):
@@ -421,32 +481,56 @@ class ECLClient(app.App):
                 self.client_manager.setup_auth(cmd.required_scope)
             # Trigger the Identity client to initialize
             self.client_manager.auth_ref
+            if self.options.os_name_cache_ttl > 0:
+                utils.configure_name_cache(
+                    NAME_CACHE_FILE, self.options.os_name_cache_ttl,
+                    self.client_manager.cache_scope)
         return
 
     def clean_up(self, cmd, result, err):
         self.log.debug('clean_up %s: %s', cmd.__class__.__name__, err or '')
 
+        if cmd.auth_required and self.client_manager:
+            self.client_manager.update_token_cache()
+        utils.reset_resource_cache()
+        loaded, skipped = utils.pop_lazy_load_counts()
+        if loaded or skipped:
+            self.log.debug('lazy loads: %d done, %d skipped', loaded, skipped)
+
         # Process collected timing data
-        # if self.options.timing:
-            # Get session data
-            # self.timing_data.extend(
-            #     self.client_manager.session.get_timings(),
-            # )
-
-            # Use the Timing pseudo-command to generate the output
-            # tcmd = timing.Timing(self, self.options)
-            # tparser = tcmd.get_parser('Timing')
-
-            # If anything other than prettytable is specified, force csv
-            # format = 'table'
-            # Check the formatter used in the actual command
-            # if hasattr(cmd, 'formatter') \
-            #         and cmd.formatter != cmd._formatter_plugins['table'].obj:
-            #     format = 'csv'
-
-            # sys.stdout.write('\n')
-            # targs = tparser.parse_args(['-f', format])
-            # tcmd.run(targs)
+        if self.client_manager and self.client_manager.http_timings:
+            records = self.client_manager.http_timings.pop()
+            if self.options.timing_file:
+                try:
+                    timing.append_json_lines(
+                        self.options.timing_file, records,
+                        command=getattr(cmd, 'cmd_name', None),
+                        run=self.run_id,
+                        failed=err is not None,
+                    )
+                except (IOError, OSError) as e:
+                    self.log.warning('Unable to write timing to %s: %s',
+                                     self.options.timing_file, e)
+
+            self.timing_data = records
+
+            # The commands of a batch print their own tables, within
+            # their results
+            if self.options.timing and not isinstance(cmd, batch.RunBatch):
+                # Use the Timing pseudo-command to generate the output
+                tcmd = timing.Timing(self, self.options)
+                tparser = tcmd.get_parser('Timing')
+
+                # If anything other than prettytable is specified, force csv
+                format = 'table'
+                # Check the formatter used in the actual command
+                if hasattr(cmd, 'formatter') \
+                        and cmd.formatter != cmd._formatter_plugins['table'].obj:
+                    format = 'csv'
+
+                self.stdout.write('\n')
+                targs = tparser.parse_args(['-f', format])
+                tcmd.run(targs)
 
 
 def main(argv=sys.argv[1:]):
@@ -35,12 +35,9 @@ class ListStorage(command.Lister):
         columns = ['ID', 'Name', 'Description', 'Network ID', 'Volume Type ID', 'Status']
         column_headers = copy.deepcopy(columns)
 
-        data = storage_client.virtual_storages.list(search_opts=search_opts)
-
-        if parsed_args.name is not None:
-            data = utils.filter_list_with_property(data, "name", parsed_args.name)
-        if parsed_args.status is not None:
-            data = utils.filter_list_with_property(data, "status", parsed_args.status)
+        data = utils.filter_by_properties(
+            storage_client.virtual_storages.list(search_opts=search_opts),
+            {'name': parsed_args.name, 'status': parsed_args.status})
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -30,7 +30,15 @@ class ListVolume(command.Lister):
 
     def take_action(self, parsed_args):
         storage_client = self.app.client_manager.storage
+        # The API narrows the listing by these, the substring match of
+        # the former client side filtering is still applied to the rest
+        filters = {
+            'virtual_storage_id': parsed_args.virtual_storage_id,
+            'name': parsed_args.name,
+            'status': parsed_args.status,
+        }
         search_opts = {
+            'virtual_storage_id': parsed_args.virtual_storage_id,
             'display_name': parsed_args.name,
             'status': parsed_args.status,
         }
@@ -39,14 +47,8 @@ class ListVolume(command.Lister):
                    'iops_per_gb', 'initiator_iqns', 'virtual_storage_id',
                    'status']
         column_headers = copy.deepcopy(columns)
-        data = storage_client.volumes.list(search_opts=search_opts)
-
-        if parsed_args.virtual_storage_id is not None:
-            data = utils.filter_list_with_property(data, "virtual_storage_id", parsed_args.virtual_storage_id)
-        if parsed_args.name is not None:
-            data = utils.filter_list_with_property(data, "name", parsed_args.name)
-        if parsed_args.status is not None:
-            data = utils.filter_list_with_property(data, "status", parsed_args.status)
+        data = utils.filter_by_properties(
+            storage_client.volumes.list(search_opts=search_opts), filters)
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -31,10 +31,9 @@ class ListVolumeType(command.Lister):
                    'available_iops_per_gb']
         column_headers = copy.deepcopy(columns)
 
-        data = storage_client.volume_types.list(search_opts=search_opts)
-
-        if parsed_args.name is not None:
-            data = utils.filter_list_with_property(data, "name", parsed_args.name)
+        data = list(utils.filter_by_properties(
+            storage_client.volume_types.list(search_opts=search_opts),
+            {'name': parsed_args.name}))
 
         for vtype in data:
             for key, value in vtype.extra_specs.items():
@@ -7,9 +7,10 @@ except ImportError:
     import simplejson as json
 import json_merge_patch as jmp
 import copy
+import os
 import re
 import six
-from eclcli.common import command, exceptions, utils
+from eclcli.common import cache, command, exceptions, parallel, utils
 from eclcli.i18n import _  # noqa
 
 ROWS_FOR_SHOW = [
@@ -28,10 +29,21 @@ ROWS_FOR_SHOW = [
 ]
 
 
+# Plans rarely change, keep their names for an hour
+PLAN_CACHE_FILE = 'vnf_plans.json'
+PLAN_CACHE_TTL = 3600
+
+
 UUID_PATTERN = '^[a-f0-9]{8}-?[a-f0-9]{4}-?4[a-f0-9]{3}-?[89ab][a-f0-9]{3}-' \
                '?[a-f0-9]{12}$'
 
 
+def _get_plan_names(client):
+    """Return a dict of plan ID to {'name': plan name}"""
+    return dict((plan.id, {'name': plan.name})
+                for plan in client.virtual_network_appliance_plans())
+
+
 class ListVirtualNetworkAppliance(command.Lister):
     _description = _("List virtual network appliances")
 
@@ -57,13 +69,29 @@ class ListVirtualNetworkAppliance(command.Lister):
         ]
         column_headers = copy.deepcopy(columns)
 
-        data = client.virtual_network_appliances()
-        plans = client.virtual_network_appliance_plans()
-        for datum in data:
-            for plan in plans:
-                if datum.virtual_network_appliance_plan_id == plan.id:
-                    setattr(datum, 'virtual_network_appliance_plan', plan.name)
-                    break
+        plan_cache = cache.TTLCache(
+            os.path.join(self.app.cache_dir, PLAN_CACHE_FILE), PLAN_CACHE_TTL)
+        scope = self.app.client_manager.cache_scope
+        plan_names = plan_cache.get(scope)
+        plans = None
+        if plan_names is None:
+            # Fetch the plan catalog while the appliances are listed
+            plans = parallel.prefetch(_get_plan_names, client)
+
+        data = list(client.virtual_network_appliances())
+        plan_ids = set(d.virtual_network_appliance_plan_id for d in data)
+
+        if plans is not None:
+            plan_names = plans.result()
+            plan_cache.set(scope, plan_names)
+        elif not plan_ids.issubset(plan_names):
+            # A plan was added since the catalog was cached
+            plan_names = _get_plan_names(client)
+            plan_cache.set(scope, plan_names)
+
+        data = utils.join_field(
+            data, plan_names, 'virtual_network_appliance_plan_id',
+            'virtual_network_appliance_plan', source_field='name')
 
         return (column_headers,
                 (utils.get_item_properties(
@@ -19,6 +19,7 @@ import copy
 import six
 
 from eclcli.common import command
+from eclcli.common import parallel
 from eclcli.common import utils
 
 
@@ -75,15 +76,24 @@ class DeleteBackup(command.Command):
             nargs="+",
             help="Backup(s) to delete (name or ID)"
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        for backup in parsed_args.backups:
+
+        def _delete(backup):
             backup_id = utils.find_resource(
                 volume_client.backups, backup).id
             volume_client.backups.delete(backup_id)
 
+        parallel.run_each(
+            _delete,
+            parsed_args.backups,
+            parallel=parsed_args.parallel,
+            action='delete backup',
+            log=self.log,
+        )
+
 
 class ListBackup(command.Lister):
     """List backups"""
@@ -121,17 +131,23 @@ class ListBackup(command.Lister):
             columns = ['ID', 'Name', 'Description', 'Status', 'Size']
             column_headers = columns
 
-        # Cache the volume list
+        # Only the long listing shows volume names, fetch the volume list
+        # for them while backups are listed
+        volumes = None
+        if parsed_args.long:
+            volumes = parallel.prefetch(
+                self.app.client_manager.volume.volumes.list)
+
+        data = self.app.client_manager.volume.backups.list()
+
         volume_cache = {}
         try:
-            for s in self.app.client_manager.volume.volumes.list():
-                volume_cache[s.id] = s
+            if volumes is not None:
+                volume_cache = utils.index_by(volumes.result())
         except Exception:
             # Just forget it if there's any trouble
             pass
 
-        data = self.app.client_manager.volume.backups.list()
-
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
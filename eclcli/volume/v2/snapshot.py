@@ -19,6 +19,7 @@ import copy
 import six
 
 from eclcli.common import command
+from eclcli.common import parallel
 from eclcli.common import parseractions
 from eclcli.common import utils
 
@@ -80,15 +81,24 @@ class DeleteSnapshot(command.Command):
             nargs="+",
             help="Snapshot(s) to delete (name or ID)"
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        for snapshot in parsed_args.snapshots:
+
+        def _delete(snapshot):
             snapshot_id = utils.find_resource(
                 volume_client.volume_snapshots, snapshot).id
             volume_client.volume_snapshots.delete(snapshot_id)
 
+        parallel.run_each(
+            _delete,
+            parsed_args.snapshots,
+            parallel=parsed_args.parallel,
+            action='delete snapshot',
+            log=self.log,
+        )
+
 
 class ListSnapshot(command.Lister):
     """List snapshots"""
@@ -133,14 +143,12 @@ class ListSnapshot(command.Lister):
             columns = ['ID', 'Name', 'Description', 'Status', 'Size']
             column_headers = copy.deepcopy(columns)
 
-        # Cache the volume list
-        volume_cache = {}
-        try:
-            for s in self.app.client_manager.volume.volumes.list():
-                volume_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        # Only the long listing shows volume names, fetch the volume list
+        # for them while snapshots are listed
+        volumes = None
+        if parsed_args.long:
+            volumes = parallel.prefetch(
+                self.app.client_manager.volume.volumes.list)
 
         search_opts = {
             'all_tenants': parsed_args.all_projects,
@@ -148,6 +156,14 @@ class ListSnapshot(command.Lister):
 
         data = self.app.client_manager.volume.volume_snapshots.list(
             search_opts=search_opts)
+
+        volume_cache = {}
+        try:
+            if volumes is not None:
+                volume_cache = utils.index_by(volumes.result())
+        except Exception:
+            # Just forget it if there's any trouble
+            pass
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
@@ -19,6 +19,7 @@ import copy
 import six
 
 from eclcli.common import command
+from eclcli.common import parallel
 from eclcli.common import parseractions
 from eclcli.common import utils
 from eclcli.identity import common as identity_common
@@ -131,11 +132,12 @@ class DeleteVolume(command.Command):
             help="Attempt forced removal of volume(s), regardless of state "
                  "(defaults to False)"
         )
-        return parser
+        return parallel.add_parallel_option(parser)
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
-        for volume in parsed_args.volumes:
+
+        def _delete(volume):
             volume_obj = utils.find_resource(
                 volume_client.volumes, volume)
             if parsed_args.force:
@@ -143,6 +145,14 @@ class DeleteVolume(command.Command):
             else:
                 volume_client.volumes.delete(volume_obj.id)
 
+        parallel.run_each(
+            _delete,
+            parsed_args.volumes,
+            parallel=parsed_args.parallel,
+            action='delete volume',
+            log=self.log,
+        )
+
 
 class ListVolume(command.Lister):
     """List volumes"""
@@ -183,6 +193,14 @@ class ListVolume(command.Lister):
             default=False,
             help='List additional fields in output',
         )
+        parser.add_argument(
+            '--no-name-lookup',
+            dest='name_lookup',
+            action='store_false',
+            default=True,
+            help='Show the IDs of the servers volumes are attached to '
+                 'instead of looking up their names',
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -235,15 +253,6 @@ class ListVolume(command.Lister):
             column_headers[1] = 'Display Name'
             column_headers[4] = 'Attached to'
 
-        # Cache the server list
-        server_cache = {}
-        try:
-            for s in compute_client.servers.list():
-                server_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-
         project_id = None
         if parsed_args.project:
             project_id = identity_common.find_project(
@@ -267,6 +276,18 @@ class ListVolume(command.Lister):
 
         data = volume_client.volumes.list(search_opts=search_opts)
 
+        # Look up only the servers volumes are attached to, concurrently;
+        # a server we cannot get is shown by ID
+        server_cache = {}
+        if parsed_args.name_lookup:
+            server_ids = [attachment['server_id']
+                          for volume in data
+                          for attachment in getattr(volume, 'attachments',
+                                                    None) or []
+                          if attachment.get('server_id')]
+            server_cache = parallel.lookup_each(
+                compute_client.servers.get, server_ids, log=self.log)
+
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
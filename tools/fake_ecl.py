@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Serve a fake ECL endpoint from recorded JSON fixtures
+
+Keystone v3 is emulated: any password is accepted and the token comes
+with a service catalog pointing every service back to this server, under
+the paths in SERVICES. Other requests are answered from fixture files,
+each a JSON list of interactions:
+
+    [{"request": {"method": "GET", "path": "/network/v2.0/ports",
+                  "query": {"limit": "10"}},
+      "response": {"status": 200, "body": {"ports": []}}}]
+
+A request matches an interaction with the same method and path whose
+query parameters are all present in the request; the most specific one
+wins. Unmatched requests get a 404 and are listed in ``unmatched``.
+Every token issued is counted in ``token_requests``.
+
+With --record the requests are forwarded to a real cloud instead, the
+token and catalog are rewritten to keep clients talking to this server,
+and every answer is saved as a fixture with the real project ID replaced
+by PROJECT_ID.
+
+    $ python tools/fake_ecl.py tools/fixtures/*.json --port 8080
+    $ python tools/fake_ecl.py --record https://keystone-jp1-ecl.api.ntt.com/v3 \\
+          --output recorded.json --port 8080
+    $ export OS_AUTH_URL=http://127.0.0.1:8080/identity/v3
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import sys
+import threading
+import time
+
+import requests
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urlparse
+
+
+LOG = logging.getLogger(__name__)
+
+PROJECT_ID = 'fakeproject'
+USER_ID = 'fakeuser'
+TOKEN = 'faketoken'
+
+# Service type to the path of its endpoint on this server
+SERVICES = {
+    'identity': '/identity/v3',
+    'compute': '/compute/v2/%(project_id)s',
+    'network': '/network',
+    'image': '/image',
+    'storage': '/storage',
+    'volumev2': '/volume/v2/%(project_id)s',
+    'managed-load-balancer': '/mlb',
+    'dns': '/dns',
+    'telemetry': '/telemetry',
+}
+
+
+def load_fixtures(paths):
+    interactions = []
+    for path in paths:
+        with open(path) as f:
+            interactions.extend(json.load(f))
+    return interactions
+
+
+def _query_dict(query):
+    return dict((k, v[-1]) for k, v in urlparse.parse_qs(
+        query, keep_blank_values=True).items())
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, fmt, *args):
+        LOG.debug(fmt, *args)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status, body, headers=None):
+        if body is None:
+            data = b''
+        elif isinstance(body, bytes):
+            data = body
+        else:
+            data = json.dumps(body).encode('utf-8')
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', 'application/json')
+        headers['Content-Length'] = str(len(data))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        # Counted before answering, the client may be done right after
+        self.server.count(
+            self.path, len(self.raw_requestline) + len(str(self.headers)) +
+            self.request_bytes, len(data))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(data)
+
+    def _handle(self):
+        body = self._read_body()
+        self.request_bytes = len(body)
+        url = urlparse.urlparse(self.path)
+        if url.path.rstrip('/').startswith(SERVICES['identity']):
+            return self._identity(url, body)
+        if self.server.upstream is not None:
+            return self._forward(url, body)
+
+        interaction = self.server.match(
+            self.command, url.path, _query_dict(url.query))
+        if interaction is None:
+            self.server.unmatched.append('%s %s' % (self.command, self.path))
+            return self._send(404, {'itemNotFound': {
+                'code': 404, 'message': 'No fixture for %s' % url.path}})
+        response = interaction['response']
+        self._send(response.get('status', 200), response.get('body'),
+                   response.get('headers'))
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _handle
+
+    def _identity(self, url, body):
+        base = self.server.url + SERVICES['identity']
+        if url.path.rstrip('/') == SERVICES['identity']:
+            return self._send(200, {'version': {
+                'id': 'v3.4', 'status': 'stable',
+                'updated': '2015-03-30T00:00:00Z',
+                'links': [{'rel': 'self', 'href': base + '/'}],
+                'media-types': [{
+                    'base': 'application/json',
+                    'type': 'application/vnd.openstack.identity-v3+json'}],
+            }})
+        if url.path.endswith('/auth/tokens') and self.command == 'POST':
+            self.server.count_token()
+            if self.server.upstream is not None:
+                return self._record_token(body)
+            return self._send(201, self.server.token_body(),
+                              {'X-Subject-Token': TOKEN})
+        self._send(404, {'error': {'code': 404, 'message': url.path}})
+
+    def _record_token(self, body):
+        upstream = self.server.upstream
+        resp = requests.post(upstream['auth_url'] + '/auth/tokens', data=body,
+                             headers={'Content-Type': 'application/json'})
+        if resp.status_code >= 400:
+            return self._send(resp.status_code, resp.content)
+        token = resp.json()
+        upstream['token'] = resp.headers['X-Subject-Token']
+        upstream['project_id'] = token['token'].get('project', {}).get('id')
+        for service in token['token'].get('catalog', []):
+            for endpoint in service['endpoints']:
+                local = self.server.url + '/_/' + service['type']
+                upstream['endpoints'][service['type']] = endpoint['url']
+                endpoint['url'] = local
+        self._send(201, token, {'X-Subject-Token': TOKEN})
+
+    def _forward(self, url, body):
+        upstream = self.server.upstream
+        parts = url.path.split('/', 3)
+        if len(parts) < 3 or parts[1] != '_' or \
+                parts[2] not in upstream['endpoints']:
+            return self._send(404, {'error': url.path})
+        target = upstream['endpoints'][parts[2]].rstrip('/')
+        path = '/' + (parts[3] if len(parts) > 3 else '')
+        headers = dict((k, v) for k, v in self.headers.items()
+                       if k.lower() not in ('host', 'content-length'))
+        headers['X-Auth-Token'] = upstream['token']
+        resp = requests.request(self.command, target + path,
+                                params=url.query, data=body or None,
+                                headers=headers)
+        try:
+            resp_body = resp.json() if resp.content else None
+        except ValueError:
+            resp_body = None
+        self.server.record(self.command, parts[2], path, url.query,
+                           resp.status_code, resp_body)
+        self._send(resp.status_code, resp.content,
+                   {'Content-Type': resp.headers.get(
+                       'Content-Type', 'application/json')})
+
+
+class FakeECL(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """A fake ECL endpoint on 127.0.0.1
+
+    :param interactions: fixtures, see load_fixtures()
+    :param latency: seconds added to every response
+    :param record_url: Keystone v3 URL of a cloud to record from
+    """
+
+    daemon_threads = True
+
+    def __init__(self, interactions=(), latency=0.0, record_url=None,
+                 port=0):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', port), Handler)
+        self.url = 'http://127.0.0.1:%d' % self.server_address[1]
+        self.interactions = list(interactions)
+        self.latency = latency
+        self.upstream = None
+        if record_url:
+            self.upstream = {'auth_url': record_url.rstrip('/'),
+                             'endpoints': {}}
+        self.recorded = []
+        self.lock = threading.Lock()
+        self._thread = None
+        self.reset()
+
+    def reset(self):
+        """Reset the request and byte counters"""
+        self.requests = 0
+        self.auth_requests = 0
+        self.token_requests = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.unmatched = []
+
+    def count(self, path, bytes_in, bytes_out):
+        with self.lock:
+            # Keystone is counted apart, its version discovery is cached
+            # by keystoneauth for the life of the process
+            if path.startswith(SERVICES['identity']):
+                self.auth_requests += 1
+            else:
+                self.requests += 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+
+    def count_token(self):
+        with self.lock:
+            self.token_requests += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def match(self, method, path, query):
+        best = None
+        for interaction in self.interactions:
+            request = interaction['request']
+            if request.get('method', 'GET') != method or \
+                    request['path'] != path:
+                continue
+            wanted = request.get('query') or {}
+            if any(query.get(k) != v for k, v in wanted.items()):
+                continue
+            if best is None or len(wanted) > len(
+                    best['request'].get('query') or {}):
+                best = interaction
+        return best
+
+    def token_body(self):
+        now = datetime.datetime.utcnow()
+        expires = now + datetime.timedelta(hours=1)
+        catalog = []
+        for service_type, path in sorted(SERVICES.items()):
+            url = self.url + path % {'project_id': PROJECT_ID}
+            catalog.append({
+                'type': service_type,
+                'name': service_type,
+                'id': service_type,
+                'endpoints': [{
+                    'id': '%s-%s' % (service_type, interface),
+                    'interface': interface,
+                    'region': 'RegionOne',
+                    'region_id': 'RegionOne',
+                    'url': url,
+                } for interface in ('public', 'internal', 'admin')],
+            })
+        return {'token': {
+            'methods': ['password'],
+            'expires_at': expires.strftime('%Y-%m-%dT%H:%M:%S.000000Z'),
+            'issued_at': now.strftime('%Y-%m-%dT%H:%M:%S.000000Z'),
+            'user': {'id': USER_ID, 'name': 'user',
+                     'domain': {'id': 'default', 'name': 'Default'}},
+            'project': {'id': PROJECT_ID, 'name': 'project',
+                        'domain': {'id': 'default', 'name': 'Default'}},
+            'roles': [{'id': 'admin', 'name': 'admin'}],
+            'catalog': catalog,
+        }}
+
+    def record(self, method, service_type, path, query, status, body):
+        project_id = self.upstream.get('project_id')
+        base = SERVICES.get(service_type, '/' + service_type) % {
+            'project_id': PROJECT_ID}
+        text = json.dumps(body)
+        if project_id:
+            path = path.replace(project_id, PROJECT_ID)
+            text = text.replace(project_id, PROJECT_ID)
+        interaction = {
+            'request': {'method': method, 'path': base + path},
+            'response': {'status': status, 'body': json.loads(text)},
+        }
+        if query:
+            interaction['request']['query'] = _query_dict(query)
+        with self.lock:
+            self.recorded.append(interaction)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('fixtures', nargs='*', help='Fixture files')
+    parser.add_argument('--port', type=int, default=8080,
+                        help='Port to listen on (default: 8080)')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Milliseconds added to every response')
+    parser.add_argument('--record', metavar='<auth-url>',
+                        help='Keystone v3 URL of the cloud to record from')
+    parser.add_argument('--output', default='recorded.json',
+                        help='Fixture file written by --record')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = FakeECL(load_fixtures(args.fixtures), args.latency / 1000.0,
+                     args.record, args.port)
+    print('export OS_AUTH_URL=%s%s' % (server.url, SERVICES['identity']))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.record:
+            with open(args.output, 'w') as f:
+                json.dump(server.recorded, f, indent=2, sort_keys=True)
+        for request in server.unmatched:
+            print('unmatched: %s' % request)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
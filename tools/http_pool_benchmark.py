@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Compare the ClientManager HTTP session with a plain requests Session
+
+Starts a local HTTPS stub of the network API and drives the network
+client the way the CLI builds it, a SessionClient over the keystoneauth
+session of the ClientManager. Ports are listed page by page and then
+shown in --bursts rounds of --parallel requests, as a multi-target
+delete followed by its --wait polls does. Two transports run under that
+session: a plain requests Session, which is what the ClientManager used
+before (10 connections per pool, no retries), and
+session.make_http_session(). Connections beyond the pool size are closed
+when a round ends and opened again by the next one. The "late" scenario
+starts listening only after --late milliseconds, to exercise the
+connection retries. A self-signed certificate is generated with openssl
+unless --cert and --key are given.
+
+    $ python tools/http_pool_benchmark.py
+    $ python tools/http_pool_benchmark.py --bursts 10 --parallel 32
+"""
+
+import argparse
+from concurrent import futures
+import json
+import logging
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from keystoneauth1 import token_endpoint
+import requests
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse as urlparse
+
+from eclcli.common import session
+from eclcli.network.networkclient.v2 import client as network_client
+
+
+PAGE_SIZE = 10
+
+
+class StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, Nagle would hold the body
+    # back until the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        query = urlparse.parse_qs(url.query)
+        if url.path.startswith('/v2.0/ports/'):
+            body = {'port': {'id': url.path.rsplit('/', 1)[-1]}}
+            # Long enough for the concurrent requests to overlap
+            time.sleep(self.server.delay)
+        else:
+            page = int(query.get('page', ['0'])[0])
+            body = {'ports': [{'id': 'port-%d-%d' % (page, i)}
+                              for i in range(PAGE_SIZE)]}
+            if page + 1 < self.server.pages:
+                body['ports_links'] = [{
+                    'rel': 'next',
+                    'href': '%s?page=%d' % (url.path, page + 1),
+                }]
+        data = json.dumps(body).encode('utf-8')
+        with self.server.lock:
+            self.server.requests += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, context, pages, delay):
+        # Bound but not listening yet, connections are refused until
+        # start() is called
+        BaseHTTPServer.HTTPServer.__init__(
+            self, ('127.0.0.1', 0), StubHandler, bind_and_activate=False)
+        self.server_bind()
+        self.context = context
+        self.pages = pages
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.handshakes = 0
+
+    @property
+    def url(self):
+        return 'https://127.0.0.1:%d' % self.server_address[1]
+
+    def start(self, after=0.0):
+        def serve():
+            time.sleep(after)
+            self.server_activate()
+            self.serve_forever()
+        thread = threading.Thread(target=serve)
+        thread.daemon = True
+        thread.start()
+
+    def get_request(self):
+        sock, addr = self.socket.accept()
+        # Every accepted connection costs one full TLS handshake
+        with self.lock:
+            self.handshakes += 1
+        return self.context.wrap_socket(sock, server_side=True), addr
+
+
+def make_certificate(tmpdir):
+    cert = os.path.join(tmpdir, 'cert.pem')
+    key = os.path.join(tmpdir, 'key.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+         '-subj', '/CN=127.0.0.1', '-days', '1',
+         '-keyout', key, '-out', cert],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return cert, key
+
+
+def run_command(server, http_session, parallel, bursts):
+    """List and show ports as the CLI does, return the failed requests"""
+    # The same stack as ClientManager.session and network make_client()
+    auth = token_endpoint.Token(server.url, 'benchmark')
+    client = network_client.Client(session=session.TimingSession(
+        auth=auth, session=http_session, verify=False))
+    ports = []
+    try:
+        for page in client.list_ports(retrieve_all=False, limit=PAGE_SIZE):
+            ports.extend(p['id'] for p in page['ports'])
+    except Exception:
+        return 1
+
+    def show(port_id):
+        try:
+            client.show_port(port_id)
+            return 0
+        except Exception:
+            return 1
+
+    failed = 0
+    with futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+        for burst in range(bursts):
+            batch = ports[burst * parallel:(burst + 1) * parallel]
+            failed += sum(executor.map(show, batch))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=20,
+                        help='Pages of ports to list (default: 20)')
+    parser.add_argument('--parallel', type=int, default=16,
+                        help='Concurrent show requests (default: 16)')
+    parser.add_argument('--bursts', type=int, default=4,
+                        help='Rounds of concurrent shows (default: 4)')
+    parser.add_argument('--delay', type=float, default=20,
+                        help='Milliseconds taken by each show (default: 20)')
+    parser.add_argument('--late', type=float, default=500,
+                        help='Milliseconds before the stub listens in the '
+                             'late scenario (default: 500)')
+    parser.add_argument('--cert', help='Server certificate (PEM)')
+    parser.add_argument('--key', help='Server private key (PEM)')
+    args = parser.parse_args()
+
+    # The network client logs every request at debug level on import
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        cert, key = args.cert, args.key
+        if not (cert and key):
+            cert, key = make_certificate(tmpdir)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+
+        # Silence the warnings about the self-signed certificate
+        requests.packages.urllib3.disable_warnings()
+
+        print('%-10s %-10s %10s %12s %8s %10s' % (
+            'Scenario', 'Transport', 'Requests', 'Handshakes', 'Failed',
+            'Seconds'))
+        for scenario, late in (('steady', 0.0), ('late', args.late)):
+            for name, make_session in (
+                    ('requests', requests.Session),
+                    ('pooled', session.make_http_session)):
+                server = StubServer(context, args.pages, args.delay / 1000.0)
+                server.start(after=late / 1000.0)
+                start = time.time()
+                failed = run_command(server, make_session(), args.parallel,
+                                     args.bursts)
+                elapsed = time.time() - start
+                print('%-10s %-10s %10d %12d %8d %10.3f' % (
+                    scenario, name, server.requests, server.handshakes,
+                    failed, elapsed))
+                server.shutdown()
+                server.server_close()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Run ecl commands against the fake endpoint and check their cost
+
+Every scenario runs one command in this process, the way the ecl entry
+point does, against tools/fake_ecl.py serving tools/fixtures. For each
+one the number of HTTP requests, the bytes sent and received, the wall
+time and the peak RSS are reported. Requests to Keystone are left out
+of the count, keystoneauth caches its version discovery per process.
+The run fails when a command fails, makes a request no fixture answers,
+makes more requests than recorded in the baseline file, or does not take
+exactly one token from Keystone: the shared-auth scenario runs a legacy
+client command and an eclsdk command in one batch, sharing the token.
+
+    $ python tools/perf_harness.py
+    $ python tools/perf_harness.py --latency 50 --repeat 3
+    $ python tools/perf_harness.py --update-baseline
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import fake_ecl
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+FIXTURES = os.path.join(HERE, 'fixtures')
+BASELINE = os.path.join(HERE, 'perf_baseline.json')
+
+# Name, command line and fixture files of each scenario
+SCENARIOS = [
+    ('server-list', ['compute', 'server', 'list'], ['compute.json']),
+    ('flavor-list', ['compute', 'flavor', 'list'], ['compute.json']),
+    ('port-list', ['network', 'port', 'list'], ['network.json']),
+    ('port-list-paged', ['network', 'port', 'list', '--page-size', '2'],
+     ['network.json']),
+    ('image-list', ['image', 'list'], ['image.json']),
+    ('storage-volume-list', ['storage', 'volume', 'list'], ['storage.json']),
+    ('mlb-load-balancer-list', ['mlb', 'load-balancer', 'list'],
+     ['mlb.json']),
+    ('dns-recordset-list-all',
+     ['dns', 'recordset', 'list', '9d1c2b3a-0000-4000-8000-00000000aaaa',
+      '--all', '--limit', '2'], ['dns.json']),
+    ('shared-auth',
+     ['batch', os.path.join(FIXTURES, 'shared-auth.batch')],
+     ['compute.json', 'mlb.json']),
+]
+
+
+def _reset_peak_rss():
+    # Writing 5 to clear_refs resets the VmHWM of the process (Linux 4.0+)
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except (IOError, OSError):
+        return False
+
+
+def _peak_rss_kib(reset):
+    if reset:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    # Peak of the whole process, in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def run_command(shell, server, argv):
+    """Run argv in this process, return its result and measurements"""
+    env = {
+        'OS_AUTH_URL': server.url + fake_ecl.SERVICES['identity'],
+        'OS_USERNAME': 'user',
+        'OS_PASSWORD': 'password',
+        'OS_TENANT_ID': fake_ecl.PROJECT_ID,
+        'OS_USER_DOMAIN_ID': 'default',
+        'OS_PROJECT_DOMAIN_ID': 'default',
+        'OS_REGION_NAME': 'RegionOne',
+    }
+    os.environ.update(env)
+    server.reset()
+    reset = _reset_peak_rss()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = output = io.StringIO()
+    start = time.time()
+    try:
+        result = shell.main(['--no-token-cache'] + argv)
+    finally:
+        elapsed = time.time() - start
+        sys.stdout, sys.stderr = stdout, stderr
+    return {
+        'result': result,
+        'output': output.getvalue(),
+        'requests': server.requests,
+        'tokens': server.token_requests,
+        'bytes': server.bytes_in + server.bytes_out,
+        'seconds': elapsed,
+        'rss_kib': _peak_rss_kib(reset),
+        'unmatched': list(server.unmatched),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scenario', nargs='*',
+                        help='Scenarios to run (default: all)')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Milliseconds added to every response')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per scenario, the fastest is reported')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='Request counts to compare with')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Save the request counts as the new baseline')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show the output of failed commands')
+    args = parser.parse_args()
+
+    scenarios = [s for s in SCENARIOS
+                 if not args.scenario or s[0] in args.scenario]
+
+    # Keep the caches and configuration of the user out of the runs; the
+    # directories are read when eclcli.shell is imported
+    home = tempfile.mkdtemp()
+    os.environ['XDG_CACHE_HOME'] = os.path.join(home, 'cache')
+    os.environ['XDG_CONFIG_HOME'] = os.path.join(home, 'config')
+    for name in list(os.environ):
+        if name.startswith('OS_'):
+            del os.environ[name]
+    from eclcli import shell
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = []
+    counts = {}
+    print('%-24s %9s %9s %10s %9s %8s' % (
+        'Scenario', 'Requests', 'Baseline', 'KiB', 'Seconds', 'RSS MiB'))
+    try:
+        for name, argv, fixtures in scenarios:
+            server = fake_ecl.FakeECL(
+                fake_ecl.load_fixtures(
+                    [os.path.join(FIXTURES, f) for f in fixtures]),
+                latency=args.latency / 1000.0).start()
+            try:
+                runs = [run_command(shell, server, argv)
+                        for _ in range(max(1, args.repeat))]
+            finally:
+                server.stop()
+                # Commands may leave handlers behind, keep the output quiet
+                logging.getLogger().handlers[:] = []
+            run = min(runs, key=lambda r: r['seconds'])
+            counts[name] = run['requests']
+            expected = baseline.get(name)
+            print('%-24s %9d %9s %10.1f %9.3f %8.1f' % (
+                name, run['requests'], expected if expected else '-',
+                run['bytes'] / 1024.0, run['seconds'],
+                run['rss_kib'] / 1024.0))
+            if run['result']:
+                failures.append('%s: exit code %s' % (name, run['result']))
+                if args.verbose:
+                    print(run['output'])
+            for request in run['unmatched']:
+                failures.append('%s: no fixture for %s' % (name, request))
+            if run['tokens'] != 1:
+                failures.append('%s: %d token requests, expected 1' % (
+                    name, run['tokens']))
+            if expected is not None and run['requests'] > expected:
+                failures.append('%s: %d requests, baseline %d' % (
+                    name, run['requests'], expected))
+    finally:
+        shutil.rmtree(home)
+
+    if args.update_baseline:
+        baseline.update(counts)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+    for failure in failures:
+        print('FAILED %s' % failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Measure ecl startup cost
+
+Runs each command in a fresh interpreter and reports the wall time and the
+number of modules imported when the process exits. Commands that need
+credentials (such as ``compute server list``) are still useful without
+them: the run stops at authentication, after command resolution.
+
+    $ python tools/startup_benchmark.py
+    $ python tools/startup_benchmark.py --repeat 10 -- network port list
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+
+DEFAULT_COMMANDS = [
+    ['--version'],
+    ['help'],
+    ['compute', 'server', 'list'],
+]
+
+CHILD = '''
+import atexit, json, sys
+def report():
+    sys.__stderr__.write('\\nBENCH %s\\n' % json.dumps(
+        {'modules': len(sys.modules)}))
+atexit.register(report)
+from eclcli import shell
+sys.exit(shell.main(sys.argv[1:]))
+'''
+
+
+def run_once(argv):
+    start = time.time()
+    proc = subprocess.Popen(
+        [sys.executable, '-c', CHILD] + argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    _, err = proc.communicate()
+    elapsed = time.time() - start
+    modules = None
+    for line in err.splitlines():
+        if line.startswith('BENCH '):
+            modules = json.loads(line[6:])['modules']
+    return elapsed, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Runs per command, the best one is reported')
+    parser.add_argument('command', nargs='*',
+                        help='Command to measure instead of the defaults')
+    args = parser.parse_args()
+
+    commands = [args.command] if args.command else DEFAULT_COMMANDS
+    print('%-30s %10s %10s' % ('Command', 'Seconds', 'Modules'))
+    for argv in commands:
+        runs = [run_once(argv) for _ in range(args.repeat)]
+        elapsed, modules = min(runs)
+        print('%-30s %10.3f %10s' % (' '.join(argv), elapsed, modules))
+
+
+if __name__ == '__main__':
+    main()